@@ -21,6 +21,10 @@ import json
 from datetime import datetime
 import hashlib
 
+from sampling import measure
+from hamiltonians import ground_energy
+from pes import hamiltonian_at
+
 # AlphaNova Quantum Configuration
 st.set_page_config(
     page_title="AlphaNova Quantum | Advanced Research Platform",
@@ -571,14 +575,10 @@ def bell_states():
         'Ψ-': np.array([0, 1, -1, 0]) / np.sqrt(2)
     }
 
-def vqe_h2_hamiltonian():
-    """AlphaNova Quantum VQE H2 molecule Hamiltonian"""
-    I = np.eye(2)
-    X = pauli_matrices()['X']
-    Z = pauli_matrices()['Z']
-    
-    # H2 Hamiltonian coefficients
-    return -1.0523 * np.kron(I, I) + 0.3979 * np.kron(Z, Z) + 0.3979 * np.kron(X, X)
+def vqe_h2_hamiltonian(bond_length=0.735):
+    """AlphaNova Quantum VQE H2 molecule Hamiltonian (Pauli-string form)"""
+    # H2 Hamiltonian coefficients (STO-3G table, interpolated to the bond length)
+    return hamiltonian_at('H2', bond_length)
 
 # COMPREHENSIVE SIDEBAR NAVIGATION - QUANTUM RESEARCH PLATFORM
 with st.sidebar:
@@ -827,7 +827,7 @@ elif section_id == "quantum_foundations":
             prob_1 = abs(beta_sim)**2
             
             if st.button("Perform Measurement", key="measurement_btn"):
-                outcome = np.random.choice([0, 1], p=[prob_0, prob_1])
+                outcome = measure([prob_0, prob_1])
                 st.success(f"Measurement result: |{outcome}⟩")
                 if outcome == 0:
                     st.info("State collapsed to |0⟩")
@@ -2004,6 +2004,7 @@ elif module_id == "vqe":
     with col1:
         ansatz_depth = st.slider("Ansatz Depth", 1, 5, 2, help="Number of parameterized circuit layers")
         optimizer = st.selectbox("Optimizer", ["COBYLA", "SPSA", "Powell"], help="Classical optimization method")
+        bond_length = st.slider("Bond Length (Å)", 0.3, 2.75, 0.735, 0.005, help="H-H distance")
     
     with col2:
         max_iterations = st.slider("Max Iterations", 10, 100, 50)
@@ -2013,8 +2014,8 @@ elif module_id == "vqe":
     if st.button("Run VQE Optimization", type="primary"):
         with st.spinner("Running VQE optimization..."):
             # Simulate VQE optimization
-            h2_hamiltonian = vqe_h2_hamiltonian()
-            exact_energy = np.min(np.linalg.eigvals(h2_hamiltonian)).real
+            h2_hamiltonian = vqe_h2_hamiltonian(bond_length)
+            exact_energy = ground_energy(h2_hamiltonian)
             
             # Mock optimization trajectory
             iterations = np.arange(max_iterations)
@@ -8,6 +8,7 @@ from plotly.subplots import make_subplots
 import json
 import os
 from datetime import datetime
+from figure_optimizer import optimize_plotly_charts
 
 # Page configuration - AlphaNova Quantum Branding
 st.set_page_config(
@@ -26,6 +27,9 @@ st.set_page_config(
     }
 )
 
+# Merge same-style decorative traces before every figure is sent to the browser
+optimize_plotly_charts()
+
 # Initialize session state for the platform
 if 'language' not in st.session_state:
     st.session_state.language = 'en'
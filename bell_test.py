@@ -0,0 +1,150 @@
+"""
+Bell-Test Engine
+Two-qubit correlators E(a, b) for spin measurements in the x–z plane, CHSH
+landscapes over full grids of measurement angles, and finite-shot Bell-test
+sampling. Everything is computed from the state's 3×3 correlation tensor, so
+whole angle grids and stacks of states reduce to a few matrix products.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from entanglement import as_density_batch, density_matrices
+
+
+PAULIS = np.array([
+    [[0, 1], [1, 0]],
+    [[0, -1j], [1j, 0]],
+    [[1, 0], [0, -1]],
+], dtype=complex)
+
+TSIRELSON_BOUND = 2 * np.sqrt(2)
+
+
+# ============================================================================
+# CORRELATORS
+# ============================================================================
+
+def correlation_tensor(rho):
+    """T_ij = Tr[ρ σ_i ⊗ σ_j] for (batch of) two-qubit density matrices; i, j ∈ {x, y, z}."""
+    rho, n, single = as_density_batch(rho)
+    if n != 2:
+        raise ValueError("Bell tests are defined for two-qubit states")
+    tensor = rho.reshape(-1, 2, 2, 2, 2)
+    T = np.einsum('iab,jcd,zbdac->zij', PAULIS, PAULIS, tensor).real
+    return T[0] if single else T
+
+
+def measurement_directions(angles):
+    """Unit Bloch vectors (sin θ, 0, cos θ) for measurements at angle θ from z in the x–z plane."""
+    angles = np.asarray(angles, dtype=float)
+    return np.stack([np.sin(angles), np.zeros_like(angles), np.cos(angles)], axis=-1)
+
+
+def correlator_grid(rho, angles_a, angles_b):
+    """E(a, b) = aᵀ T b for every pair of Alice and Bob angles: (len(a), len(b)) per state."""
+    T = correlation_tensor(rho)
+    return measurement_directions(angles_a) @ T @ measurement_directions(angles_b).T
+
+
+def chsh_value(T, a, a_prime, b, b_prime):
+    """S = E(a,b) + E(a,b') + E(a',b) − E(a',b'); angles broadcast against each other."""
+    A, A2 = measurement_directions(a), measurement_directions(a_prime)
+    B, B2 = measurement_directions(b), measurement_directions(b_prime)
+
+    def E(u, v):
+        return np.einsum('...i,ij,...j->...', u, T, v)
+
+    return E(A, B) + E(A, B2) + E(A2, B) - E(A2, B2)
+
+
+def chsh_landscape(rho, n_grid=181):
+    """CHSH value over Alice's second setting α and Bob's setting β, with a = 0 and b' = β − α.
+
+    This slice contains the Tsirelson-optimal settings (α, β) = (π/2, π/4).
+    Returns (alphas, betas, S) with S of shape (n_grid, n_grid), rows indexed by β.
+    """
+    T = correlation_tensor(rho)
+    alphas = np.linspace(0, np.pi, n_grid)
+    betas = np.linspace(-np.pi, np.pi, n_grid)
+    alpha, beta = np.meshgrid(alphas, betas)
+    S = chsh_value(T, np.zeros_like(alpha), alpha, beta, beta - alpha)
+    return alphas, betas, S
+
+
+def optimal_chsh(rho):
+    """Horodecki maximal CHSH value 2√(t₁² + t₂²) over all settings, from the two largest
+    singular values of the correlation tensor."""
+    singular = np.linalg.svd(correlation_tensor(rho), compute_uv=False)
+    return 2 * np.sqrt(singular[..., 0]**2 + singular[..., 1]**2)
+
+
+# ============================================================================
+# FINITE-SHOT SAMPLING
+# ============================================================================
+
+def sample_correlators(E, shots, repetitions=1, seed=None):
+    """Estimate correlators from shots ±1 outcome pairs per setting via binomial draws.
+
+    Each shot agrees (product +1) with probability (1 + E)/2, so the number of
+    agreements is one binomial draw per setting and repetition, whatever the shot count.
+    Returns an array of shape (repetitions,) + E.shape.
+    """
+    rng = np.random.default_rng(seed)
+    E = np.asarray(E, dtype=float)
+    p_agree = np.clip((1 + E) / 2, 0.0, 1.0)
+    agreements = rng.binomial(shots, p_agree, size=(repetitions,) + E.shape)
+    return 2 * agreements / shots - 1
+
+
+def sample_chsh(rho, shots, repetitions=1, settings=(0.0, np.pi / 2, np.pi / 4, -np.pi / 4), seed=None):
+    """Finite-shot CHSH estimates; shots are spent per setting pair. Returns (S estimates, exact S)."""
+    a, a_prime, b, b_prime = settings
+    E = correlator_grid(rho, [a, a_prime], [b, b_prime])
+    signs = np.array([[1, 1], [1, -1]])
+    estimates = sample_correlators(E, shots, repetitions, seed)
+    return np.sum(estimates * signs, axis=(-2, -1)), float(np.sum(E * signs))
+
+
+def werner_state(visibility, state=None):
+    """ρ = v|ψ⟩⟨ψ| + (1 − v) I/4 for one visibility or an array of them (default |Φ⁺⟩)."""
+    if state is None:
+        state = np.array([1, 0, 0, 1]) / np.sqrt(2)
+    v = np.asarray(visibility, dtype=float)
+    return v[..., None, None] * density_matrices(state) + (1 - v)[..., None, None] * np.eye(4) / 4
+
+
+# ============================================================================
+# FIGURES
+# ============================================================================
+
+def chsh_landscape_figure(alphas, betas, S, title="CHSH Landscape"):
+    """Heatmap of S(α, β) with the local-realism contours |S| = 2 and the optimum marked."""
+    fig = go.Figure()
+    fig.add_trace(go.Heatmap(
+        x=np.degrees(alphas), y=np.degrees(betas), z=S,
+        colorscale='RdBu', zmid=0, zmin=-TSIRELSON_BOUND, zmax=TSIRELSON_BOUND,
+        colorbar=dict(title='S'),
+        hovertemplate="α' = %{x:.1f}°<br>β = %{y:.1f}°<br>S = %{z:.3f}<extra></extra>"
+    ))
+    for level in (-2, 2):
+        fig.add_trace(go.Contour(
+            x=np.degrees(alphas), y=np.degrees(betas), z=S,
+            contours=dict(start=level, end=level, size=1, coloring='none'),
+            line=dict(color='#39FF14', width=2, dash='dash'),
+            showscale=False, hoverinfo='skip', showlegend=False
+        ))
+    fig.add_trace(go.Scatter(
+        x=[90], y=[45], mode='markers', name='Tsirelson settings',
+        marker=dict(color='#FFD700', size=12, symbol='star')
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title="Alice's second angle α' (degrees)",
+        yaxis_title="Bob's angle β (degrees), b' = β − α'",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        height=500
+    )
+    return fig
@@ -0,0 +1,549 @@
+"""
+Engine Micro-Benchmark Suite
+Times the numerical kernels and figure builders behind the Streamlit pages,
+parametrized by qubit count and sample size, and compares each run against a
+stored baseline so performance regressions are caught before deployment.
+
+Page functions that live inside the Streamlit scripts (Bloch sphere builder,
+QAOA expectation, translation lookup) are compiled straight out of the script
+source, so the benchmarks time the shipped code without executing the app.
+
+Usage:
+    python benchmarks.py                                  # run everything, print a table
+    python benchmarks.py --quick --filter qaoa            # smallest sizes of matching cases
+    python benchmarks.py --output results.json            # machine-readable results
+    python benchmarks.py --save-baseline baseline.json    # store a baseline
+    python benchmarks.py --baseline baseline.json --threshold 0.25 --threshold-for bloch_figure=0.5
+
+Exit status is 1 when any case is slower than its baseline by more than its threshold.
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import types
+from datetime import datetime
+
+import numpy as np
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_THRESHOLD = 0.25  # allowed relative slowdown of the median time
+
+BENCHMARKS = {}
+
+
+def benchmark(name, **params):
+    """Register a case; each keyword is a list of parameter values (the first is used by --quick)."""
+    def register(setup):
+        BENCHMARKS[name] = (setup, params)
+        return setup
+    return register
+
+
+# ============================================================================
+# SCRIPT FUNCTION LOADING
+# ============================================================================
+
+def load_script_functions(filename, names, namespace=None):
+    """Compile the named function definitions (top-level or nested) out of a script without running it."""
+    with open(os.path.join(ROOT, filename), encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=filename)
+    found = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name in names and node.name not in found:
+            found[node.name] = node
+    missing = set(names) - set(found)
+    if missing:
+        raise LookupError(f"{filename} defines no function named {', '.join(sorted(missing))}")
+    module = ast.Module(body=[found[name] for name in names], type_ignores=[])
+    namespace = {'np': np, **(namespace or {})}
+    exec(compile(ast.fix_missing_locations(module), filename, 'exec'), namespace)
+    return [namespace[name] for name in names]
+
+
+def ring_adjacency(n):
+    """Adjacency matrix of the n-cycle, the MaxCut instance used for QAOA timings."""
+    adj = np.zeros((n, n), dtype=int)
+    for i in range(n):
+        adj[i, (i + 1) % n] = adj[(i + 1) % n, i] = 1
+    return adj
+
+
+def translation_keys(tree, prefix=''):
+    """All dot-notation keys of leaf strings in a nested translation dictionary."""
+    keys = []
+    for key, value in tree.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            keys.extend(translation_keys(value, path + '.'))
+        else:
+            keys.append(path)
+    return keys
+
+
+# ============================================================================
+# BENCHMARK CASES
+# ============================================================================
+
+@benchmark("gate_application", n_qubits=[10, 16, 20], block=['contiguous', 'strided'])
+def bench_gate_application(n_qubits, block):
+    """A random two-qubit unitary on a 2^n statevector via the Trotter engine's block kernel."""
+    from time_evolution import _apply_block
+
+    rng = np.random.default_rng(0)
+    unitary, _ = np.linalg.qr(rng.normal(size=(4, 4)) + 1j * rng.normal(size=(4, 4)))
+    psi = rng.normal(size=2**n_qubits) + 1j * rng.normal(size=2**n_qubits)
+    qubits = (n_qubits // 2, n_qubits // 2 + 1) if block == 'contiguous' else (1, n_qubits - 2)
+    return lambda: _apply_block(psi, qubits, unitary, n_qubits)
+
+
+@benchmark("grover_search", n_qubits=[10, 16, 20])
+def bench_grover_search(n_qubits):
+    """The workbench Grover page's search: optimal iterations plus 40 decimated amplitude frames."""
+    from quantum_algorithms import grover_search
+
+    return lambda: grover_search(n_qubits, [3])['success_probability']
+
+
+@benchmark("batched_gates", shots=[1000, 20000, 100000])
+def bench_batched_gates(shots):
+    """H and CNOT layers on a (shots, 2, 2, 2) batch of three-qubit trajectories."""
+    from teleportation import apply_single, apply_cnot, H_GATE
+
+    state = np.zeros((shots, 2, 2, 2), dtype=complex)
+    state[:, 0, 0, 0] = 1
+
+    def run():
+        out = apply_single(state, H_GATE, 0)
+        out = apply_cnot(apply_single(out, H_GATE, 1), 1, 2)
+        return apply_cnot(out, 0, 1)
+    return run
+
+
+@benchmark("qaoa_expectation", n_qubits=[4, 6, 8], p_layers=[1, 2])
+def bench_qaoa_expectation(n_qubits, p_layers):
+    """MaxCut QAOA expectation value as computed on the workbench QAOA page (ring graph)."""
+    _, qaoa_expectation = load_script_functions(
+        'quantum_workbench.py', ['maxcut_cost', 'qaoa_expectation']
+    )
+    adj = ring_adjacency(n_qubits)
+    params = np.random.default_rng(0).uniform(0, np.pi, 2 * p_layers)
+    return lambda: qaoa_expectation(params, adj, p_layers)
+
+
+@benchmark("vqe_energy", samples=[100, 1000, 10000])
+def bench_vqe_energy(samples):
+    """⟨ψ|H|ψ⟩ of the H₂ Pauli-sum Hamiltonian for a batch of trial states, plus the exact ground energy."""
+    from pes import hamiltonian_at
+
+    (vqe_h2_hamiltonian,) = load_script_functions(
+        'alphanova_quantum.py', ['vqe_h2_hamiltonian'], {'hamiltonian_at': hamiltonian_at}
+    )
+    rng = np.random.default_rng(0)
+    psi = rng.standard_normal((samples, 4)) + 1j * rng.standard_normal((samples, 4))
+    psi /= np.linalg.norm(psi, axis=1, keepdims=True)
+
+    def run():
+        H = vqe_h2_hamiltonian()
+        return H.expectation(psi).min(), np.linalg.eigvalsh(H.to_matrix())[0]
+    return run
+
+
+@benchmark("pes_scan", molecule=['H2', 'LiH'], points=[10, 50])
+def bench_pes_scan(molecule, points):
+    """Warm-started VQE over a bond-length grid (one chain per process, run in-process here)."""
+    import pes
+
+    grid = pes.bond_lengths(molecule)
+    distances = np.linspace(grid[0], grid[-1], points)
+    return lambda: pes.scan(molecule, distances, workers=1)['energy']
+
+
+@benchmark("pauli_expectation", n_qubits=[12, 16, 20], terms=[50, 300])
+def bench_pauli_expectation(n_qubits, terms):
+    """⟨ψ|H|ψ⟩ of a random sparse Pauli-sum Hamiltonian evaluated on the statevector (no matrix)."""
+    from pauli import PauliSum
+
+    rng = np.random.default_rng(0)
+    labels = [''.join(rng.choice(list('IXYZ'), n_qubits, p=[0.7, 0.1, 0.1, 0.1])) for _ in range(terms)]
+    H = PauliSum.from_labels(list(zip(labels, rng.standard_normal(terms))))
+    psi = rng.standard_normal(2**n_qubits) + 1j * rng.standard_normal(2**n_qubits)
+    psi /= np.linalg.norm(psi)
+    return lambda: H.expectation(psi)
+
+
+@benchmark("ground_energy", n_qubits=[8, 12, 16])
+def bench_ground_energy(n_qubits):
+    """Uncached Lanczos ground energy of the periodic transverse-field Ising chain (sparse CSR)."""
+    import hamiltonians
+
+    H = hamiltonians.transverse_field_ising(n_qubits)
+
+    def run():
+        hamiltonians._spectra.clear()
+        return hamiltonians.ground_energy(H)
+    return run
+
+
+@benchmark("trotter_step", n_qubits=[12, 16, 20], order=[1, 2])
+def bench_trotter_step(n_qubits, order):
+    """One cached-propagator Trotter step of the periodic Heisenberg chain from the Néel state."""
+    from hamiltonians import heisenberg_chain
+    from time_evolution import neel_state, trotter_evolve, trotter_propagator
+
+    H = heisenberg_chain(n_qubits)
+    psi = neel_state(n_qubits)
+    trotter_propagator(H, 0.05)
+    return lambda: trotter_evolve(H, psi, 0.05, 1, order)
+
+
+@benchmark("vqc_epoch", n_qubits=[2, 4, 6], n_layers=[1, 3])
+def bench_vqc_epoch(n_qubits, n_layers):
+    """One Adam epoch of the variational classifier (batched parameter shift) on 140 two-moons samples."""
+    from quantum_ml import moons_dataset, train_vqc
+
+    X_train, X_test, y_train, y_test = moons_dataset()
+    return lambda: train_vqc(X_train, y_train, n_qubits=n_qubits, n_layers=n_layers, epochs=1)['loss']
+
+
+@benchmark("kernel_gram", samples=[100, 500, 2000])
+def bench_kernel_gram(samples):
+    """Exact fidelity-kernel Gram matrix (4-qubit IQP feature map) on the two-moons dataset."""
+    from quantum_ml import fidelity_kernel, moons_dataset
+
+    X, _, _, _ = moons_dataset(samples, test_size=0.01)
+    return lambda: fidelity_kernel(X)
+
+
+@benchmark("nystroem_kernel_svm", samples=[2000, 20000], landmarks=[64, 256])
+def bench_nystroem_kernel_svm(samples, landmarks):
+    """Nyström quantum-kernel fit: landmark Gram, chunked n×m overlaps and LinearSVC."""
+    from quantum_ml import fit_kernel_svm, moons_dataset
+
+    X, _, y, _ = moons_dataset(samples, test_size=0.01)
+    return lambda: fit_kernel_svm(X, y, n_landmarks=landmarks)['classifier']
+
+
+@benchmark("cv_comparison", folds=[3, 5], cached=[False, True])
+def bench_cv_comparison(folds, cached):
+    """k-fold comparison of SVM, RandomForest and the quantum kernel SVM, fresh in-process or from the cache."""
+    import model_comparison as mc
+
+    data = mc.dataset_params('moons', 200)
+    models = {'svc': mc.model_config('svc'), 'forest': mc.model_config('random_forest', n_estimators=50),
+              'quantum_kernel': mc.model_config('quantum_kernel')}
+
+    def run():
+        if not cached:
+            mc._results.clear()
+        return mc.compare_models(data, models, folds=folds, workers=1)['mean']
+    return run
+
+
+@benchmark("qec_sampling", trials=[1000, 10000, 100000])
+def bench_qec_sampling(trials):
+    """Bit-flip trials of the 3-qubit repetition code (the workbench QEC page's sampler)."""
+    from sampling import repetition_code_trials
+
+    rng = np.random.default_rng(0)
+    return lambda: repetition_code_trials(0.05, trials, seed=rng)
+
+
+@benchmark("shot_sampling", shots=[1000, 100000], n_qubits=[2, 4])
+def bench_shot_sampling(shots, n_qubits):
+    """Pauli-tomography counts for a GHZ state: one multinomial draw over all 3^n bases."""
+    from tomography import simulate_counts, tomography_target
+
+    rho = tomography_target("GHZ", n_qubits)
+    rng = np.random.default_rng(0)
+    return lambda: simulate_counts(rho, shots, seed=rng)
+
+
+@benchmark("register_sampling", shots=[1000, 100_000_000], n_qubits=[4, 16])
+def bench_register_sampling(shots, n_qubits):
+    """Measuring an n-qubit register: multinomial counts wrapped as lazy bitstring counts."""
+    from sampling import bitstring_counts
+
+    probabilities = np.random.default_rng(1).random(2**n_qubits)
+    rng = np.random.default_rng(0)
+    return lambda: bitstring_counts(probabilities, shots, n_qubits, seed=rng)
+
+
+@benchmark("alias_sampling", shots=[1000, 1_000_000])
+def bench_alias_sampling(shots):
+    """Per-shot records from a prebuilt 256-outcome alias table (teleportation-style trajectories)."""
+    from sampling import alias_table, sample_shots
+
+    probabilities = np.random.default_rng(1).random(256)
+    table = alias_table(probabilities)
+    rng = np.random.default_rng(0)
+    return lambda: sample_shots(probabilities, shots, rng, table=table)
+
+
+@benchmark("histogram_binning", shots=[1000, 10_000_000])
+def bench_histogram_binning(shots):
+    """Born-rule position histogram: CDF-multinomial bin counts of a gridded |ψ|² (Schrödinger page)."""
+    from sampling import sample_histogram
+
+    x = np.linspace(-10, 10, 1000)
+    density = np.exp(-(x - 2) ** 2) * np.cos(3 * x) ** 2
+    rng = np.random.default_rng(0)
+    return lambda: sample_histogram(x, density, shots, bins=50, seed=rng)
+
+
+@benchmark("bloch_figure", serialize=[False, True])
+def bench_bloch_figure(serialize):
+    """Workbench Bloch sphere figure construction, optionally with the JSON serialization Streamlit performs."""
+    import plotly.graph_objects as go
+
+    (create_bloch_sphere,) = load_script_functions(
+        'quantum_workbench.py', ['create_bloch_sphere'], {'go': go}
+    )
+    if serialize:
+        return lambda: len(create_bloch_sphere(45, 30).to_json())
+    return lambda: create_bloch_sphere(45, 30)
+
+
+@benchmark("figure_coalescing", figure=['research_bloch', 'app_bloch'])
+def bench_figure_coalescing(figure):
+    """Trace-coalescing pass on the glow-heavy Bloch spheres of the research platform and app.py."""
+    import plotly.graph_objects as go
+    from figure_optimizer import coalesce_traces
+
+    if figure == 'research_bloch':
+        (build,) = load_script_functions('quantum_research_platform.py', ['create_bloch_sphere'], {'go': go})
+        return lambda: coalesce_traces(build(45, 30))
+    (build,) = load_script_functions('app.py', ['create_enhanced_bloch_sphere'], {'go': go})
+    return lambda: coalesce_traces(build(45, 30, True))
+
+
+@benchmark("translation_lookup", lookups=[1000, 10000])
+def bench_translation_lookup(lookups):
+    """Dot-notation lookups through app.py's t() over every key in the English and Russian tables."""
+    session = types.SimpleNamespace(session_state={'language': 'en'})
+    load_translations, t = load_script_functions(
+        'app.py', ['load_translations', 't'], {'os': os, 'json': json, 'st': session,
+                                               '__file__': os.path.join(ROOT, 'app.py')}
+    )
+    t.__globals__['TRANSLATIONS'] = load_translations()
+    keys = translation_keys(t.__globals__['TRANSLATIONS'].get('en', {})) or ['missing.key']
+    keys = [keys[i % len(keys)] for i in range(lookups)]
+
+    def run():
+        for language in ('en', 'ru'):
+            session.session_state['language'] = language
+            for key in keys:
+                t(key)
+    return run
+
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+def parameter_grid(params, quick=False):
+    """Cartesian product of a case's parameter lists as a list of dicts."""
+    grid = [{}]
+    for key, values in params.items():
+        values = values[:1] if quick else values
+        grid = [dict(point, **{key: value}) for point in grid for value in values]
+    return grid
+
+
+def case_id(name, point):
+    """Stable identifier such as qaoa_expectation[n_qubits=6,p_layers=2]."""
+    if not point:
+        return name
+    return f"{name}[{','.join(f'{k}={v}' for k, v in point.items())}]"
+
+
+def time_callable(fn, repeats=7, min_time=0.05):
+    """Per-call timings: calls are batched so each repeat lasts at least min_time seconds."""
+    start = time.perf_counter()
+    fn()  # warm-up (imports, caches, first-touch allocations)
+    first = time.perf_counter() - start
+    number = max(1, int(min_time / max(first, 1e-9)))
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    return timings, number
+
+
+def run_benchmarks(pattern=None, quick=False, repeats=7, min_time=0.05):
+    """Run every registered case (optionally only names containing pattern) and return result records."""
+    results = []
+    for name, (setup, params) in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        for point in parameter_grid(params, quick):
+            record = {'id': case_id(name, point), 'benchmark': name, 'params': point}
+            try:
+                fn = setup(**point)
+            except ImportError as e:
+                record.update(status='skipped', reason=str(e))
+                results.append(record)
+                continue
+            timings, number = time_callable(fn, repeats, min_time)
+            record.update(
+                status='ok',
+                median=statistics.median(timings),
+                min=min(timings),
+                mean=statistics.fmean(timings),
+                stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+                repeats=repeats,
+                calls_per_repeat=number,
+            )
+            results.append(record)
+    return results
+
+
+# ============================================================================
+# BASELINE COMPARISON & REPORTING
+# ============================================================================
+
+def environment_info():
+    """Interpreter, library and machine details stored with every result file."""
+    import scipy
+    import plotly
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'plotly': plotly.__version__,
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare_to_baseline(results, baseline, threshold=DEFAULT_THRESHOLD, overrides=None):
+    """Annotate results with the baseline median, the ratio and a verdict; returns the regressions.
+
+    The threshold for a case is taken from overrides (by benchmark name or case id),
+    then from the baseline file's 'thresholds' table, then the global default.
+    """
+    overrides = overrides or {}
+    stored_thresholds = baseline.get('thresholds', {})
+    reference = {r['id']: r for r in baseline.get('results', []) if r.get('status') == 'ok'}
+    regressions = []
+    for record in results:
+        base = reference.get(record['id'])
+        if record['status'] != 'ok' or base is None:
+            continue
+        limit = overrides.get(record['id'], overrides.get(record['benchmark'],
+                stored_thresholds.get(record['id'], stored_thresholds.get(record['benchmark'], threshold))))
+        ratio = record['median'] / base['median']
+        record.update(baseline_median=base['median'], ratio=ratio, threshold=limit)
+        if ratio > 1 + limit:
+            record['verdict'] = 'regression'
+            regressions.append(record)
+        elif ratio < 1 / (1 + limit):
+            record['verdict'] = 'improvement'
+        else:
+            record['verdict'] = 'unchanged'
+    return regressions
+
+
+def format_seconds(seconds):
+    """Human-readable duration with an adaptive unit."""
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def print_table(results):
+    """Plain-text summary of one run, with baseline ratios when available."""
+    width = max([len(r['id']) for r in results] + [10])
+    print(f"{'case':<{width}}  {'median':>10}  {'min':>10}  {'± stdev':>10}  {'vs base':>9}  verdict")
+    for r in results:
+        if r['status'] != 'ok':
+            print(f"{r['id']:<{width}}  {'skipped':>10}  {r['reason']}")
+            continue
+        ratio = f"{r['ratio']:.2f}×" if 'ratio' in r else '—'
+        print(f"{r['id']:<{width}}  {format_seconds(r['median']):>10}  {format_seconds(r['min']):>10}  "
+              f"{format_seconds(r['stdev']):>10}  {ratio:>9}  {r.get('verdict', '')}")
+
+
+def parse_overrides(items):
+    """--threshold-for name=0.5 pairs as a dict."""
+    overrides = {}
+    for item in items or []:
+        name, _, value = item.partition('=')
+        if not value:
+            raise argparse.ArgumentTypeError(f"Expected NAME=THRESHOLD, got {item!r}")
+        overrides[name] = float(value)
+    return overrides
+
+
+def main(argv=None):
+    """Command-line entry point; returns the process exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--filter', help="only run benchmarks whose name contains this text")
+    parser.add_argument('--quick', action='store_true', help="only the first (smallest) parameter values")
+    parser.add_argument('--repeats', type=int, default=7)
+    parser.add_argument('--min-time', type=float, default=0.05, help="minimum seconds per repeat")
+    parser.add_argument('--output', help="write results as JSON to this file ('-' for stdout)")
+    parser.add_argument('--baseline', help="baseline JSON to compare against")
+    parser.add_argument('--save-baseline', help="write this run as a baseline JSON file")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown of the median (default 0.25 = 25%%)")
+    parser.add_argument('--threshold-for', action='append', metavar='NAME=THRESHOLD',
+                        help="per-benchmark or per-case threshold override (repeatable)")
+    parser.add_argument('--list', action='store_true', help="list the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (setup, params) in BENCHMARKS.items():
+            for point in parameter_grid(params, args.quick):
+                print(case_id(name, point))
+        return 0
+
+    sys.path.insert(0, ROOT)
+    results = run_benchmarks(args.filter, args.quick, args.repeats, args.min_time)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.threshold, parse_overrides(args.threshold_for))
+
+    report = {'environment': environment_info(), 'results': results}
+    if args.baseline:
+        report['baseline'] = args.baseline
+        report['regressions'] = [r['id'] for r in regressions]
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print_table(results)
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({'environment': report['environment'], 'thresholds': {}, 'results': results}, f, indent=2)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond threshold: " + ", ".join(r['id'] for r in regressions),
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
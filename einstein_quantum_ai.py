@@ -6,6 +6,21 @@ from scipy import stats
 import pandas as pd
 import time
 
+from quantum_walks import quantum_walk_1d, quantum_walk_2d, classical_walks, classical_spread
+from quantum_algorithms import grover_search, grover_amplitude_animation, grover_success_figure
+from tomography import (
+    tomography_target, simulate_counts, linear_inversion, mle_rrr, project_to_physical,
+    state_fidelity, min_eigenvalue, fidelity_vs_shots
+)
+from teleportation import (
+    teleport, teleportation_statistics, random_bloch_angles, fidelity_histogram_figure,
+    CLASSICAL_FIDELITY_LIMIT
+)
+from bell_test import correlator_grid, sample_correlators, sample_chsh, chsh_landscape, chsh_landscape_figure, werner_state
+from figure_optimizer import optimize_plotly_charts
+from sampling import sample_shots
+from quantum_ml import moons_dataset, n_vqc_parameters, train_vqc
+
 # Page configuration
 st.set_page_config(
     page_title="Einstein & Quantum AI Lab",
@@ -14,6 +29,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Merge same-style decorative traces before every figure is sent to the browser
+optimize_plotly_charts()
+
 # Custom CSS
 st.markdown("""
     <style>
@@ -437,25 +455,31 @@ elif page == "🔗 Quantum Entanglement (EPR)":
             </div>
             """, unsafe_allow_html=True)
         
-        time.sleep(1)
+        # Measure both photons of 20 singlet pairs along the same axis: E = -1, outcomes always opposite
+        spins_a = 1 - 2 * sample_shots([0.5, 0.5], 20)
+        spins_b = -spins_a
+        arrow = {1: '↑', -1: '↓'}
         
-        # Measure
-        if st.button("🔬 Measure Photon A"):
-            measurement_a = np.random.choice(['↑', '↓'])
-            measurement_b = '↓' if measurement_a == '↑' else '↑'
-            
-            st.success(f"📡 Photon A measured: **{measurement_a}**")
-            st.success(f"📡 Photon B instantly becomes: **{measurement_b}**")
-            st.warning("⚡ Correlation appears instantaneous, regardless of distance!")
-            st.balloons()
+        st.success(f"📡 Photon A measured: **{' '.join(arrow[v] for v in spins_a)}**")
+        st.success(f"📡 Photon B measured: **{' '.join(arrow[v] for v in spins_b)}**")
+        st.warning("⚡ Every pair is perfectly anti-correlated, yet each photon alone looks like a fair coin!")
     
     # Experimental data
     st.markdown("### 📈 Real Experimental Results")
     
-    # Simulate Bell test data
-    angles = np.linspace(0, 180, 50)
-    quantum_correlation = -np.cos(np.radians(angles))
-    classical_limit = np.where(angles <= 45, -1, np.where(angles <= 135, 2*angles/90 - 3, 1))
+    # Singlet source with adjustable visibility (Werner mixing with white noise)
+    singlet = np.array([0, 1, -1, 0]) / np.sqrt(2)
+    col1, col2 = st.columns(2)
+    with col1:
+        visibility = st.slider("Source Visibility", 0.0, 1.0, 0.95, 0.01,
+                               help="Fraction of pairs emitted in the singlet state; the rest is white noise")
+    with col2:
+        shots = st.select_slider("Photon Pairs per Setting", [1_000, 10_000, 100_000, 1_000_000], value=10_000)
+    rho_source = werner_state(visibility, singlet)
+    
+    angles = np.linspace(0, 180, 181)
+    quantum_correlation = correlator_grid(rho_source, [0.0], np.radians(angles))[0]
+    classical_limit = -(1 - 2 * angles / 180)
     
     fig = go.Figure()
     
@@ -471,13 +495,15 @@ elif page == "🔗 Quantum Entanglement (EPR)":
         line=dict(color='red', width=3, dash='dash')
     ))
     
-    # Add experimental points
-    exp_angles = [0, 22.5, 45, 67.5, 90, 112.5, 135, 157.5, 180]
-    exp_values = -np.cos(np.radians(exp_angles)) + np.random.normal(0, 0.02, len(exp_angles))
+    # Simulated experiment: binomial coincidence counts at each analyzer setting
+    exp_angles = np.array([0, 22.5, 45, 67.5, 90, 112.5, 135, 157.5, 180])
+    exp_exact = correlator_grid(rho_source, [0.0], np.radians(exp_angles))[0]
+    exp_values = sample_correlators(exp_exact, shots)[0]
     
     fig.add_trace(go.Scatter(
         x=exp_angles, y=exp_values,
         mode='markers', name='Experimental Data',
+        error_y=dict(type='data', array=np.sqrt((1 - exp_exact**2) / shots), color='yellow'),
         marker=dict(color='yellow', size=10, symbol='diamond')
     ))
     
@@ -493,6 +519,20 @@ elif page == "🔗 Quantum Entanglement (EPR)":
     
     st.plotly_chart(fig, use_container_width=True)
     
+    # CHSH value from 1000 simulated repetitions of the full experiment
+    S_samples, S_exact = sample_chsh(rho_source, shots, repetitions=1000)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("CHSH |S| (theory)", f"{abs(S_exact):.3f}", f"{abs(S_exact) - 2:+.3f} vs classical")
+    with col2:
+        st.metric("CHSH |S| (measured)", f"{abs(S_samples[0]):.3f}", f"± {S_samples.std():.3f}")
+    with col3:
+        st.metric("Experiments Violating", f"{np.mean(np.abs(S_samples) > 2):.0%}")
+    
+    alphas, betas, S_grid = chsh_landscape(rho_source)
+    st.plotly_chart(chsh_landscape_figure(alphas, betas, S_grid, title="CHSH Landscape: Where Reality Breaks"),
+                    use_container_width=True)
+    
     st.markdown("""
     <div class='quantum-card'>
     <h3>🏆 The Verdict</h3>
@@ -912,10 +952,18 @@ elif page == "🤖 Quantum AI Algorithms":
         """, unsafe_allow_html=True)
         
         # Interactive demo
-        database_size = st.slider("Database Size (N):", 100, 10000, 1000, 100)
+        col1, col2 = st.columns(2)
+        with col1:
+            n_qubits = st.slider("Database Qubits (N = 2ⁿ):", 4, 24, 16)
+        with col2:
+            n_marked = st.slider("Marked Items:", 1, 8, 1)
+        database_size = 2**n_qubits
+        
+        marked_items = np.random.default_rng(n_qubits).choice(database_size, size=n_marked, replace=False)
+        grover_result = grover_search(n_qubits, marked_items)
         
         classical_ops = database_size / 2  # Average case
-        quantum_ops = np.sqrt(database_size) * (np.pi / 4)
+        quantum_ops = grover_result['n_iterations']
         
         speedup = classical_ops / quantum_ops
         
@@ -925,7 +973,7 @@ elif page == "🤖 Quantum AI Algorithms":
             st.markdown(f"""
             <div class='metric-card'>
             <h3>Classical Search</h3>
-            <h2>{classical_ops:.0f}</h2>
+            <h2>{classical_ops:,.0f}</h2>
             <p>operations (average)</p>
             </div>
             """, unsafe_allow_html=True)
@@ -934,8 +982,8 @@ elif page == "🤖 Quantum AI Algorithms":
             st.markdown(f"""
             <div class='metric-card' style='background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);'>
             <h3>Grover's Algorithm</h3>
-            <h2>{quantum_ops:.0f}</h2>
-            <p>operations</p>
+            <h2>{quantum_ops:,}</h2>
+            <p>iterations → P(success) = {grover_result['success_probability'][-1]:.4f}</p>
             </div>
             """, unsafe_allow_html=True)
         
@@ -948,7 +996,18 @@ elif page == "🤖 Quantum AI Algorithms":
             </div>
             """, unsafe_allow_html=True)
         
-        # Visualization
+        # Simulated amplitude dynamics
+        col1, col2 = st.columns(2)
+        with col1:
+            fig = grover_success_figure(grover_result)
+            fig.update_layout(plot_bgcolor='rgba(20,20,50,0.9)')
+            st.plotly_chart(fig, use_container_width=True)
+        with col2:
+            fig = grover_amplitude_animation(grover_result)
+            fig.update_layout(plot_bgcolor='rgba(20,20,50,0.9)')
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Scaling
         sizes = np.logspace(2, 6, 50)
         classical = sizes / 2
         quantum = np.sqrt(sizes) * (np.pi / 4)
@@ -1121,7 +1180,7 @@ elif page == "🔬 Quantum Machine Learning":
             <h4>Network Architecture</h4>
             <p>Qubits: {n_qubits}</p>
             <p>Layers: {n_layers}</p>
-            <p>Parameters: {n_qubits * n_layers * 3}</p>
+            <p>Parameters: {n_vqc_parameters(n_qubits, n_layers)}</p>
             <p>Hilbert Space Dimension: {2**n_qubits}</p>
             </div>
             """, unsafe_allow_html=True)
@@ -1154,16 +1213,11 @@ q2: ──H──RY(θ₂)─────X───────RY(θ₅)──
             progress = st.progress(0)
             loss_container = st.empty()
             
-            losses = []
-            accuracies = []
+            X_train, X_test, y_train, y_test = moons_dataset(300, 0.1)
             
-            for epoch in range(epochs):
-                # Simulate loss decrease
-                loss = 1.0 * np.exp(-epoch / 10) + 0.1 + np.random.normal(0, 0.05)
-                accuracy = 1.0 - loss
-                
-                losses.append(loss)
-                accuracies.append(accuracy)
+            def show_epoch(epoch, history):
+                losses = history['loss']
+                accuracies = history['val_accuracy']
                 
                 progress.progress((epoch + 1) / epochs)
                 
@@ -1200,10 +1254,11 @@ q2: ──H──RY(θ₂)─────X───────RY(θ₅)──
                 )
                 
                 loss_container.plotly_chart(fig, use_container_width=True)
-                
-                time.sleep(0.1)
             
-            st.success(f"✅ Training Complete! Final Accuracy: {accuracies[-1]:.2%}")
+            # Real VQC on two moons: minibatch Adam with parameter-shift gradients
+            history = train_vqc(X_train, y_train, X_test, y_test, n_qubits, n_layers, epochs, callback=show_epoch)
+            
+            st.success(f"✅ Training Complete! Final Accuracy: {history['val_accuracy'][-1]:.2%}")
             st.balloons()
     
     elif approach == "Quantum Kernel Methods":
@@ -1410,6 +1465,24 @@ elif page == "🎮 Interactive Simulations":
         </div>
         """, unsafe_allow_html=True)
         
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            input_mode = st.radio("Input State |ψ⟩:", ["Custom (θ, φ)", "Random Bloch States"])
+        with col2:
+            tele_theta = st.slider("θ (degrees):", 0, 180, 60, disabled=input_mode != "Custom (θ, φ)")
+            tele_phi = st.slider("φ (degrees):", 0, 360, 45, disabled=input_mode != "Custom (θ, φ)")
+        with col3:
+            tele_shots = st.select_slider("Protocol Runs:", [1_000, 10_000, 100_000], value=10_000)
+        
+        with st.expander("🌪️ Noise Channels"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                tele_depolarizing = st.slider("Bell-Pair Depolarizing p:", 0.0, 0.5, 0.0, 0.01)
+            with col2:
+                tele_damping = st.slider("Bob's Amplitude Damping γ:", 0.0, 1.0, 0.0, 0.01)
+            with col3:
+                tele_readout = st.slider("Classical Bit Error:", 0.0, 0.5, 0.0, 0.01)
+        
         if st.button("🚀 Start Teleportation"):
             col1, col2, col3 = st.columns(3)
             
@@ -1443,111 +1516,288 @@ elif page == "🎮 Interactive Simulations":
                 </div>
                 """, unsafe_allow_html=True)
             
-            time.sleep(1)
+            if input_mode == "Custom (θ, φ)":
+                theta_in = np.full(tele_shots, np.radians(tele_theta))
+                phi_in = np.full(tele_shots, np.radians(tele_phi))
+            else:
+                theta_in, phi_in = random_bloch_angles(tele_shots, np.random.default_rng())
+            
+            start_time = time.perf_counter()
+            result = teleport(theta_in, phi_in, tele_depolarizing, tele_damping, tele_readout)
+            run_time = time.perf_counter() - start_time
+            stats_tele = teleportation_statistics(result)
             
             st.markdown("#### Step 1: Alice performs Bell measurement")
-            time.sleep(1)
+            fig = go.Figure(go.Bar(
+                x=[f"|{label}⟩" for label in stats_tele['labels']], y=stats_tele['counts'],
+                marker_color=['#667eea', '#00d4ff', '#f093fb', '#38ef7d'],
+                text=stats_tele['counts'], textposition='outside'
+            ))
+            fig.update_layout(
+                title=f"Alice's Measurement Outcomes over {tele_shots:,} Runs",
+                yaxis_title="Counts",
+                plot_bgcolor='rgba(20,20,50,0.9)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font_color='white',
+                height=350
+            )
+            st.plotly_chart(fig, use_container_width=True)
             
-            measurement = np.random.choice(['00', '01', '10', '11'])
-            st.info(f"📡 Alice measures: {measurement}")
             st.markdown("#### Step 2: Alice sends classical bits to Bob")
-            time.sleep(1)
-            
-            st.success(f"📞 Classical communication: {measurement}")
             st.markdown("#### Step 3: Bob applies correction")
-            time.sleep(1)
-            
             corrections = {
                 '00': 'I (do nothing)',
                 '01': 'X (bit flip)',
                 '10': 'Z (phase flip)',
                 '11': 'XZ (both flips)'
             }
+            st.dataframe(pd.DataFrame({
+                "Outcome": stats_tele['labels'],
+                "Bob's Gate": [corrections[label] for label in stats_tele['labels']],
+                "Runs": stats_tele['counts'],
+                "Fidelity Before Correction": np.round(stats_tele['uncorrected_per_outcome'], 4),
+                "Fidelity After Correction": np.round(stats_tele['fidelity_per_outcome'], 4),
+            }), use_container_width=True, hide_index=True)
             
-            st.success(f"🔧 Bob applies gate: {corrections[measurement]}")
-            st.markdown("#### Result: Teleportation Complete! 🎉")
+            st.plotly_chart(fidelity_histogram_figure(result), use_container_width=True)
             
-            st.markdown("""
-            <div class='quantum-card' style='text-align: center; background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);'>
-            <h3>✅ Success!</h3>
-            <p style='font-size: 20px;'>Bob now has the exact quantum state |ψ⟩</p>
-            <p style='font-size: 16px;'>Alice's original state was destroyed (no-cloning theorem)</p>
-            </div>
-            """, unsafe_allow_html=True)
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Average Fidelity", f"{stats_tele['mean_fidelity']:.4f}",
+                        f"± {stats_tele['std_error']:.4f}")
+            col2.metric("vs Classical Limit", f"{stats_tele['mean_fidelity'] - CLASSICAL_FIDELITY_LIMIT:+.4f}")
+            col3.metric("Simulation Time", f"{run_time * 1000:.1f} ms", f"{tele_shots:,} runs")
             
-            st.balloons()
+            if stats_tele['mean_fidelity'] > CLASSICAL_FIDELITY_LIMIT:
+                st.markdown("#### Result: Teleportation Complete! 🎉")
+                st.markdown("""
+                <div class='quantum-card' style='text-align: center; background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);'>
+                <h3>✅ Success!</h3>
+                <p style='font-size: 20px;'>Bob's qubit beats any classical strategy (F > 2/3)</p>
+                <p style='font-size: 16px;'>Alice's original state was destroyed (no-cloning theorem)</p>
+                </div>
+                """, unsafe_allow_html=True)
+                st.balloons()
+            else:
+                st.warning("⚠️ Noise has pushed the fidelity below 2/3: a classical measure-and-resend strategy "
+                           "would do as well. The entanglement resource is too degraded.")
     
     elif simulation == "🎲 Quantum Random Walk":
         st.markdown("### 🎲 Quantum vs Classical Random Walk")
         
-        steps = st.slider("Number of Steps:", 10, 100, 50)
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            lattice = st.radio("Lattice:", ["1D Line", "2D Grid"], horizontal=True)
+        with col2:
+            # The 2×2 Grover coin is just X, so it only makes sense on the grid
+            coin = st.selectbox("Coin:", ["Grover", "Hadamard"] if lattice == "2D Grid" else ["Hadamard"])
+        with col3:
+            max_steps = 3000 if lattice == "1D Line" else 200
+            steps = st.slider("Number of Steps:", 10, max_steps, min(500, max_steps) if lattice == "1D Line" else 100)
+        with col4:
+            n_walkers = st.slider("Classical Walkers:", 100, 10000, 2000, 100)
         
         if st.button("🚶 Run Random Walks"):
-            # Classical random walk
-            classical_pos = [0]
-            for _ in range(steps):
-                classical_pos.append(classical_pos[-1] + np.random.choice([-1, 1]))
-            
-            # Quantum random walk (simplified)
-            quantum_prob = np.zeros(2 * steps + 1)
-            quantum_prob[steps] = 1  # Start at center
+            dims = 1 if lattice == "1D Line" else 2
+            start_time = time.perf_counter()
+            if dims == 1:
+                positions, quantum_prob, quantum_sigma = quantum_walk_1d(steps, coin)
+            else:
+                positions, quantum_prob, quantum_sigma = quantum_walk_2d(steps, coin)
+            quantum_time = time.perf_counter() - start_time
             
-            for _ in range(steps):
-                new_prob = np.zeros(2 * steps + 1)
-                for i in range(len(quantum_prob)):
-                    if quantum_prob[i] > 0:
-                        # Quantum interference
-                        if i > 0:
-                            new_prob[i - 1] += quantum_prob[i] * 0.5
-                        if i < len(quantum_prob) - 1:
-                            new_prob[i + 1] += quantum_prob[i] * 0.5
-                quantum_prob = new_prob
-                quantum_prob /= np.sum(quantum_prob)  # Normalize
+            start_time = time.perf_counter()
+            paths = classical_walks(n_walkers, steps, dims=dims)
+            classical_sigma = classical_spread(paths)
+            classical_time = time.perf_counter() - start_time
             
-            # Plot
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=list(range(len(classical_pos))),
-                y=classical_pos,
-                mode='lines+markers',
-                name='Classical Walk',
-                line=dict(color='red', width=2)
-            ))
+            t_axis = np.arange(steps + 1)
             
-            positions = np.arange(-steps, steps + 1)
-            quantum_pos_expected = np.sum(positions * quantum_prob)
+            col1, col2 = st.columns(2)
             
-            fig.add_hline(
-                y=quantum_pos_expected,
-                line_dash="dash",
-                line_color="cyan",
-                annotation_text=f"Quantum (spread: {np.std(positions, where=quantum_prob>0.01):.1f})"
-            )
+            with col1:
+                if dims == 1:
+                    # Walks of n steps only reach sites with the parity of n
+                    reachable = (positions + steps) % 2 == 0
+                    final_positions = paths[:, -1]
+                    classical_counts = np.bincount(final_positions + steps, minlength=2 * steps + 1)
+                    
+                    fig = go.Figure()
+                    fig.add_trace(go.Scatter(
+                        x=positions[reachable], y=quantum_prob[reachable],
+                        mode='lines', name=f'Quantum ({coin} coin)',
+                        line=dict(color='cyan', width=2), fill='tozeroy'
+                    ))
+                    fig.add_trace(go.Scatter(
+                        x=positions[reachable], y=classical_counts[reachable] / n_walkers,
+                        mode='lines', name=f'Classical ({n_walkers:,} walkers)',
+                        line=dict(color='red', width=2)
+                    ))
+                    fig.update_layout(
+                        title=f"Position Distribution after {steps} Steps",
+                        xaxis_title="Position",
+                        yaxis_title="Probability"
+                    )
+                else:
+                    fig = go.Figure(go.Heatmap(
+                        x=positions, y=positions, z=quantum_prob.T,
+                        colorscale='Viridis', colorbar=dict(title='P(x, y)')
+                    ))
+                    fig.update_layout(
+                        title=f"2D Quantum Walk ({coin} coin) after {steps} Steps",
+                        xaxis_title="x",
+                        yaxis_title="y",
+                        yaxis_scaleanchor='x'
+                    )
+                
+                fig.update_layout(
+                    plot_bgcolor='rgba(20,20,50,0.9)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font_color='white',
+                    height=500
+                )
+                st.plotly_chart(fig, use_container_width=True)
             
-            fig.update_layout(
-                title="Random Walk Comparison",
-                xaxis_title="Step",
-                yaxis_title="Position",
-                plot_bgcolor='rgba(20,20,50,0.9)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font_color='white',
-                height=500
-            )
+            with col2:
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    x=t_axis[1:], y=quantum_sigma[1:],
+                    mode='lines', name='Quantum σ(t)',
+                    line=dict(color='cyan', width=3)
+                ))
+                fig.add_trace(go.Scatter(
+                    x=t_axis[1:], y=classical_sigma[1:],
+                    mode='lines', name='Classical σ(t)',
+                    line=dict(color='red', width=3)
+                ))
+                fig.add_trace(go.Scatter(
+                    x=t_axis[1:], y=np.sqrt(t_axis[1:]),
+                    mode='lines', name='√t',
+                    line=dict(color='gray', width=1, dash='dash')
+                ))
+                fig.update_layout(
+                    title="Spread vs Time (log-log)",
+                    xaxis=dict(title="Step", type='log'),
+                    yaxis=dict(title="RMS Displacement σ", type='log'),
+                    plot_bgcolor='rgba(20,20,50,0.9)',
+                    paper_bgcolor='rgba(0,0,0,0)',
+                    font_color='white',
+                    height=500
+                )
+                st.plotly_chart(fig, use_container_width=True)
             
-            st.plotly_chart(fig, use_container_width=True)
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Quantum σ / t", f"{quantum_sigma[-1] / steps:.3f}")
+            col2.metric("Classical σ / √t", f"{classical_sigma[-1] / np.sqrt(steps):.3f}")
+            col3.metric("Quantum Walk Time", f"{quantum_time * 1000:.0f} ms")
+            col4.metric("Classical Walks Time", f"{classical_time * 1000:.0f} ms")
             
             st.markdown("""
             <div class='quantum-card'>
             <h4>🔑 Key Difference</h4>
             <p>
-            <b>Classical:</b> Random, diffuses slowly (~√N)<br>
-            <b>Quantum:</b> Interference effects spread faster (~N)
+            <b>Classical:</b> Random, diffuses slowly (σ ∝ √t)<br>
+            <b>Quantum:</b> Interference effects spread ballistically (σ ∝ t)
             </p>
             <p>Quantum walks are used in quantum search and graph algorithms!</p>
             </div>
             """, unsafe_allow_html=True)
 
+    elif simulation == "🔮 Quantum State Tomography":
+        st.markdown("### 🔮 Quantum State Tomography")
+        
+        st.markdown("""
+        <div class='quantum-card'>
+        <h4>Reconstructing a State from Measurements</h4>
+        <p style='font-size: 16px;'>
+        A single measurement reveals almost nothing about a quantum state. Tomography measures many 
+        identically prepared copies in every Pauli basis (3ⁿ settings for n qubits) and reconstructs 
+        the full density matrix ρ. Linear inversion is fast but can return unphysical states; 
+        maximum likelihood (the RρR iteration) always returns a valid ρ.
+        </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            n_tomo = st.slider("Qubits:", 1, 4, 2)
+        with col2:
+            target_kind = st.selectbox("Target State:", ["GHZ", "W", "Product |+⟩", "Haar Random"])
+        with col3:
+            tomo_noise = st.slider("Depolarizing Noise:", 0.0, 0.5, 0.05, 0.01)
+        with col4:
+            tomo_shots = st.select_slider("Shots per Basis:", [100, 1_000, 10_000, 100_000], value=1_000)
+        
+        if st.button("🔬 Run Tomography"):
+            rho_true = tomography_target(target_kind, n_tomo, tomo_noise, seed=7)
+            
+            start_time = time.perf_counter()
+            counts = simulate_counts(rho_true, tomo_shots)
+            rho_linear = linear_inversion(counts)
+            linear_time = time.perf_counter() - start_time
+            
+            start_time = time.perf_counter()
+            rho_mle, mle_iterations, _ = mle_rrr(counts)
+            mle_time = time.perf_counter() - start_time
+            
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Measurement Bases", f"{len(counts)}", f"{len(counts) * tomo_shots:,} shots total")
+            col2.metric("Linear Inversion Fidelity", f"{state_fidelity(rho_true, project_to_physical(rho_linear)):.4f}",
+                        f"λ_min = {min_eigenvalue(rho_linear):+.4f}")
+            col3.metric("MLE Fidelity", f"{state_fidelity(rho_true, rho_mle):.4f}",
+                        f"λ_min = {min_eigenvalue(rho_mle):+.4f}")
+            col4.metric("MLE Solve", f"{mle_time * 1000:.0f} ms", f"{mle_iterations} RρR iterations")
+            
+            basis_states = [format(i, f'0{n_tomo}b') for i in range(2**n_tomo)]
+            col1, col2 = st.columns(2)
+            for column, matrix, title in [(col1, rho_true, "True State Re(ρ)"),
+                                          (col2, rho_mle, "MLE Reconstruction Re(ρ)")]:
+                with column:
+                    fig = go.Figure(go.Heatmap(
+                        x=basis_states, y=basis_states, z=np.real(matrix),
+                        colorscale='RdBu', zmid=0, zmin=-0.5, zmax=0.5
+                    ))
+                    fig.update_layout(
+                        title=title,
+                        yaxis=dict(autorange='reversed'),
+                        plot_bgcolor='rgba(20,20,50,0.9)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font_color='white',
+                        height=420
+                    )
+                    st.plotly_chart(fig, use_container_width=True)
+            
+            # Fidelity vs shot budget, three repetitions per point
+            shot_grid = [50, 200, 1_000, 5_000, 20_000, 100_000]
+            start_time = time.perf_counter()
+            fid_linear, fid_mle = fidelity_vs_shots(rho_true, shot_grid, repetitions=3)
+            sweep_time = time.perf_counter() - start_time
+            
+            fig = go.Figure()
+            fig.add_trace(go.Scatter(
+                x=shot_grid, y=1 - fid_linear.mean(axis=1),
+                error_y=dict(type='data', array=fid_linear.std(axis=1)),
+                mode='lines+markers', name='Linear Inversion (projected)',
+                line=dict(color='orange', width=3)
+            ))
+            fig.add_trace(go.Scatter(
+                x=shot_grid, y=1 - fid_mle.mean(axis=1),
+                error_y=dict(type='data', array=fid_mle.std(axis=1)),
+                mode='lines+markers', name='Maximum Likelihood',
+                line=dict(color='cyan', width=3)
+            ))
+            fig.update_layout(
+                title=f"Infidelity vs Shots per Basis ({n_tomo} qubit{'s' if n_tomo > 1 else ''}, {target_kind})",
+                xaxis=dict(title="Shots per Basis", type='log'),
+                yaxis=dict(title="1 − F", type='log'),
+                plot_bgcolor='rgba(20,20,50,0.9)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font_color='white',
+                height=450
+            )
+            st.plotly_chart(fig, use_container_width=True)
+            st.caption(f"Sampling + linear inversion: {linear_time * 1000:.1f} ms | "
+                       f"shot sweep ({len(shot_grid) * 3} reconstructions): {sweep_time:.2f} s")
+
 # Footer
 st.markdown("---")
 st.markdown("""
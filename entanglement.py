@@ -0,0 +1,199 @@
+"""
+Entanglement Toolkit
+Vectorized entanglement measures for qubit registers. Every function accepts a
+single state or a stacked batch — (batch, 2^n) state vectors, or
+(batch, 2^n, 2^n) density matrices for the mixed-state variants — and returns
+arrays, so parameter sweeps and random-state ensembles are evaluated without a
+Python loop per state.
+
+Qubit 0 is the most significant bit of the basis index, matching np.kron order.
+"""
+
+from itertools import combinations
+import string
+
+import numpy as np
+
+
+# ============================================================================
+# STATE HANDLING
+# ============================================================================
+
+def num_qubits(dim):
+    """Number of qubits for a Hilbert-space dimension 2^n."""
+    n = int(dim).bit_length() - 1
+    if 1 << n != dim:
+        raise ValueError(f"Dimension {dim} is not a power of two")
+    return n
+
+
+def as_state_batch(states):
+    """View state vectors as a (batch, 2^n) complex array; returns (batch, n_qubits, was_single)."""
+    states = np.asarray(states, dtype=complex)
+    single = states.ndim == 1
+    states = np.atleast_2d(states)
+    return states, num_qubits(states.shape[-1]), single
+
+
+def as_density_batch(rho):
+    """View density matrices as a (batch, 2^n, 2^n) complex array; returns (batch, n_qubits, was_single)."""
+    rho = np.asarray(rho, dtype=complex)
+    single = rho.ndim == 2
+    rho = rho[None] if single else rho
+    return rho, num_qubits(rho.shape[-1]), single
+
+
+def density_matrices(states):
+    """|ψ⟩⟨ψ| for one state vector or a (batch, 2^n) stack."""
+    psi, _, single = as_state_batch(states)
+    return _unstack(psi[:, :, None] * psi[:, None, :].conj(), single)
+
+
+def random_states(batch, n_qubits, seed=None):
+    """Haar-random pure states as a (batch, 2^n) array (normalized complex Gaussians)."""
+    rng = np.random.default_rng(seed)
+    psi = rng.standard_normal((batch, 2**n_qubits)) + 1j * rng.standard_normal((batch, 2**n_qubits))
+    return psi / np.linalg.norm(psi, axis=1, keepdims=True)
+
+
+def _unstack(values, single):
+    """Drop the batch axis again for single-state input."""
+    return values[0] if single else values
+
+
+# ============================================================================
+# PARTIAL TRACE & SCHMIDT DECOMPOSITION
+# ============================================================================
+
+def _split_subsystem(psi, n, keep):
+    """Reshape (batch, 2^n) amplitudes into (batch, 2^|keep|, 2^(n-|keep|)) matrices."""
+    keep = sorted(keep)
+    rest = [q for q in range(n) if q not in keep]
+    tensor = psi.reshape((len(psi),) + (2,) * n)
+    tensor = tensor.transpose([0] + [q + 1 for q in keep] + [q + 1 for q in rest])
+    return tensor.reshape(len(psi), 2**len(keep), 2**len(rest))
+
+
+def partial_trace(states, keep):
+    """Reduced density matrices of the qubits in keep for pure states, via one batched matrix product."""
+    psi, n, single = as_state_batch(states)
+    m = _split_subsystem(psi, n, keep)
+    return _unstack(m @ m.conj().transpose(0, 2, 1), single)
+
+
+def partial_trace_density(rho, keep):
+    """Reduced density matrices of the qubits in keep for (batch of) density matrices.
+
+    One einsum contracts the row and column index of every traced-out qubit.
+    """
+    rho, n, single = as_density_batch(rho)
+    keep = sorted(keep)
+    letters = string.ascii_letters
+    rows = letters[:n]
+    cols = ''.join(letters[n + q] if q in keep else rows[q] for q in range(n))
+    out = ''.join(rows[q] for q in keep) + ''.join(cols[q] for q in keep)
+    reduced = np.einsum(f"Z{rows}{cols}->Z{out}", rho.reshape((len(rho),) + (2,) * (2 * n)))
+    d = 2**len(keep)
+    return _unstack(reduced.reshape(len(rho), d, d), single)
+
+
+def schmidt_coefficients(states, subsystem):
+    """Schmidt coefficients √λᵢ of pure states across the cut subsystem | rest, largest first."""
+    psi, n, single = as_state_batch(states)
+    return _unstack(np.linalg.svd(_split_subsystem(psi, n, subsystem), compute_uv=False), single)
+
+
+# ============================================================================
+# ENTANGLEMENT MEASURES
+# ============================================================================
+
+def von_neumann_entropy(rho, base=2):
+    """S(ρ) = −Tr ρ log ρ for one density matrix or a (batch, d, d) stack."""
+    eigenvalues = np.clip(np.linalg.eigvalsh(rho), 0.0, None)
+    return _shannon(eigenvalues, base)
+
+
+def _shannon(p, base):
+    """Entropy of probability vectors along the last axis, ignoring numerical zeros."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(p > 1e-12, p * np.log(p), 0.0)
+    return -terms.sum(axis=-1) / np.log(base)
+
+
+def entanglement_entropy(states, subsystem, base=2):
+    """Entanglement entropy of pure states across subsystem | rest.
+
+    Schmidt weights are the eigenvalues of the smaller reduced density matrix,
+    which is much cheaper than an SVD of the full amplitude matrix.
+    """
+    psi, n, single = as_state_batch(states)
+    m = _split_subsystem(psi, n, subsystem)
+    if m.shape[1] > m.shape[2]:
+        m = m.transpose(0, 2, 1)
+    weights = np.clip(np.linalg.eigvalsh(m @ m.conj().transpose(0, 2, 1)), 0.0, None)
+    return _unstack(_shannon(weights, base), single)
+
+
+def bipartitions(n_qubits):
+    """Every distinct cut A | B of n qubits, given by the side A (A and its complement are one cut)."""
+    cuts = []
+    for size in range(1, n_qubits // 2 + 1):
+        for subset in combinations(range(n_qubits), size):
+            if 2 * size == n_qubits and 0 not in subset:
+                continue  # equal halves: keep only the side holding qubit 0
+            cuts.append(subset)
+    return cuts
+
+
+def bipartition_entropies(states, base=2):
+    """Entanglement entropy across every bipartition; returns (cuts, (batch, n_cuts) array)."""
+    psi, n, single = as_state_batch(states)
+    cuts = bipartitions(n)
+    entropies = np.empty((len(psi), len(cuts)))
+    for j, cut in enumerate(cuts):
+        entropies[:, j] = entanglement_entropy(psi, cut, base)
+    return cuts, _unstack(entropies, single)
+
+
+def concurrence(states):
+    """Concurrence of pure two-qubit states: 2|a₀₀a₁₁ − a₀₁a₁₀| = |⟨ψ|σy⊗σy|ψ*⟩|."""
+    psi, n, single = as_state_batch(states)
+    if n != 2:
+        raise ValueError("Concurrence is defined for two-qubit states")
+    return _unstack(2 * np.abs(psi[:, 0] * psi[:, 3] - psi[:, 1] * psi[:, 2]), single)
+
+
+def concurrence_mixed(rho):
+    """Wootters concurrence max(0, λ₁ − λ₂ − λ₃ − λ₄) of two-qubit density matrices."""
+    rho, n, single = as_density_batch(rho)
+    if n != 2:
+        raise ValueError("Concurrence is defined for two-qubit states")
+    sigma_yy = np.array([[0, 0, 0, -1], [0, 0, 1, 0], [0, 1, 0, 0], [-1, 0, 0, 0]], dtype=complex)
+    rho_tilde = sigma_yy @ rho.conj() @ sigma_yy
+    # λᵢ are the square roots of the (real, non-negative) eigenvalues of ρρ̃
+    lambdas = np.sqrt(np.clip(np.linalg.eigvals(rho @ rho_tilde).real, 0.0, None))
+    lambdas = -np.sort(-lambdas, axis=1)
+    return _unstack(np.maximum(0.0, lambdas[:, 0] - lambdas[:, 1:].sum(axis=1)), single)
+
+
+def partial_transpose(rho, subsystem):
+    """Partial transpose ρ^{T_A} over the qubits in subsystem."""
+    rho, n, single = as_density_batch(rho)
+    tensor = rho.reshape((len(rho),) + (2,) * (2 * n))
+    axes = list(range(2 * n + 1))
+    for q in subsystem:
+        axes[q + 1], axes[n + q + 1] = axes[n + q + 1], axes[q + 1]
+    return _unstack(tensor.transpose(axes).reshape(rho.shape), single)
+
+
+def negativity(rho, subsystem=(0,), logarithmic=False):
+    """Negativity (‖ρ^{T_A}‖₁ − 1)/2 of density matrices, or log₂‖ρ^{T_A}‖₁ when logarithmic."""
+    eigenvalues = np.linalg.eigvalsh(partial_transpose(rho, subsystem))
+    trace_norm = np.abs(eigenvalues).sum(axis=-1)
+    return np.log2(trace_norm) if logarithmic else (trace_norm - 1) / 2
+
+
+def page_entropy(n_a, n_b):
+    """Page's average entanglement entropy (bits) of an n_a | n_b cut of a Haar-random state."""
+    m, n = sorted((2**n_a, 2**n_b))
+    return (np.sum(1.0 / np.arange(n + 1, m * n + 1)) - (m - 1) / (2 * n)) / np.log(2)
@@ -0,0 +1,285 @@
+"""
+Figure Optimizer
+Trace-coalescing pass for Plotly figures. Decorative effects — glow layers,
+fading trails, one trace per graph edge, one text trace per axis label — are
+drawn as dozens of traces that differ only in properties Plotly accepts per
+point, and the browser pays a separate SVG/WebGL setup for every trace.
+
+coalesce_traces merges such traces into one trace — for 2D charts only runs
+of consecutive traces, so the drawing order is unchanged, for 3D charts any
+group, whose drawing order WebGL resolves by depth. Line geometry is
+concatenated with None breaks, per-point-capable properties
+(marker size/colour/symbol, text and text font, 3D line colour, ...) become
+arrays, and the trace opacity of 3D traces is folded into their colours. 3D
+line widths are snapped to whole pixels so stacked glow layers share traces.
+optimize_plotly_charts() installs the pass in front of every st.plotly_chart.
+"""
+
+from functools import lru_cache
+import functools
+import json
+import re
+
+import plotly.graph_objects as go
+
+
+TRACE_CLASSES = {'scatter': go.Scatter, 'scattergl': go.Scattergl, 'scatter3d': go.Scatter3d}
+
+COORDINATES = {'scatter': ('x', 'y'), 'scattergl': ('x', 'y'), 'scatter3d': ('x', 'y', 'z')}
+
+LINE_WIDTH_STEP = {'scatter3d': 1.0}  # px; sub-pixel differences between glow layers are invisible
+
+_installed = False
+
+_COLOR_PATTERN = re.compile(r'rgba?\(\s*([\d.]+)\s*,\s*([\d.]+)\s*,\s*([\d.]+)\s*(?:,\s*([\d.]+)\s*)?\)')
+
+
+# ============================================================================
+# TRACE DECOMPOSITION
+# ============================================================================
+
+@lru_cache(maxsize=256)
+def _array_ok(trace_type, path):
+    """Whether Plotly accepts a per-point array for this (dotted) trace property."""
+    node = TRACE_CLASSES[trace_type]()
+    *parents, leaf = path.split('.')
+    try:
+        for part in parents:
+            node = node[part]
+        validator = node._validators[leaf]
+    except (KeyError, ValueError, TypeError, AttributeError):
+        return False
+    return bool(getattr(validator, 'array_ok', False))
+
+
+def _flatten(spec, prefix=''):
+    """Nested trace dict → {'marker.line.color': value, ...}."""
+    flat = {}
+    for key, value in spec.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def _unflatten(flat):
+    """Inverse of _flatten."""
+    spec = {}
+    for path, value in flat.items():
+        *parents, leaf = path.split('.')
+        node = spec
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = value
+    return spec
+
+
+def _is_sequence(value):
+    return hasattr(value, '__len__') and not isinstance(value, (str, bytes, dict))
+
+
+def _parse_color(color):
+    """(r, g, b, a) for hex and rgb()/rgba() strings, else None."""
+    if not isinstance(color, str):
+        return None
+    color = color.strip()
+    if color.startswith('#') and len(color) in (4, 7):
+        digits = color[1:] if len(color) == 7 else ''.join(c * 2 for c in color[1:])
+        try:
+            return int(digits[0:2], 16), int(digits[2:4], 16), int(digits[4:6], 16), 1.0
+        except ValueError:
+            return None
+    match = _COLOR_PATTERN.fullmatch(color)
+    if match is None:
+        return None
+    r, g, b, a = match.groups()
+    return float(r), float(g), float(b), 1.0 if a is None else float(a)
+
+
+def _fade(color, opacity):
+    """Colour with its alpha multiplied by opacity (None if the colour cannot be parsed)."""
+    if _is_sequence(color):
+        faded = [_fade(c, opacity) for c in color]
+        return None if any(c is None for c in faded) else faded
+    rgba = _parse_color(color)
+    if rgba is None:
+        return None
+    r, g, b, a = rgba
+    return f"rgba({r:g}, {g:g}, {b:g}, {a * opacity:.4g})"
+
+
+def _fold_opacity(spec):
+    """Move a 3D trace's opacity into the alpha of every colour it draws; False if not possible."""
+    mode = spec.get('mode', 'lines+markers')
+    needed = []
+    if 'lines' in mode:
+        needed.append('line.color')
+    if 'markers' in mode:
+        needed.append('marker.color')
+        if 'marker.line.width' in spec:
+            needed.append('marker.line.color')
+    if 'text' in mode:
+        needed.append('textfont.color')
+    faded = {key: _fade(spec.get(key), spec['opacity']) for key in needed}
+    if any(value is None for value in faded.values()):
+        return False
+    spec.update(faded)
+    del spec['opacity']
+    return True
+
+
+def _decompose(trace, legend_shown):
+    """Split a trace into (signature, shared style, per-point columns), or None if it must stay as is."""
+    trace_type = trace.type
+    if trace_type not in TRACE_CLASSES:
+        return None
+    spec = _flatten(trace.to_plotly_json())
+    spec.pop('type', None)
+    spec.pop('uid', None)
+    if legend_shown and spec.get('showlegend') is not False:
+        return None
+    if 'ids' in spec or 'selectedpoints' in spec or spec.get('connectgaps'):
+        return None
+    if spec.get('fill', 'none') not in ('none', 'toself'):
+        return None
+    coordinates = COORDINATES[trace_type]
+    if any(not _is_sequence(spec.get(axis)) for axis in coordinates):
+        return None
+    n_points = len(spec[coordinates[0]])
+    if n_points == 0 or any(len(spec[axis]) != n_points for axis in coordinates):
+        return None
+    if 'mode' not in spec:
+        if 'stackgroup' in spec:
+            return None
+        # Plotly's default depends on this trace's own point count; pin it before merging changes that
+        spec['mode'] = 'lines+markers' if trace_type == 'scatter3d' or n_points < 20 else 'lines'
+
+    if trace_type == 'scatter3d' and spec.get('opacity', 1) < 1 and not _fold_opacity(spec):
+        return None
+    step = LINE_WIDTH_STEP.get(trace_type)
+    if step and isinstance(spec.get('line.width'), (int, float)):
+        spec['line.width'] = max(step, round(spec['line.width'] / step) * step)
+    if spec.get('hoverinfo') in ('skip', 'none') and spec.get('showlegend') is False:
+        spec.pop('name', None)  # invisible: neither hover nor legend shows it
+
+    colour_scaled = {prefix for prefix in ('marker', 'line')
+                     if any(key.startswith(f"{prefix}.") and key.split('.')[1] in ('colorscale', 'coloraxis', 'cmin', 'cmax')
+                            for key in spec)}
+    columns = {axis: list(spec.pop(axis)) for axis in coordinates}
+    if 'customdata' in spec:
+        columns['customdata'] = spec.pop('customdata')
+    for key in list(spec):
+        if key.split('.')[0] in colour_scaled and key.endswith('color'):
+            continue
+        if _array_ok(trace_type, key):
+            value = spec.pop(key)
+            columns[key] = list(value) if _is_sequence(value) else [value] * n_points
+    if any(not _is_sequence(values) or len(values) != n_points for values in columns.values()):
+        return None
+    columns = {key: list(values) for key, values in columns.items()}
+
+    signature = (trace_type, tuple(sorted(columns)), json.dumps(spec, sort_keys=True, default=str))
+    return signature, spec, columns
+
+
+# ============================================================================
+# COALESCING
+# ============================================================================
+
+def _merge(trace_type, spec, parts):
+    """One trace dict from a group's shared style and per-point columns, with None breaks between line pieces."""
+    coordinates = COORDINATES[trace_type]
+    needs_breaks = 'lines' in spec.get('mode', 'lines') or spec.get('fill') == 'toself'
+    merged = {key: [] for key in parts[0]}
+    for index, columns in enumerate(parts):
+        for key, values in columns.items():
+            if index and needs_breaks:
+                merged[key].append(None if key in coordinates else values[0])
+            merged[key].extend(values)
+    for key, values in merged.items():
+        if key not in coordinates and key != 'customdata' and all(v == values[0] for v in values):
+            merged[key] = values[0]  # uniform: ship a scalar, not an array
+    return dict(_unflatten({**spec, **merged}), type=trace_type)
+
+
+def coalesce_traces(fig):
+    """Merge same-style scatter traces of a figure in place and return it.
+
+    2D traces draw in list order, so only consecutive traces are merged there;
+    3D groups may span the trace list and take the position of their first trace.
+    Figures with animation frames are left alone (frames address traces by index).
+    """
+    if not isinstance(fig, go.Figure) or fig.frames or len(fig.data) < 3:
+        return fig
+    legend_shown = fig.layout.showlegend is not False
+    groups = {}
+    order = []
+    previous, run_start = None, None
+    for index, trace in enumerate(fig.data):
+        decomposed = _decompose(trace, legend_shown)
+        if decomposed is None:
+            order.append(index)
+            previous = None
+            continue
+        signature, spec, columns = decomposed
+        if signature != previous:
+            run_start = index
+        previous = signature
+        key = (signature, None if signature[0] == 'scatter3d' else run_start)
+        if key not in groups:
+            groups[key] = (spec, [], [])
+            order.append(key)
+        groups[key][1].append(index)
+        groups[key][2].append(columns)
+    if len(order) == len(fig.data):
+        return fig
+
+    merged = [item for item in order if isinstance(item, tuple) and len(groups[item][1]) > 1]
+    n_original = len(fig.data)
+    fig.add_traces([_merge(key[0][0], groups[key][0], groups[key][2]) for key in merged])
+    new_index = {key: n_original + k for k, key in enumerate(merged)}
+    layout_order = []
+    for item in order:
+        if not isinstance(item, tuple):
+            layout_order.append(item)
+        else:
+            layout_order.append(new_index.get(item, groups[item][1][0]))
+    fig.data = [fig.data[i] for i in layout_order]
+    return fig
+
+
+# ============================================================================
+# STREAMLIT INTEGRATION
+# ============================================================================
+
+def _wrap_plotly_chart(method):
+    @functools.wraps(method, updated=())
+    def plotly_chart(self, figure_or_data, *args, **kwargs):
+        return method(self, coalesce_traces(figure_or_data), *args, **kwargs)
+    plotly_chart._figure_optimized = True
+    return plotly_chart
+
+
+def optimize_plotly_charts():
+    """Run coalesce_traces on every figure passed to st.plotly_chart (once per process).
+
+    A hook left by a previous import of this module (Streamlit reloads edited
+    modules) is replaced rather than stacked.
+    """
+    global _installed
+    if _installed:
+        return
+    import streamlit as st
+    from streamlit.delta_generator import DeltaGenerator
+
+    method = DeltaGenerator.plotly_chart
+    if getattr(method, '_figure_optimized', False):
+        method = method.__wrapped__
+    wrapped = _wrap_plotly_chart(method)
+    DeltaGenerator.plotly_chart = wrapped
+    # st.plotly_chart is bound to the main container at import time
+    alias = st.plotly_chart
+    main = alias.args[0] if isinstance(alias, functools.partial) else alias.__self__
+    st.plotly_chart = functools.partial(wrapped, main)
+    _installed = True
@@ -0,0 +1,235 @@
+"""
+Potential-energy-surface table generator
+Computes the two-qubit Hamiltonians of H₂ and minimal LiH over a grid of bond
+lengths and writes them to data/pes_tables.json (loaded by pes.py).
+
+Chemistry model: STO-3G s-type contracted Gaussians, closed-shell RHF, and a
+two-electron / two-orbital active space (LiH: Li 1s frozen, Li 2p omitted).
+The Sz = 0 block of the active-space Hamiltonian — determinants |a b⟩ with the
+α electron in orbital a and the β electron in orbital b — is written on two
+qubits (qubit 0 = α orbital, qubit 1 = β orbital, Hartree–Fock = |00⟩) and
+decomposed into Pauli strings. Its lowest eigenvalue is the exact (CASCI)
+energy; core and nuclear-repulsion energies are folded into the II term.
+
+Usage:
+    python generate_pes_tables.py                 # writes data/pes_tables.json
+"""
+
+from itertools import product
+import json
+import os
+
+import numpy as np
+from scipy.special import erf
+
+
+ANGSTROM_TO_BOHR = 1 / 0.52917721092
+
+# STO-3G contractions: (exponents, coefficients)
+STO3G = {
+    'H 1s': ([3.42525091, 0.62391373, 0.16885540], [0.15432897, 0.53532814, 0.44463454]),
+    'Li 1s': ([16.1195750, 2.93620070, 0.79465050], [0.15432897, 0.53532814, 0.44463454]),
+    'Li 2s': ([0.63628970, 0.14786010, 0.04808870], [-0.09996723, 0.39951283, 0.70011547]),
+}
+
+MOLECULES = {
+    'H2': {
+        'atoms': [('H', 1.0, ['H 1s']), ('H', 1.0, ['H 1s'])],
+        'electrons': 2, 'frozen_core': 0,
+        'distances': np.round(np.linspace(0.30, 2.75, 50), 4),
+    },
+    'LiH': {
+        'atoms': [('Li', 3.0, ['Li 1s', 'Li 2s']), ('H', 1.0, ['H 1s'])],
+        'electrons': 4, 'frozen_core': 1,
+        'distances': np.round(np.linspace(0.90, 4.00, 50), 4),
+    },
+}
+
+PAULI = {
+    'I': np.eye(2), 'X': np.array([[0, 1], [1, 0]]),
+    'Y': np.array([[0, -1j], [1j, 0]]), 'Z': np.diag([1, -1]),
+}
+
+
+# ============================================================================
+# GAUSSIAN INTEGRALS (s-type primitives, Szabo & Ostlund appendix A)
+# ============================================================================
+
+def boys0(t):
+    """F₀(t) = ½ √(π/t) erf(√t), with F₀(0) = 1."""
+    t = np.asarray(t, dtype=float)
+    safe = np.where(t < 1e-12, 1.0, t)
+    return np.where(t < 1e-12, 1 - t / 3, 0.5 * np.sqrt(np.pi / safe) * erf(np.sqrt(safe)))
+
+
+def basis_functions(molecule, bond_length):
+    """[(exponents, normalized coefficients, centre)] for atoms on the z axis at 0 and R."""
+    functions = []
+    for (_, _, shells), z in zip(molecule['atoms'], (0.0, bond_length * ANGSTROM_TO_BOHR)):
+        for shell in shells:
+            alpha, coeffs = map(np.array, STO3G[shell])
+            functions.append((alpha, coeffs * (2 * alpha / np.pi)**0.75, np.array([0.0, 0.0, z])))
+    return functions
+
+
+def one_electron_integrals(functions, nuclei):
+    """Overlap S and core Hamiltonian T + V over contracted functions."""
+    n = len(functions)
+    S, T, V = np.zeros((n, n)), np.zeros((n, n)), np.zeros((n, n))
+    for i, j in product(range(n), repeat=2):
+        (a, ca, A), (b, cb, B) = functions[i], functions[j]
+        p = a[:, None] + b[None, :]
+        mu = a[:, None] * b[None, :] / p
+        ab2 = np.sum((A - B)**2)
+        K = np.exp(-mu * ab2)
+        weight = ca[:, None] * cb[None, :]
+        s = (np.pi / p)**1.5 * K
+        S[i, j] = np.sum(weight * s)
+        T[i, j] = np.sum(weight * mu * (3 - 2 * mu * ab2) * s)
+        P = (a[:, None, None] * A + b[None, :, None] * B) / p[..., None]
+        for charge, C in nuclei:
+            V[i, j] -= np.sum(weight * 2 * np.pi / p * charge * K * boys0(p * np.sum((P - C)**2, axis=-1)))
+    return S, T + V
+
+
+def electron_repulsion_integrals(functions):
+    """(ij|kl) in chemists' notation over contracted functions."""
+    n = len(functions)
+    eri = np.zeros((n, n, n, n))
+    pairs = {}
+    for i, j in product(range(n), repeat=2):
+        (a, ca, A), (b, cb, B) = functions[i], functions[j]
+        p = (a[:, None] + b[None, :]).ravel()
+        K = np.exp(-(a[:, None] * b[None, :]).ravel() / p * np.sum((A - B)**2))
+        P = ((a[:, None, None] * A + b[None, :, None] * B).reshape(-1, 3)) / p[:, None]
+        pairs[i, j] = (p, (ca[:, None] * cb[None, :]).ravel() * K, P)
+    for i, j, k, l in product(range(n), repeat=4):
+        p, wp, P = pairs[i, j]
+        q, wq, Q = pairs[k, l]
+        pq = p[:, None] + q[None, :]
+        rho = p[:, None] * q[None, :] / pq
+        pq2 = np.sum((P[:, None, :] - Q[None, :, :])**2, axis=-1)
+        values = 2 * np.pi**2.5 / (p[:, None] * q[None, :] * np.sqrt(pq)) * boys0(rho * pq2)
+        eri[i, j, k, l] = np.sum(wp[:, None] * wq[None, :] * values)
+    return eri
+
+
+# ============================================================================
+# HARTREE–FOCK AND ACTIVE SPACE
+# ============================================================================
+
+def restricted_hartree_fock(S, H, eri, n_occupied, tol=1e-11, max_iter=500):
+    """Closed-shell RHF; returns (electronic energy, MO coefficients)."""
+    evals, evecs = np.linalg.eigh(S)
+    X = evecs @ np.diag(evals**-0.5) @ evecs.T
+    C = X @ np.linalg.eigh(X.T @ H @ X)[1]
+    energy = 0.0
+    for _ in range(max_iter):
+        D = 2 * C[:, :n_occupied] @ C[:, :n_occupied].T
+        F = H + np.einsum('ls,mnsl->mn', D, eri) - 0.5 * np.einsum('ls,mlsn->mn', D, eri)
+        new_energy = 0.5 * np.sum(D * (H + F))
+        C = X @ np.linalg.eigh(X.T @ F @ X)[1]
+        if abs(new_energy - energy) < tol:
+            break
+        energy = new_energy
+    return new_energy, C
+
+
+def fock_operators(n_spin_orbitals):
+    """Jordan–Wigner annihilation operators as dense matrices."""
+    lower = np.array([[0, 1], [0, 0]])
+    ops = []
+    for p in range(n_spin_orbitals):
+        factors = [PAULI['Z']] * p + [lower] + [PAULI['I']] * (n_spin_orbitals - p - 1)
+        op = factors[0]
+        for factor in factors[1:]:
+            op = np.kron(op, factor)
+        ops.append(op.real)
+    return ops
+
+
+def active_space_matrix(h, eri, constant):
+    """4 × 4 Hamiltonian over determinants |a b⟩ (α in orbital a, β in orbital b) of 2 electrons in 2 orbitals."""
+    # spin orbitals: 0α, 1α, 0β, 1β
+    a = fock_operators(4)
+    spatial = [0, 1, 0, 1]
+    spin = [0, 0, 1, 1]
+    H = constant * np.eye(16)
+    for p, q in product(range(4), repeat=2):
+        if spin[p] == spin[q]:
+            H += h[spatial[p], spatial[q]] * a[p].T @ a[q]
+    for p, q, r, s in product(range(4), repeat=4):
+        if spin[p] == spin[q] and spin[r] == spin[s]:
+            H += 0.5 * eri[spatial[p], spatial[q], spatial[r], spatial[s]] * a[p].T @ a[r].T @ a[s] @ a[q]
+    vacuum = np.zeros(16)
+    vacuum[0] = 1
+    determinants = [a[alpha].T @ a[2 + beta].T @ vacuum for alpha, beta in product(range(2), repeat=2)]
+    basis = np.array(determinants).T
+    return basis.T @ H @ basis
+
+
+def pauli_decomposition(matrix, tol=1e-10):
+    """{label: coefficient} of a real symmetric 4 × 4 matrix on two qubits."""
+    terms = {}
+    for first, second in product('IXYZ', repeat=2):
+        coeff = np.trace(np.kron(PAULI[first], PAULI[second]) @ matrix).real / 4
+        if abs(coeff) > tol:
+            terms[first + second] = coeff
+    return terms
+
+
+def geometry_hamiltonian(molecule, bond_length):
+    """(Pauli terms, Hartree–Fock total energy) at one bond length."""
+    functions = basis_functions(molecule, bond_length)
+    charges = [charge for _, charge, _ in molecule['atoms']]
+    R = bond_length * ANGSTROM_TO_BOHR
+    nuclei = [(charges[0], np.zeros(3)), (charges[1], np.array([0.0, 0.0, R]))]
+    nuclear_repulsion = charges[0] * charges[1] / R
+
+    S, H = one_electron_integrals(functions, nuclei)
+    eri = electron_repulsion_integrals(functions)
+    e_hf, C = restricted_hartree_fock(S, H, eri, molecule['electrons'] // 2)
+
+    h_mo = C.T @ H @ C
+    eri_mo = np.einsum('pi,qj,rk,sl,pqrs->ijkl', C, C, C, C, eri)
+    core = list(range(molecule['frozen_core']))
+    active = [len(core), len(core) + 1]
+    constant = nuclear_repulsion
+    h_active = h_mo[np.ix_(active, active)].copy()
+    for c in core:
+        constant += 2 * h_mo[c, c] + sum(2 * eri_mo[c, c, d, d] - eri_mo[c, d, d, c] for d in core)
+        h_active += 2 * eri_mo[np.ix_(active, active, [c], [c])][..., 0, 0] \
+            - eri_mo[np.ix_(active, [c], [c], active)][:, 0, 0, :]
+    eri_active = eri_mo[np.ix_(active, active, active, active)]
+    return pauli_decomposition(active_space_matrix(h_active, eri_active, constant)), e_hf + nuclear_repulsion
+
+
+def build_tables():
+    tables = {}
+    for name, molecule in MOLECULES.items():
+        rows, hf = [], []
+        for R in molecule['distances']:
+            terms, e_hf = geometry_hamiltonian(molecule, R)
+            rows.append(terms)
+            hf.append(e_hf)
+        labels = sorted({label for row in rows for label in row}, key=lambda l: (l != 'II', l))
+        tables[name] = {
+            'basis': 'STO-3G (s functions)', 'active_space': '2 electrons in 2 orbitals',
+            'frozen_core': molecule['frozen_core'], 'units': {'distance': 'angstrom', 'energy': 'hartree'},
+            'distances': [float(R) for R in molecule['distances']],
+            'labels': labels,
+            'coefficients': [[round(row.get(label, 0.0), 10) for label in labels] for row in rows],
+            'hartree_fock': [round(e, 10) for e in hf],
+        }
+    return tables
+
+
+if __name__ == "__main__":
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'pes_tables.json')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tables = build_tables()
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(tables, f, separators=(',', ':'))
+    for name, table in tables.items():
+        print(f"{name}: {len(table['distances'])} geometries, terms {', '.join(table['labels'])}")
+    print(f"Wrote {path}")
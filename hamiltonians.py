@@ -0,0 +1,159 @@
+"""
+Hamiltonian Library & Exact Reference Energies
+Pauli-sum Hamiltonians used by the VQE, QAOA and time-evolution pages
+(molecular, MaxCut and spin-chain models), assembled into sparse
+CSR matrices (or matrix-free operators for registers too large to store) and
+diagonalized with Lanczos (eigsh) for the exact ground and low-lying energies
+that variational runs are compared against.
+
+Spectra are cached by a hash of the simplified Pauli sum, so every rerun of a
+page with the same Hamiltonian reuses the first diagonalization.
+"""
+
+from collections import OrderedDict
+import hashlib
+
+import numpy as np
+from scipy.sparse.linalg import eigsh
+
+from pauli import PauliSum
+
+
+DENSE_DIMENSION = 64            # at or below this size np.linalg.eigh is faster than Lanczos
+SPARSE_NONZEROS = 2**22         # above this many stored entries use the matrix-free operator
+SPECTRUM_CACHE_SIZE = 64
+LANCZOS_TOLERANCE = 1e-9        # residual tolerance; eigenvalue errors are of order tol² · ‖H‖
+
+# H₂ in STO-3G at R = 0.735 Å: parity mapping with two-qubit reduction (electronic part, Hartree)
+H2_ELECTRONIC = PauliSum.from_labels({
+    'II': -1.052373245772859,
+    'IZ': 0.39793742484318045,
+    'ZI': -0.39793742484318045,
+    'ZZ': -0.01128010425623538,
+    'XX': 0.18093119978423156,
+})
+H2_NUCLEAR_REPULSION = 0.7199689944489797
+H2_HAMILTONIAN = H2_ELECTRONIC + H2_NUCLEAR_REPULSION  # total energy; ground state −1.1373 Ha
+
+_spectra = OrderedDict()
+
+
+# ============================================================================
+# HAMILTONIAN BUILDERS
+# ============================================================================
+
+def _two_site(n_qubits, i, j, pauli):
+    label = ['I'] * n_qubits
+    label[i] = label[j] = pauli
+    return ''.join(label)
+
+
+def maxcut_hamiltonian(adj_matrix):
+    """Σ_{(i,j) ∈ E} (Z_i Z_j − 1)/2: the energy of each basis state is minus its cut value."""
+    adj_matrix = np.asarray(adj_matrix)
+    n = len(adj_matrix)
+    edges = [(i, j) for i in range(n) for j in range(i + 1, n) if adj_matrix[i, j]]
+    terms = [(_two_site(n, i, j, 'Z'), 0.5) for i, j in edges] + [('I' * n, -0.5 * len(edges))]
+    return PauliSum.from_labels(terms, n)
+
+
+def _chain_bonds(n_qubits, periodic):
+    return [(i, i + 1) for i in range(n_qubits - 1)] + ([(n_qubits - 1, 0)] if periodic and n_qubits > 2 else [])
+
+
+def transverse_field_ising(n_qubits, coupling=1.0, field=1.0, periodic=True):
+    """−J Σ Z_i Z_{i+1} − h Σ X_i on a chain (ring when periodic)."""
+    terms = [(_two_site(n_qubits, i, j, 'Z'), -coupling) for i, j in _chain_bonds(n_qubits, periodic)]
+    terms += [('I' * i + 'X' + 'I' * (n_qubits - i - 1), -field) for i in range(n_qubits)]
+    return PauliSum.from_labels(terms, n_qubits)
+
+
+def heisenberg_chain(n_qubits, coupling=1.0, anisotropy=1.0, field=0.0, periodic=True):
+    """XXZ chain J Σ (X_i X_{i+1} + Y_i Y_{i+1} + Δ Z_i Z_{i+1}) + h Σ Z_i (Δ = 1: isotropic Heisenberg)."""
+    terms = []
+    for i, j in _chain_bonds(n_qubits, periodic):
+        terms += [(_two_site(n_qubits, i, j, 'X'), coupling), (_two_site(n_qubits, i, j, 'Y'), coupling),
+                  (_two_site(n_qubits, i, j, 'Z'), coupling * anisotropy)]
+    terms += [('I' * i + 'Z' + 'I' * (n_qubits - i - 1), field) for i in range(n_qubits)]
+    return PauliSum.from_labels(terms, n_qubits)
+
+
+def xy_chain(n_qubits, coupling=1.0, gamma=0.0, field=0.0, periodic=True):
+    """Anisotropic XY chain J Σ [(1+γ)/2 X_i X_{i+1} + (1−γ)/2 Y_i Y_{i+1}] + h Σ Z_i."""
+    terms = []
+    for i, j in _chain_bonds(n_qubits, periodic):
+        terms += [(_two_site(n_qubits, i, j, 'X'), coupling * (1 + gamma) / 2),
+                  (_two_site(n_qubits, i, j, 'Y'), coupling * (1 - gamma) / 2)]
+    terms += [('I' * i + 'Z' + 'I' * (n_qubits - i - 1), field) for i in range(n_qubits)]
+    return PauliSum.from_labels(terms, n_qubits)
+
+
+def format_hamiltonian(hamiltonian, digits=4):
+    """'H = -1.0524 * II + 0.3979 * IZ - ...' for display."""
+    text = ""
+    for label, coeff in hamiltonian.terms():
+        value = coeff.real if isinstance(coeff, complex) else coeff
+        if not text:
+            text = f"{value:.{digits}f} * {label}"
+        else:
+            text += f" {'-' if value < 0 else '+'} {abs(value):.{digits}f} * {label}"
+    return f"H = {text or '0'}"
+
+
+# ============================================================================
+# EXACT DIAGONALIZATION
+# ============================================================================
+
+def hamiltonian_key(hamiltonian):
+    """Content hash of a Pauli sum (order- and duplicate-independent)."""
+    hamiltonian = hamiltonian.simplify()
+    digest = hashlib.sha1(np.int64(hamiltonian.n_qubits).tobytes())
+    for array in (hamiltonian.x, hamiltonian.z, np.round(hamiltonian.coeffs, 12)):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def operator(hamiltonian):
+    """The cheapest form eigsh can use: CSR matrix or matrix-free operator (both real for real Hamiltonians)."""
+    n_masks = len(np.unique(hamiltonian.x))
+    if n_masks * 2**hamiltonian.n_qubits > SPARSE_NONZEROS:
+        return hamiltonian.as_linear_operator()
+    return hamiltonian.to_sparse()
+
+
+def _diagonalize(hamiltonian, k):
+    dimension = 2**hamiltonian.n_qubits
+    if dimension <= DENSE_DIMENSION:
+        energies, states = np.linalg.eigh(hamiltonian.to_matrix())
+        return energies[:k], states[:, :k]
+    energies, states = eigsh(operator(hamiltonian), k=min(k, dimension - 2), which='SA', tol=LANCZOS_TOLERANCE)
+    order = np.argsort(energies)
+    return energies[order], states[:, order]
+
+
+def low_energy_spectrum(hamiltonian, k=1):
+    """Lowest k eigenvalues (ascending) and eigenvectors (columns), cached by Hamiltonian hash."""
+    if not hamiltonian.is_hermitian():
+        raise ValueError("Reference energies need a Hermitian Hamiltonian")
+    key = hamiltonian_key(hamiltonian)
+    cached = _spectra.get(key)
+    if cached is None or len(cached[0]) < k:
+        energies, states = _diagonalize(hamiltonian.simplify(), k)
+        energies.flags.writeable = False
+        states.flags.writeable = False
+        cached = _spectra[key] = (energies, states)
+        while len(_spectra) > SPECTRUM_CACHE_SIZE:
+            _spectra.popitem(last=False)
+    _spectra.move_to_end(key)
+    return cached[0][:k], cached[1][:, :k]
+
+
+def ground_state(hamiltonian):
+    """(E₀, |ψ₀⟩) of a Pauli-sum Hamiltonian."""
+    energies, states = low_energy_spectrum(hamiltonian, 1)
+    return float(energies[0]), states[:, 0]
+
+
+def ground_energy(hamiltonian):
+    """Exact ground-state energy E₀."""
+    return ground_state(hamiltonian)[0]
@@ -0,0 +1,171 @@
+"""
+Cross-Validated Model Comparison
+k-fold benchmark of classical and quantum classifiers on the synthetic 2-D
+datasets used by the QML pages.
+
+Models are described by (kind, params) configurations rather than estimator
+objects, so they are hashable and cheap to ship to worker processes. Every
+(model, fold) pair is an independent task: fresh runs spread them over a
+ProcessPoolExecutor, and each RandomForest gets the cores the pool leaves idle
+through n_jobs. Fitted fold models and scores are cached by
+(dataset params, model config, folds, seed), so rerunning a comparison with
+unchanged settings is a dictionary lookup.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import os
+import time
+
+import numpy as np
+from scipy import stats
+
+from quantum_ml import fit_kernel_svm, kernel_svm_predict, train_vqc, vqc_predict_proba
+
+
+CV_FOLDS = 5
+CONFIDENCE = 0.95
+RESULT_CACHE_SIZE = 64
+
+_results = OrderedDict()
+
+
+# ============================================================================
+# DATASETS
+# ============================================================================
+
+def dataset_params(name, n_samples=200, noise=0.15, seed=42):
+    """Hashable description of a synthetic dataset ('moons', 'circles' or 'classification')."""
+    return (name, n_samples, noise, seed)
+
+
+@lru_cache(maxsize=16)
+def make_dataset(params):
+    """(X, y) for dataset_params(...), generated once per process."""
+    from sklearn.datasets import make_circles, make_classification, make_moons
+
+    name, n_samples, noise, seed = params
+    if name == 'moons':
+        X, y = make_moons(n_samples=n_samples, noise=noise, random_state=seed)
+    elif name == 'circles':
+        X, y = make_circles(n_samples=n_samples, noise=noise, factor=0.5, random_state=seed)
+    elif name == 'classification':
+        X, y = make_classification(n_samples=n_samples, n_features=2, n_redundant=0, n_informative=2,
+                                   n_clusters_per_class=1, random_state=seed)
+    else:
+        raise ValueError(f"Unknown dataset '{name}'")
+    X.flags.writeable = False
+    y.flags.writeable = False
+    return X, y
+
+
+# ============================================================================
+# MODELS
+# ============================================================================
+
+def model_config(kind, **params):
+    """Hashable model description: 'svc', 'random_forest', 'mlp', 'quantum_kernel' or 'vqc' plus keyword params."""
+    if kind not in ('svc', 'random_forest', 'mlp', 'quantum_kernel', 'vqc'):
+        raise ValueError(f"Unknown model kind '{kind}'")
+    return (kind, tuple(sorted(params.items())))
+
+
+def _fit(config, X, y, seed, n_jobs):
+    kind, params = config[0], dict(config[1])
+    if kind == 'quantum_kernel':
+        return fit_kernel_svm(X, y, seed=seed, **params)
+    if kind == 'vqc':
+        return train_vqc(X, y, seed=seed, **params)
+
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.neural_network import MLPClassifier
+    from sklearn.svm import SVC
+
+    if kind == 'random_forest':
+        return RandomForestClassifier(random_state=seed, n_jobs=n_jobs, **params).fit(X, y)
+    estimator = SVC if kind == 'svc' else MLPClassifier
+    return estimator(random_state=seed, **params).fit(X, y)
+
+
+def _predict(config, model, X):
+    kind = config[0]
+    if kind == 'quantum_kernel':
+        return kernel_svm_predict(model, X)
+    if kind == 'vqc':
+        return (vqc_predict_proba(model['params'], X, model['n_qubits'], model['n_layers']) > 0.5).astype(int)
+    return model.predict(X)
+
+
+# ============================================================================
+# CROSS-VALIDATION
+# ============================================================================
+
+def _run_fold(data, config, folds, fold, seed, n_jobs):
+    """Fit one model on one training fold and score it on the held-out fold (runs in a worker process)."""
+    from sklearn.model_selection import StratifiedKFold
+
+    X, y = make_dataset(data)
+    train, test = list(StratifiedKFold(folds, shuffle=True, random_state=seed).split(X, y))[fold]
+    lo, hi = X[train].min(axis=0), X[train].max(axis=0)
+    scale = lambda features: 2 * (features - lo) / (hi - lo) - 1     # [−1, 1] on the training fold
+    start = time.perf_counter()
+    model = _fit(config, scale(X[train]), y[train], seed, n_jobs)
+    seconds = time.perf_counter() - start
+    return model, float(np.mean(_predict(config, model, scale(X[test])) == y[test])), seconds
+
+
+def confidence_interval(scores, confidence=CONFIDENCE):
+    """Student-t interval (low, high) for the mean fold accuracy, clipped to [0, 1]."""
+    scores = np.asarray(scores)
+    if len(scores) < 2:
+        return float(scores.mean()), float(scores.mean())
+    half = stats.t.ppf(0.5 + confidence / 2, len(scores) - 1) * scores.std(ddof=1) / np.sqrt(len(scores))
+    return float(max(scores.mean() - half, 0.0)), float(min(scores.mean() + half, 1.0))
+
+
+def compare_models(data, models, folds=CV_FOLDS, seed=0, workers=None, confidence=CONFIDENCE):
+    """k-fold accuracy of every model in {name: model_config(...)} on dataset_params(...).
+
+    Uncached (model, fold) tasks go to a ProcessPoolExecutor with `workers`
+    processes (default: one per task, capped at the CPU count); workers=1 runs
+    them in this process. Returns a dict: model (names), scores (models × folds),
+    mean, ci_low, ci_high, fit_seconds (summed over folds), cached (per model)
+    and fitted ({name: fold models}).
+    """
+    keys = {name: (data, config, folds, seed) for name, config in models.items()}
+    missing = [name for name, key in keys.items() if key not in _results]
+    tasks = [(name, fold) for name in missing for fold in range(folds)]
+    fresh = {}
+    if tasks:
+        cpus = os.cpu_count() or 1
+        workers = min(len(tasks), cpus) if workers is None else workers
+        n_jobs = max(1, cpus // workers)
+        args = [(data, models[name], folds, fold, seed, n_jobs) for name, fold in tasks]
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(_run_fold, *zip(*args)))
+        else:
+            outcomes = [_run_fold(*a) for a in args]
+        fresh = {name: outcomes[i * folds:(i + 1) * folds] for i, name in enumerate(missing)}
+
+    # Read this call's hits before trimming, then mark every entry used here as most recent
+    runs = [fresh[name] if name in fresh else _results[keys[name]] for name in models]
+    for name, run in zip(models, runs):
+        _results[keys[name]] = run
+        _results.move_to_end(keys[name])
+    while len(_results) > RESULT_CACHE_SIZE:
+        _results.popitem(last=False)
+
+    scores = np.array([[score for _, score, _ in run] for run in runs])
+    intervals = np.array([confidence_interval(row, confidence) for row in scores]).reshape(-1, 2)
+    return {
+        'model': list(models),
+        'scores': scores,
+        'mean': scores.mean(axis=1),
+        'ci_low': intervals[:, 0],
+        'ci_high': intervals[:, 1],
+        'fit_seconds': np.array([sum(seconds for _, _, seconds in run) for run in runs]),
+        'cached': np.array([name not in missing for name in models]),
+        'fitted': {name: [model for model, _, _ in run] for name, run in zip(models, runs)},
+    }
@@ -0,0 +1,360 @@
+"""
+Pauli-String Algebra
+Weighted sums of Pauli strings stored as X/Z bitmask integer arrays with
+complex coefficients, and expectation values evaluated directly on
+statevectors and density matrices without building 2^n × 2^n matrices.
+
+A string with masks (x, z) is P = i^{|x∧z|} X^x Z^z, so Y = iXZ and every
+single-qubit factor is I, X, Y or Z. Qubit 0 is the leftmost label character
+and the most significant bit of a basis index (np.kron order). On a basis
+state P|b⟩ = i^{|x∧z|} (−1)^{|z∧b|} |b ⊕ x⟩, so ⟨ψ|P|ψ⟩ needs one index
+permutation (shared by all strings with the same x mask) and a sign pattern;
+groups with many z masks get every sign sum from one Walsh–Hadamard transform.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+PAULI_BITS = {'I': (0, 0), 'X': (1, 0), 'Y': (1, 1), 'Z': (0, 1)}
+
+_BIT_LABELS = {bits: label for label, bits in PAULI_BITS.items()}
+
+
+# ============================================================================
+# BIT UTILITIES
+# ============================================================================
+
+def popcount(values):
+    """Number of set bits of each entry of a uint64 array."""
+    values = np.asarray(values, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values).astype(np.int64)
+    v = values - ((values >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    v = (v & np.uint64(0x3333333333333333)) + ((v >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    v = (v + (v >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return ((v * np.uint64(0x0101010101010101)) >> np.uint64(56)).astype(np.int64)
+
+
+@lru_cache(maxsize=8)
+def basis_indices(n_qubits):
+    """Basis-state indices 0 … 2^n − 1 as uint64 (read-only, cached)."""
+    indices = np.arange(2**n_qubits, dtype=np.uint64)
+    indices.flags.writeable = False
+    return indices
+
+
+def walsh_hadamard(values):
+    """Unnormalized Walsh–Hadamard transform along the last axis: out[z] = Σ_b (−1)^{|z∧b|} values[b]."""
+    n_qubits = int(np.log2(values.shape[-1]))
+    batch = values.shape[:-1]
+    out = values.reshape(batch + (2,) * n_qubits)
+    for axis in range(len(batch), out.ndim):
+        first, second = np.take(out, 0, axis=axis), np.take(out, 1, axis=axis)
+        out = np.stack([first + second, first - second], axis=axis)
+    return out.reshape(values.shape)
+
+
+def _flip_axes(x_mask, n_qubits, offset=0):
+    """Axes of the (2,)*n tensor view that an X mask flips: b ↦ b ⊕ x (qubit q ↔ bit n − 1 − q)."""
+    return tuple(offset + q for q in range(n_qubits) if (int(x_mask) >> (n_qubits - 1 - q)) & 1)
+
+
+def sign_pattern(z_mask, n_qubits):
+    """(−1)^{|z∧b|} for every basis index b (float vector), built as an outer product of half-register patterns."""
+    if n_qubits > 12:
+        low = n_qubits // 2
+        z_mask = int(z_mask)
+        return np.outer(sign_pattern(z_mask >> low, n_qubits - low),
+                        sign_pattern(z_mask & ((1 << low) - 1), low)).ravel()
+    return (1 - 2 * (popcount(basis_indices(n_qubits) & np.uint64(z_mask)) & 1)).astype(float)
+
+
+def signed_sum(values, z_mask, n_qubits):
+    """Σ_b (−1)^{|z∧b|} values[..., b]: the sign pattern factorizes over high and low bits,
+    so the sum is two matrix–vector products with 2^{n/2}-long sign vectors."""
+    low = n_qubits // 2
+    z_mask = int(z_mask)
+    block = values.reshape(values.shape[:-1] + (2**(n_qubits - low), 2**low))
+    return (block @ sign_pattern(z_mask & ((1 << low) - 1), low)) @ sign_pattern(z_mask >> low, n_qubits - low)
+
+
+def _phase_powers(x, z):
+    """Exponent k of i^k in P = i^k X^x Z^z (mod 4)."""
+    return popcount(x & z) % 4
+
+
+# ============================================================================
+# PAULI SUMS
+# ============================================================================
+
+class PauliSum:
+    """Σ_k c_k P_k over n qubits with P_k given by the bitmask arrays x[k], z[k] (uint64)."""
+
+    def __init__(self, n_qubits, x, z, coeffs):
+        if n_qubits > 64:
+            raise ValueError("Pauli strings are limited to 64 qubits")
+        self.n_qubits = n_qubits
+        self.x = np.asarray(x, dtype=np.uint64).ravel()
+        self.z = np.asarray(z, dtype=np.uint64).ravel()
+        coeffs = np.asarray(coeffs, dtype=complex)
+        self.coeffs = coeffs.ravel().copy() if coeffs.size == self.x.size else np.full(self.x.shape, coeffs)
+        self._weights = None
+
+    @classmethod
+    def from_labels(cls, terms, n_qubits=None):
+        """From {'XZI': c, ...} or [(label, c), ...] (a bare list of labels gets unit coefficients)."""
+        if isinstance(terms, dict):
+            terms = list(terms.items())
+        terms = [(term, 1.0) if isinstance(term, str) else term for term in terms]
+        if n_qubits is None:
+            n_qubits = max((len(label) for label, _ in terms), default=1)
+        x, z = [], []
+        for label, _ in terms:
+            if len(label) != n_qubits:
+                raise ValueError(f"Label '{label}' does not act on {n_qubits} qubits")
+            x_mask = z_mask = 0
+            for char in label.upper():
+                if char not in PAULI_BITS:
+                    raise ValueError(f"Unknown Pauli '{char}' in '{label}'")
+                x_bit, z_bit = PAULI_BITS[char]
+                x_mask, z_mask = (x_mask << 1) | x_bit, (z_mask << 1) | z_bit
+            x.append(x_mask)
+            z.append(z_mask)
+        return cls(n_qubits, x, z, [c for _, c in terms])
+
+    @classmethod
+    def identity(cls, n_qubits, coeff=1.0):
+        return cls(n_qubits, [0], [0], [coeff])
+
+    def __len__(self):
+        return len(self.coeffs)
+
+    def labels(self):
+        """'IXYZ' string of every term."""
+        x_bits = [format(int(v), f'0{self.n_qubits}b') for v in self.x]
+        z_bits = [format(int(v), f'0{self.n_qubits}b') for v in self.z]
+        return [''.join(_BIT_LABELS[(int(a), int(b))] for a, b in zip(xs, zs)) for xs, zs in zip(x_bits, z_bits)]
+
+    def terms(self):
+        """[(label, coefficient), ...] with real coefficients shown as floats."""
+        coeffs = self.coeffs.real if np.allclose(self.coeffs.imag, 0) else self.coeffs
+        return list(zip(self.labels(), coeffs.tolist()))
+
+    def __repr__(self):
+        shown = ' + '.join(f"{c:.4g}·{label}" for label, c in self.terms()[:6])
+        more = ' + ...' if len(self) > 6 else ''
+        return f"PauliSum({shown or '0'}{more})"
+
+    # ------------------------------------------------------------------------
+    # Algebra
+    # ------------------------------------------------------------------------
+
+    def _check(self, other):
+        if other.n_qubits != self.n_qubits:
+            raise ValueError(f"Qubit counts differ: {self.n_qubits} vs {other.n_qubits}")
+
+    def simplify(self, tol=1e-12):
+        """Combine repeated strings and drop terms with |c| ≤ tol."""
+        if len(self) == 0:
+            return self
+        keys = np.stack([self.x, self.z], axis=1)
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        coeffs = np.zeros(len(unique), dtype=complex)
+        np.add.at(coeffs, inverse.ravel(), self.coeffs)
+        keep = np.abs(coeffs) > tol
+        return PauliSum(self.n_qubits, unique[keep, 0], unique[keep, 1], coeffs[keep])
+
+    def __add__(self, other):
+        if np.isscalar(other):
+            other = PauliSum.identity(self.n_qubits, other)
+        self._check(other)
+        return PauliSum(self.n_qubits, np.concatenate([self.x, other.x]), np.concatenate([self.z, other.z]),
+                        np.concatenate([self.coeffs, other.coeffs])).simplify()
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return PauliSum(self.n_qubits, self.x, self.z, -self.coeffs)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, scalar):
+        if not np.isscalar(scalar):
+            return NotImplemented
+        return PauliSum(self.n_qubits, self.x, self.z, self.coeffs * scalar)
+
+    __rmul__ = __mul__
+
+    def __matmul__(self, other):
+        """Operator product: every pair of strings multiplied with exact phases, then simplified."""
+        self._check(other)
+        x1, z1, c1 = self.x[:, None], self.z[:, None], self.coeffs[:, None]
+        x2, z2, c2 = other.x[None, :], other.z[None, :], other.coeffs[None, :]
+        x, z = x1 ^ x2, z1 ^ z2
+        # X^x1 Z^z1 X^x2 Z^z2 = (−1)^{|z1∧x2|} X^{x1⊕x2} Z^{z1⊕z2}
+        k = (_phase_powers(x1, z1) + _phase_powers(x2, z2) - _phase_powers(x, z) + 2 * popcount(z1 & x2)) % 4
+        coeffs = c1 * c2 * (1j ** k)
+        return PauliSum(self.n_qubits, x, z, coeffs).simplify()
+
+    def adjoint(self):
+        return PauliSum(self.n_qubits, self.x, self.z, self.coeffs.conj())
+
+    def is_hermitian(self, tol=1e-12):
+        return np.all(np.abs(self.simplify().coeffs.imag) <= tol)
+
+    def commutation_matrix(self, other):
+        """Boolean (len(self), len(other)) matrix: True where two strings commute."""
+        self._check(other)
+        anti = popcount(self.x[:, None] & other.z[None, :]) + popcount(self.z[:, None] & other.x[None, :])
+        return anti % 2 == 0
+
+    def commutes(self, other, tol=1e-12):
+        """Whether the two sums commute as operators ([A, B] simplifies to zero)."""
+        return len((self @ other - other @ self).simplify(tol)) == 0
+
+    # ------------------------------------------------------------------------
+    # Action on states
+    # ------------------------------------------------------------------------
+
+    def _check_dimension(self, dimension):
+        if dimension != 2**self.n_qubits:
+            raise ValueError(f"Expected a {2**self.n_qubits}-dimensional state, got {dimension}")
+
+    def _groups(self):
+        """Term indices grouped by X mask (strings in one group share the index permutation)."""
+        order = np.argsort(self.x, kind='stable')
+        boundaries = np.flatnonzero(np.diff(self.x[order])) + 1
+        return [(self.x[group[0]], group) for group in np.split(order, boundaries)]
+
+    def _group_weights(self):
+        """(x mask, c·phase·sign(b)) per X-mask group, built once per sum.
+
+        The weight is a scalar when no string in the group has a Z part, and
+        real whenever every entry is real, so apply() stays in real arithmetic
+        for real Hamiltonians.
+        """
+        if self._weights is None:
+            n = self.n_qubits
+            phases = 1j ** _phase_powers(self.x, self.z)
+            weights = []
+            for x_mask, group in self._groups():
+                scaled = self.coeffs[group] * phases[group]
+                if not np.any(self.z[group]):
+                    weight = scaled.sum()
+                else:
+                    weight = sum(c * sign_pattern(self.z[term], n) for c, term in zip(scaled, group))
+                if not np.any(np.imag(weight)):
+                    weight = np.real(weight)
+                weights.append((x_mask, weight))
+            self._weights = weights
+        return self._weights
+
+    def term_expectations(self, psi):
+        """⟨ψ|P_k|ψ⟩ of every string (without coefficients) for psi of shape (..., 2^n) → (..., terms)."""
+        psi = np.asarray(psi, dtype=complex)
+        self._check_dimension(psi.shape[-1])
+        n = self.n_qubits
+        phases = 1j ** _phase_powers(self.x, self.z)
+        out = np.empty(psi.shape[:-1] + (len(self),), dtype=complex)
+        tensor = psi.reshape(psi.shape[:-1] + (2,) * n)
+        buffer = np.empty_like(tensor)
+        overlap = buffer.reshape(psi.shape)
+        for x_mask, group in self._groups():
+            # conj(ψ[b ⊕ x]) · ψ[b], written into one reused buffer
+            np.conjugate(np.flip(tensor, axis=_flip_axes(x_mask, n, psi.ndim - 1)), out=buffer)
+            buffer *= tensor
+            if len(group) > n:
+                spectrum = walsh_hadamard(overlap)
+                out[..., group] = spectrum[..., self.z[group].astype(np.int64)]
+            else:
+                for term in group:
+                    out[..., term] = signed_sum(overlap, self.z[term], n)
+        return out * phases
+
+    def expectation(self, psi):
+        """⟨ψ|H|ψ⟩ for one statevector or a batch (..., 2^n); real part for Hermitian sums."""
+        values = self.term_expectations(psi) @ self.coeffs
+        return values.real if self.is_hermitian() else values
+
+    def term_expectations_density(self, rho):
+        """Tr(ρ P_k) of every string for a density matrix (2^n, 2^n) — reads one permuted diagonal per X mask."""
+        rho = np.asarray(rho, dtype=complex)
+        self._check_dimension(rho.shape[-1])
+        indices = basis_indices(self.n_qubits)
+        phases = 1j ** _phase_powers(self.x, self.z)
+        out = np.empty(len(self), dtype=complex)
+        for x_mask, group in self._groups():
+            permuted = rho[indices, indices ^ x_mask]  # ⟨b|ρ|b⊕x⟩
+            for term in group:
+                out[term] = signed_sum(permuted, self.z[term], self.n_qubits)
+        return out * phases
+
+    def expectation_density(self, rho):
+        """Tr(ρH); real part for Hermitian sums."""
+        value = self.term_expectations_density(rho) @ self.coeffs
+        return value.real if self.is_hermitian() else value
+
+    def apply(self, psi):
+        """H|ψ⟩ for psi of shape (..., 2^n) without forming H."""
+        psi = np.asarray(psi)
+        self._check_dimension(psi.shape[-1])
+        n = self.n_qubits
+        weights = self._group_weights()
+        out = np.zeros(psi.shape, dtype=np.result_type(psi, float, *(w for _, w in weights)))
+        shape = psi.shape[:-1] + (2,) * n
+        tensor = out.reshape(shape)
+        for x_mask, weight in weights:
+            # P|b⟩ lands on |b⊕x⟩: out[b⊕x] += c·phase·sign(b)·ψ[b]
+            tensor += np.flip((weight * psi).reshape(shape), axis=_flip_axes(x_mask, n, psi.ndim - 1))
+        return out
+
+    def to_matrix(self):
+        """Dense 2^n × 2^n matrix (for small registers and checks)."""
+        dimension = 2**self.n_qubits
+        indices = basis_indices(self.n_qubits).astype(np.int64)
+        matrix = np.zeros((dimension, dimension), dtype=complex)
+        phases = 1j ** _phase_powers(self.x, self.z)
+        for term in range(len(self)):
+            signs = sign_pattern(self.z[term], self.n_qubits)
+            matrix[indices ^ int(self.x[term]), indices] += self.coeffs[term] * phases[term] * signs
+        return matrix
+
+    def to_sparse(self):
+        """scipy.sparse CSR matrix with one nonzero per basis state and distinct X mask."""
+        from scipy.sparse import csr_matrix
+
+        n = self.n_qubits
+        indices = basis_indices(n).astype(np.int64)
+        rows, data = [], []
+        for x_mask, weight in self._group_weights():
+            rows.append(indices ^ int(x_mask))
+            data.append(np.broadcast_to(weight, indices.shape))
+        return csr_matrix((np.concatenate(data), (np.concatenate(rows), np.tile(indices, len(rows)))),
+                          shape=(2**n, 2**n))
+
+    def as_linear_operator(self):
+        """Matrix-free scipy LinearOperator applying the sum through apply()."""
+        from scipy.sparse.linalg import LinearOperator
+
+        dimension = 2**self.n_qubits
+        dtype = np.result_type(float, *(w for _, w in self._group_weights()))
+        adjoint = self if self.is_hermitian() else self.adjoint()
+        return LinearOperator((dimension, dimension), dtype=dtype,
+                              matvec=lambda v: self.apply(np.ravel(v)),
+                              matmat=lambda block: self.apply(block.T).T,
+                              rmatvec=lambda v: adjoint.apply(np.ravel(v)),
+                              rmatmat=lambda block: adjoint.apply(block.T).T)
+
+
+BLOCH_AXES = PauliSum.from_labels(['X', 'Y', 'Z'])
+
+
+def bloch_vector(rho):
+    """(⟨X⟩, ⟨Y⟩, ⟨Z⟩) of a single-qubit density matrix."""
+    return BLOCH_AXES.term_expectations_density(rho).real
@@ -0,0 +1,184 @@
+"""
+Potential-Energy Surfaces & Warm-Started VQE
+Bond-length scans of H₂ and minimal LiH on two qubits. The Pauli coefficients
+of every geometry are precomputed (STO-3G, 2-electron / 2-orbital active space)
+by generate_pes_tables.py and shipped in data/pes_tables.json; geometries
+between grid points are cubic-spline interpolated.
+
+The VQE energy of a whole batch of parameter vectors is one vectorized
+statevector evaluation, so the parameter-shift gradient (2 shifted circuits per
+parameter) costs a single call. A scan visits the geometries in order and
+starts each optimization from the previous geometry's optimum; the grid is cut
+into independent chains that run in a process pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import json
+import os
+
+import numpy as np
+from scipy.interpolate import CubicSpline
+from scipy.optimize import minimize
+
+from pauli import PauliSum
+from hamiltonians import ground_energy
+
+
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'pes_tables.json')
+
+ANSATZ_LAYERS = 1               # RY ⊗ RY, CNOT, RY ⊗ RY reaches every real two-qubit state
+COLD_START_SCALE = 0.1          # θ = 0 is the Hartree–Fock state, a stationary point of E(θ)
+SCAN_CHAINS = 4
+GRADIENT_TOLERANCE = 1e-7
+
+
+# ============================================================================
+# COEFFICIENT TABLES
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def load_tables():
+    """Raw JSON tables keyed by molecule name."""
+    with open(TABLE_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def molecules():
+    """Names of the tabulated molecules."""
+    return list(load_tables())
+
+
+@lru_cache(maxsize=None)
+def _table(molecule):
+    table = load_tables()[molecule]
+    distances = np.array(table['distances'])
+    coefficients = np.array(table['coefficients'])
+    hartree_fock = np.array(table['hartree_fock'])
+    for array in (distances, coefficients, hartree_fock):
+        array.flags.writeable = False
+    return distances, tuple(table['labels']), coefficients, hartree_fock
+
+
+@lru_cache(maxsize=None)
+def _spline(molecule):
+    distances, _, coefficients, _ = _table(molecule)
+    return CubicSpline(distances, coefficients)
+
+
+def bond_lengths(molecule):
+    """Tabulated bond lengths (Å)."""
+    return _table(molecule)[0]
+
+
+def hartree_fock_curve(molecule):
+    """RHF total energies (Ha) at the tabulated bond lengths."""
+    return _table(molecule)[3]
+
+
+def hamiltonian_at(molecule, bond_length):
+    """Two-qubit Hamiltonian (total energy, Ha) at a bond length in Å."""
+    distances, labels, _, _ = _table(molecule)
+    if not distances[0] <= bond_length <= distances[-1]:
+        raise ValueError(f"{molecule} is tabulated for {distances[0]:g}–{distances[-1]:g} Å")
+    return PauliSum.from_labels(dict(zip(labels, _spline(molecule)(bond_length))))
+
+
+def exact_curve(molecule, distances=None):
+    """Exact (active-space FCI) ground energies along a set of bond lengths."""
+    distances = bond_lengths(molecule) if distances is None else distances
+    return np.array([ground_energy(hamiltonian_at(molecule, R)) for R in distances])
+
+
+# ============================================================================
+# ANSATZ
+# ============================================================================
+
+def n_parameters(layers=ANSATZ_LAYERS):
+    return 2 * (layers + 1)
+
+
+def _ry(tensor, theta, axis):
+    """RY(θ) on one qubit axis of a (batch, 2, 2) real tensor, one angle per batch entry."""
+    c, s = np.cos(theta / 2)[:, None], np.sin(theta / 2)[:, None]
+    zero, one = np.take(tensor, 0, axis=axis), np.take(tensor, 1, axis=axis)
+    return np.stack([c * zero - s * one, s * zero + c * one], axis=axis)
+
+
+def ansatz_states(params):
+    """Statevectors (batch, 4) of the RY–CNOT ansatz on |00⟩ (the Hartree–Fock state) for params (batch, P)."""
+    params = np.atleast_2d(params)
+    tensor = np.zeros((len(params), 2, 2))
+    tensor[:, 0, 0] = 1.0
+    for layer in range(params.shape[1] // 2):
+        if layer:
+            tensor[:, 1] = tensor[:, 1, ::-1].copy()   # CNOT, control qubit 0
+        tensor = _ry(tensor, params[:, 2 * layer], 1)
+        tensor = _ry(tensor, params[:, 2 * layer + 1], 2)
+    return tensor.reshape(len(params), 4)
+
+
+def energy_and_gradient(hamiltonian, params):
+    """E(θ) and its parameter-shift gradient from one batched evaluation of 2P + 1 circuits."""
+    params = np.asarray(params, dtype=float)
+    shifts = np.pi / 2 * np.eye(len(params))
+    batch = np.vstack([params, params + shifts, params - shifts])
+    energies = hamiltonian.expectation(ansatz_states(batch))
+    P = len(params)
+    return energies[0], (energies[1:P + 1] - energies[P + 1:]) / 2
+
+
+# ============================================================================
+# VQE
+# ============================================================================
+
+def cold_start(layers=ANSATZ_LAYERS, seed=None):
+    """Small random angles around the Hartree–Fock point."""
+    return COLD_START_SCALE * np.random.default_rng(seed).standard_normal(n_parameters(layers))
+
+
+def vqe(hamiltonian, initial):
+    """BFGS on E(θ) with parameter-shift gradients: (energy, optimal θ, energy evaluations)."""
+    result = minimize(lambda theta: energy_and_gradient(hamiltonian, theta), initial,
+                      jac=True, method='BFGS', options={'gtol': GRADIENT_TOLERANCE})
+    return float(result.fun), result.x, result.nfev * (2 * len(initial) + 1)
+
+
+def _run_chain(molecule, distances, initial):
+    """Warm-started VQE along one chain of bond lengths (runs in a worker process)."""
+    energies, parameters, evaluations = [], [], []
+    theta = initial
+    for R in distances:
+        energy, theta, count = vqe(hamiltonian_at(molecule, R), theta)
+        energies.append(energy)
+        parameters.append(theta)
+        evaluations.append(count)
+    return energies, parameters, evaluations
+
+
+def scan(molecule, distances=None, layers=ANSATZ_LAYERS, chains=SCAN_CHAINS, workers=None, seed=0):
+    """VQE potential-energy curve.
+
+    The bond lengths are split into `chains` contiguous runs; each run starts
+    cold and warm-starts every later geometry from its neighbour's optimum.
+    Runs go to a ProcessPoolExecutor with `workers` processes (default one per
+    chain, capped at the CPU count); workers=1 runs them in this process.
+    Returns a dict of arrays: distance, energy, exact, parameters and
+    evaluations (circuit evaluations per geometry).
+    """
+    distances = np.asarray(bond_lengths(molecule) if distances is None else distances, dtype=float)
+    runs = [run for run in np.array_split(distances, min(chains, len(distances))) if len(run)]
+    starts = [cold_start(layers, seed=[seed, i]) for i in range(len(runs))]
+    workers = min(len(runs), os.cpu_count() or 1) if workers is None else workers
+    if workers > 1 and len(runs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_run_chain, [molecule] * len(runs), runs, starts))
+    else:
+        results = [_run_chain(molecule, run, start) for run, start in zip(runs, starts)]
+    return {
+        'distance': distances,
+        'energy': np.concatenate([r[0] for r in results]),
+        'exact': exact_curve(molecule, distances),
+        'parameters': np.vstack([np.array(r[1]) for r in results]),
+        'evaluations': np.concatenate([r[2] for r in results]),
+    }
@@ -0,0 +1,367 @@
+"""
+Quantum Algorithms Engine
+Statevector-level simulations of the landmark quantum algorithms shown on the
+workbench pages.
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+import plotly.graph_objects as go
+
+from sampling import sample_counts
+
+
+# ============================================================================
+# GROVER SEARCH
+# ============================================================================
+
+def grover_optimal_iterations(N, n_marked=1):
+    """Iteration count ⌊π/4 · √(N/M)⌋ that maximizes the success probability."""
+    return int(np.floor(np.pi / 4 * np.sqrt(N / n_marked)))
+
+
+def decimate_amplitudes(phi, n_bins, a=1.0, b=0.0):
+    """Reduce ψ = a·φ + b to n_bins values, keeping the largest-magnitude amplitude per bin.
+
+    |a·φ + b| is maximized at the bin's largest or smallest φ, so the affine
+    state never has to be materialized at full size.
+    """
+    N = phi.size
+    if N <= n_bins:
+        return np.arange(N), a * phi + b
+    bins = phi[:N - N % n_bins].reshape(n_bins, -1)
+    rows = np.arange(n_bins)
+    i_max = np.argmax(bins, axis=1)
+    i_min = np.argmin(bins, axis=1)
+    hi = a * bins[rows, i_max] + b
+    lo = a * bins[rows, i_min] + b
+    use_hi = np.abs(hi) >= np.abs(lo)
+    starts = rows * bins.shape[1]
+    return starts + np.where(use_hi, i_max, i_min), np.where(use_hi, hi, lo)
+
+
+def grover_search(n_qubits, marked, n_iterations=None, n_frames=40, display_bins=512):
+    """Simulate Grover search on the full 2^n statevector.
+
+    The state is stored as ψ = a·φ + b with a = ±1. The diffusion 2·mean − ψ only
+    negates a and shifts b, and the oracle rewrites φ at the marked indices, so each
+    iteration costs O(M); only the decimated display frames touch all N entries.
+
+    Returns a dict with the success probability after every iteration, the
+    iterations at which frames were taken, and the decimated amplitude frames.
+    """
+    N = 2**n_qubits
+    marked = np.unique(np.asarray(marked, dtype=np.int64))
+    M = marked.size
+    if n_iterations is None:
+        n_iterations = grover_optimal_iterations(N, M)
+
+    phi = np.full(N, 1 / np.sqrt(N))
+    a, b = 1.0, 0.0
+    phi_sum = float(phi.sum())
+
+    frame_iterations = np.unique(np.linspace(0, n_iterations, min(n_frames, n_iterations + 1)).astype(int))
+    frames, frame_index = [], []
+
+    success = np.empty(n_iterations + 1)
+    success[0] = M / N
+    for k in range(n_iterations + 1):
+        if k in frame_iterations:
+            display_index, amplitudes = decimate_amplitudes(phi, display_bins, a, b)
+            frames.append(amplitudes)
+            frame_index.append(display_index)
+        if k == n_iterations:
+            break
+
+        # Oracle: ψ_i → −ψ_i on marked items, i.e. φ_i → −2b/a − φ_i
+        old = phi[marked]
+        new = -2 * b / a - old
+        phi[marked] = new
+        phi_sum += float(np.sum(new - old))
+
+        # Diffusion: ψ → 2·mean − ψ
+        mean = (a * phi_sum) / N + b
+        a, b = -a, 2 * mean - b
+
+        success[k + 1] = float(np.sum((a * phi[marked] + b)**2))
+
+    return {
+        'N': N,
+        'marked': marked,
+        'n_iterations': n_iterations,
+        'success_probability': success,
+        'frame_iterations': frame_iterations,
+        'frame_index': np.array(frame_index),
+        'frames': np.array(frames),
+    }
+
+
+def grover_success_curve(N, n_marked, n_iterations):
+    """Closed-form success probability sin²((2k+1)θ) for k = 0..n_iterations."""
+    theta = np.arcsin(np.sqrt(n_marked / N))
+    k = np.arange(n_iterations + 1)
+    return np.sin((2 * k + 1) * theta)**2
+
+
+def grover_amplitude_animation(result):
+    """Plotly frames animation of the decimated amplitudes over the Grover iterations."""
+    frames = result['frames']
+    index = result['frame_index']
+    marked = set(result['marked'].tolist())
+    y_max = float(np.max(np.abs(frames))) * 1.1
+
+    def bar(i):
+        colors = ['#F59E0B' if j in marked else '#06B6D4' for j in index[i]]
+        return go.Bar(x=np.arange(len(index[i])), y=frames[i], marker_color=colors,
+                      customdata=index[i], hovertemplate='|%{customdata}⟩: %{y:.4g}<extra></extra>')
+
+    labels = [str(k) for k in result['frame_iterations']]
+    fig = go.Figure(
+        data=[bar(0)],
+        frames=[go.Frame(data=[bar(i)], name=labels[i]) for i in range(len(frames))]
+    )
+    fig.update_layout(
+        title=f"Amplitudes (N = {result['N']:,}, {len(index[0])} display bins)",
+        xaxis_title='Basis-state bin',
+        yaxis=dict(title='Amplitude', range=[-y_max, y_max]),
+        bargap=0,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        height=420,
+        updatemenus=[dict(
+            type='buttons', showactive=False, x=0.0, y=1.18, xanchor='left',
+            buttons=[
+                dict(label='▶ Play', method='animate',
+                     args=[None, dict(frame=dict(duration=120, redraw=True), fromcurrent=True)]),
+                dict(label='⏸ Pause', method='animate',
+                     args=[[None], dict(frame=dict(duration=0, redraw=False), mode='immediate')])
+            ]
+        )],
+        sliders=[dict(
+            currentvalue=dict(prefix='Iteration ', font=dict(color='white')),
+            pad=dict(t=40),
+            steps=[dict(method='animate', label=label,
+                        args=[[label], dict(mode='immediate', frame=dict(duration=0, redraw=True))])
+                   for label in labels]
+        )]
+    )
+    return fig
+
+
+def grover_success_figure(result):
+    """Success probability versus iteration, simulated and analytic."""
+    k = np.arange(result['n_iterations'] + 1)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=k, y=result['success_probability'], mode='lines', name='Simulated',
+        line=dict(color='#06B6D4', width=3)
+    ))
+    fig.add_trace(go.Scatter(
+        x=k, y=grover_success_curve(result['N'], result['marked'].size, result['n_iterations']),
+        mode='lines', name='sin²((2k+1)θ)', line=dict(color='#F59E0B', width=1, dash='dash')
+    ))
+    fig.add_vline(x=grover_optimal_iterations(result['N'], result['marked'].size),
+                  line_dash='dot', line_color='#84CC16', annotation_text='optimal')
+    fig.update_layout(
+        title='Success Probability vs Iteration',
+        xaxis_title='Grover Iteration k',
+        yaxis=dict(title='P(marked)', range=[0, 1.05]),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        height=420
+    )
+    return fig
+
+
+# ============================================================================
+# QUANTUM PHASE ESTIMATION
+# ============================================================================
+
+def qpe_distribution(phase, n_counting):
+    """Exact counting-register distribution for an eigenphase φ.
+
+    After the controlled-U^(2^j) ladder the register holds e^{2πiφk}/√T for
+    k = 0..T−1; the inverse QFT is then a normalized FFT of that vector.
+    """
+    T = 2**n_counting
+    k = np.arange(T)
+    register = np.exp(2j * np.pi * ((phase * k) % 1.0)) / np.sqrt(T)
+    amplitudes = np.fft.fft(register, norm='ortho')
+    probabilities = amplitudes.real**2 + amplitudes.imag**2
+    return probabilities / probabilities.sum()
+
+
+def run_qpe(phase, n_counting, shots=1024, seed=None):
+    """Sample QPE shots from the exact distribution; returns outcomes, counts and the estimate."""
+    probabilities = qpe_distribution(phase, n_counting)
+    counts = sample_counts(probabilities, shots, seed)
+    outcomes = np.flatnonzero(counts)
+    T = 2**n_counting
+    best = outcomes[np.argmax(counts[outcomes])]
+
+    return {
+        'T': T,
+        'probabilities': probabilities,
+        'outcomes': outcomes,
+        'counts': counts[outcomes],
+        'estimate': best / T,
+        'peak_probability': float(probabilities.max()),
+    }
+
+
+# ============================================================================
+# SHOR ORDER FINDING
+# ============================================================================
+
+def modular_power_sequence(a, N, length):
+    """a^x mod N for x = 0..length−1 by vectorized square-and-multiply."""
+    exponents = np.arange(length, dtype=np.int64)
+    result = np.ones(length, dtype=np.int64)
+    base = np.int64(a % N)
+    while exponents.any():
+        odd = (exponents & 1).astype(bool)
+        result[odd] = result[odd] * base % N
+        base = base * base % N
+        exponents >>= 1
+    return result
+
+
+def _fejer_kernel(theta, m):
+    """|Σ_{j<m} e^{2πijθ}|² evaluated stably, with the θ → 0 limit m²."""
+    s = np.sin(np.pi * theta)
+    small = np.abs(s) < 1e-12
+    safe = np.where(small, 1.0, s)
+    return np.where(small, float(m)**2, (np.sin(np.pi * m * theta) / safe)**2)
+
+
+@lru_cache(maxsize=64)
+def shor_period_finding(N, a, max_dense_qubits=19, peak_window=12):
+    """Order r of a mod N and the exact period-finding register distribution.
+
+    The first register has Q = 2^q ≥ N² states. After the second register is
+    measured it holds a comb x ≡ c (mod r) with ⌊Q/r⌋ or ⌈Q/r⌉ teeth, so its
+    QFT distribution is a sum of two comb spectra. For Q ≤ 2^max_dense_qubits
+    these come from FFTs of the combs; beyond that the same spectrum is
+    evaluated in closed form on ±peak_window outcomes around each of the r peaks
+    and renormalized (the captured mass is reported).
+    """
+    sequence = modular_power_sequence(a, N, N)
+    returns = np.flatnonzero(sequence[1:] == 1)
+    r = int(returns[0]) + 1
+    sequence = sequence[:r]
+
+    q = int(np.ceil(np.log2(N * N)))
+    Q = 2**q
+    m, n_long = divmod(Q, r)  # n_long classes have m + 1 teeth, the other r − n_long have m
+
+    if q <= max_dense_qubits:
+        spectrum = np.zeros(Q)
+        for teeth, n_classes in ((m, r - n_long), (m + 1, n_long)):
+            if n_classes == 0:
+                continue
+            comb = np.zeros(Q)
+            comb[:teeth * r:r] = 1.0
+            F = np.fft.fft(comb)
+            spectrum += n_classes * (F.real**2 + F.imag**2)
+        outcomes = np.arange(Q, dtype=np.int64)
+        probabilities = spectrum / Q**2
+        captured = 1.0
+    else:
+        peaks = np.rint(np.arange(r) * (Q / r)).astype(np.int64)
+        offsets = np.arange(-peak_window, peak_window + 1, dtype=np.int64)
+        outcomes = np.unique((peaks[:, None] + offsets[None, :]).ravel() % Q)
+        theta = (outcomes * r % Q) / Q
+        spectrum = (r - n_long) * _fejer_kernel(theta, m) + n_long * _fejer_kernel(theta, m + 1)
+        probabilities = spectrum / float(Q)**2
+        captured = float(probabilities.sum())
+
+    probabilities = probabilities / probabilities.sum()
+    keep = probabilities > 1e-15
+    outcomes, probabilities = outcomes[keep], probabilities[keep]
+    for arr in (sequence, outcomes, probabilities):
+        arr.flags.writeable = False
+
+    return {
+        'N': N,
+        'a': a,
+        'order': r,
+        'sequence': sequence,
+        'Q': Q,
+        'outcomes': outcomes,
+        'probabilities': probabilities,
+        'captured_mass': captured,
+    }
+
+
+def shor_classical_precheck(N):
+    """Cases Shor's reduction does not cover: returns (reason, factors) or None.
+
+    Even N and perfect powers p^k have direct classical factorizations, and
+    primes have nothing to factor.
+    """
+    if N % 2 == 0:
+        return "even", (2, N // 2)
+    for k in range(2, int(np.log2(N)) + 1):
+        root = int(round(N ** (1 / k)))
+        for base in (root - 1, root, root + 1):
+            if base > 1 and base**k == N:
+                return "perfect power", (base, N // base)
+    if all(N % d for d in range(3, int(np.sqrt(N)) + 1, 2)):
+        return "prime", None
+    return None
+
+
+def continued_fraction_order(y, Q, N):
+    """Candidate order from measurement y via the continued-fraction convergent of y/Q."""
+    return Fraction(int(y), Q).limit_denominator(N - 1).denominator
+
+
+def factors_from_order(a, r, N):
+    """Non-trivial factors from an even order r with a^{r/2} ≢ −1 (mod N), else None."""
+    if r % 2 == 1:
+        return None
+    half = pow(a, r // 2, N)
+    if half == N - 1:
+        return None
+    p = gcd(half - 1, N)
+    if 1 < p < N:
+        return p, N // p
+    return None
+
+
+def run_shor(N, a, shots=1024, seed=None):
+    """Simulate Shor's algorithm for (N, a): sample the period-finding register and post-process each outcome."""
+    shared = gcd(a, N)
+    if shared > 1:
+        return {'classical_factor': (shared, N // shared), 'N': N, 'a': a}
+
+    period = shor_period_finding(N, a)
+    counts = sample_counts(period['probabilities'], shots, seed)
+    hit = np.flatnonzero(counts)
+    outcomes, counts = period['outcomes'][hit], counts[hit]
+
+    # Post-process every distinct outcome; the order-r check is exact modular arithmetic
+    candidates = np.array([continued_fraction_order(y, period['Q'], N) for y in outcomes])
+    order_found = np.array([pow(a, int(c), N) == 1 for c in candidates])
+    factors = None
+    for c in np.unique(candidates[order_found]):
+        factors = factors_from_order(a, int(c), N)
+        if factors:
+            break
+
+    return {
+        'N': N,
+        'a': a,
+        'period': period,
+        'outcomes': outcomes,
+        'counts': counts,
+        'candidate_orders': candidates,
+        'order_success_rate': float(counts[order_found].sum() / shots),
+        'factors': factors,
+        'classical_factor': None,
+    }
@@ -0,0 +1,389 @@
+"""
+Quantum Hardware Engine
+Device topologies, calibration-style error models and a noise-aware
+qubit router (SWAP insertion) for comparing platforms on real circuits.
+"""
+
+import zlib
+from functools import lru_cache
+
+import numpy as np
+
+
+# ============================================================================
+# DEVICE TOPOLOGIES
+# ============================================================================
+
+PLATFORM_ERROR_RATES = {
+    # (mean two-qubit gate error, single-qubit gate error)
+    "IBM Heavy-Hex": (0.008, 0.0003),
+    "Google Sycamore (Grid)": (0.006, 0.001),
+    "IonQ (All-to-All)": (0.02, 0.0005),
+    "Rigetti Aspen (Linear)": (0.03, 0.002),
+}
+
+
+def heavy_hex_topology(n_rows, row_length):
+    """IBM-style heavy-hex lattice: n_rows long qubit rows joined by bridge qubits every 4 columns.
+
+    row_length must be 4k + 3; (7, 15) gives the 127-qubit Eagle layout and
+    (13, 27) the 433-qubit Osprey layout, numbered in IBM reading order.
+    """
+    if row_length % 4 != 3:
+        raise ValueError("row_length must be of the form 4k + 3")
+    gap_columns = [range(0 if g % 2 == 0 else 2, row_length, 4) for g in range(n_rows - 1)]
+
+    positions, edges, bridges = [], [], {}
+    for r in range(n_rows):
+        cols = list(range(row_length))
+        # End qubits of the outer rows that no bridge reaches are not fabricated
+        if r == 0 and row_length - 1 not in gap_columns[0]:
+            cols.pop()
+        if r == n_rows - 1 and 0 not in gap_columns[-1]:
+            cols.pop(0)
+
+        index = {}
+        for c in cols:
+            index[c] = len(positions)
+            positions.append((c, -2 * r))
+        edges += [(index[c], index[c + 1]) for c in cols if c + 1 in index]
+        # Bridges of the previous gap were numbered before this row; connect them down
+        edges += [(q, index[c]) for c, q in bridges.items()]
+
+        bridges = {}
+        if r < n_rows - 1:
+            for c in gap_columns[r]:
+                bridges[c] = len(positions)
+                positions.append((c, -2 * r - 1))
+                edges.append((index[c], bridges[c]))
+
+    return np.array(positions, dtype=float), np.array(edges, dtype=np.int32)
+
+
+def grid_topology(rows, cols):
+    """Square lattice with nearest-neighbour couplers."""
+    idx = np.arange(rows * cols).reshape(rows, cols)
+    horizontal = np.stack([idx[:, :-1].ravel(), idx[:, 1:].ravel()], axis=1)
+    vertical = np.stack([idx[:-1, :].ravel(), idx[1:, :].ravel()], axis=1)
+    positions = np.stack([idx.ravel() % cols, idx.ravel() // cols], axis=1).astype(float)
+    return positions, np.concatenate([horizontal, vertical]).astype(np.int32)
+
+
+def linear_topology(n):
+    """Open chain of n qubits."""
+    positions = np.stack([np.arange(n), np.zeros(n)], axis=1).astype(float)
+    edges = np.stack([np.arange(n - 1), np.arange(1, n)], axis=1).astype(np.int32)
+    return positions, edges
+
+
+def all_to_all_topology(n):
+    """Fully connected register laid out on a circle."""
+    theta = 2 * np.pi * np.arange(n) / n
+    positions = np.stack([np.cos(theta), np.sin(theta)], axis=1)
+    i, j = np.triu_indices(n, k=1)
+    return positions, np.stack([i, j], axis=1).astype(np.int32)
+
+
+# Device sizes offered per platform: label → generator arguments
+PLATFORM_SIZES = {
+    "IBM Heavy-Hex": {
+        "23 qubits": (3, 7), "65 qubits (Hummingbird)": (5, 11),
+        "127 qubits (Eagle)": (7, 15), "433 qubits (Osprey)": (13, 27),
+    },
+    "Google Sycamore (Grid)": {
+        "9 qubits (3×3)": (3, 3), "54 qubits (6×9)": (6, 9),
+        "100 qubits (10×10)": (10, 10), "400 qubits (20×20)": (20, 20),
+    },
+    "IonQ (All-to-All)": {
+        "5 qubits": (5,), "11 qubits (Harmony)": (11,),
+        "25 qubits (Aria)": (25,), "36 qubits (Forte)": (36,),
+    },
+    "Rigetti Aspen (Linear)": {
+        "7 qubits": (7,), "32 qubits": (32,), "80 qubits": (80,), "400 qubits": (400,),
+    },
+}
+
+TOPOLOGY_BUILDERS = {
+    "IBM Heavy-Hex": heavy_hex_topology,
+    "Google Sycamore (Grid)": grid_topology,
+    "IonQ (All-to-All)": all_to_all_topology,
+    "Rigetti Aspen (Linear)": linear_topology,
+}
+
+
+def default_size(platform):
+    """Smallest device size offered for a platform."""
+    return next(iter(PLATFORM_SIZES[platform]))
+
+
+@lru_cache(maxsize=32)
+def get_topology(platform, size=None):
+    """Topology for a device: dict with n_qubits, positions (n, 2), edges (E, 2) and edge errors."""
+    size = size or default_size(platform)
+    coords, edges = TOPOLOGY_BUILDERS[platform](*PLATFORM_SIZES[platform][size])
+    n_qubits = len(coords)
+
+    # Calibration snapshot: fixed per device so reruns compare like with like
+    mean_2q, error_1q = PLATFORM_ERROR_RATES[platform]
+    rng = np.random.default_rng(zlib.crc32(f"{platform}/{size}".encode()))
+    edge_errors = mean_2q * rng.lognormal(0.0, 0.35, size=len(edges))
+    t2_us = rng.uniform(80, 120, size=n_qubits)
+
+    for arr in (coords, edges, edge_errors, t2_us):
+        arr.flags.writeable = False
+    return {
+        'platform': platform,
+        'size': size,
+        'n_qubits': n_qubits,
+        'positions': coords,
+        'edges': edges,
+        'edge_errors': edge_errors,
+        'error_1q': error_1q,
+        't2_us': t2_us,
+    }
+
+
+# ============================================================================
+# ALL-PAIRS SHORTEST PATHS
+# ============================================================================
+
+def floyd_warshall(n, edges, weights=None):
+    """Vectorized Floyd–Warshall over an undirected edge list; returns the (n, n) distance matrix."""
+    D = np.full((n, n), np.inf)
+    np.fill_diagonal(D, 0.0)
+    w = np.ones(len(edges)) if weights is None else np.asarray(weights, dtype=float)
+    D[edges[:, 0], edges[:, 1]] = w
+    D[edges[:, 1], edges[:, 0]] = w
+    for k in range(n):
+        np.minimum(D, D[:, k, None] + D[None, k, :], out=D)
+    return D
+
+
+@lru_cache(maxsize=32)
+def routing_tables(platform, size=None):
+    """Hop distances, error-weighted distances and per-edge cost lookup for a device (cached)."""
+    topo = get_topology(platform, size)
+    n, edges = topo['n_qubits'], topo['edges']
+    # −log(1 − ε) makes path costs add up to the log of the path's failure-free probability
+    edge_cost = -np.log1p(-topo['edge_errors'])
+
+    hops = floyd_warshall(n, edges)
+    weighted = floyd_warshall(n, edges, edge_cost)
+
+    cost = np.full((n, n), np.inf)
+    cost[edges[:, 0], edges[:, 1]] = edge_cost
+    cost[edges[:, 1], edges[:, 0]] = edge_cost
+
+    for arr in (hops, weighted, cost):
+        arr.flags.writeable = False
+    return hops, weighted, cost
+
+
+# ============================================================================
+# LOGICAL BENCHMARK CIRCUITS
+# ============================================================================
+
+def benchmark_circuit(kind, n_qubits, seed=0):
+    """Logical circuit as a list of (gate, qubits) tuples."""
+    gates = []
+    if kind == "GHZ":
+        gates.append(('h', (0,)))
+        gates += [('cx', (0, q)) for q in range(1, n_qubits)]
+    elif kind == "QFT":
+        for i in range(n_qubits):
+            gates.append(('h', (i,)))
+            gates += [('cp', (j, i)) for j in range(i + 1, n_qubits)]
+    elif kind == "QAOA (Ring, p=2)":
+        for _ in range(2):
+            gates += [('rzz', (q, (q + 1) % n_qubits)) for q in range(n_qubits)]
+            gates += [('rx', (q,)) for q in range(n_qubits)]
+    elif kind == "Random (depth 10)":
+        rng = np.random.default_rng(seed)
+        for _ in range(10):
+            order = rng.permutation(n_qubits)
+            gates += [('cx', (int(order[k]), int(order[k + 1]))) for k in range(0, n_qubits - 1, 2)]
+            gates += [('u3', (q,)) for q in range(n_qubits)]
+    else:
+        raise ValueError(f"Unknown benchmark circuit: {kind}")
+    return gates
+
+
+# ============================================================================
+# NOISE-AWARE SWAP ROUTER
+# ============================================================================
+
+def _initial_layout(n_logical, hops, neighbours):
+    """Place logical qubits along a connected walk through a compact region around the most central qubit.
+
+    The region is the n_logical physical qubits nearest the centre; a depth-first
+    walk from its outermost qubit orders them so consecutive logical indices
+    (the GHZ chain, QAOA ring and QFT neighbours) start out adjacent where the
+    coupling graph allows.
+    """
+    centre = int(np.argmin(hops.sum(axis=1)))
+    region = [int(p) for p in np.argsort(hops[centre], kind='stable')[:n_logical]]
+    inside = set(region)
+    start = max(region, key=lambda p: hops[centre, p])
+    order, stack, seen = [], [start], set()
+    while stack:
+        p = stack.pop()
+        if p in seen:
+            continue
+        seen.add(p)
+        order.append(p)
+        # Visit the neighbour closest to the centre last, so the walk hugs the region's boundary first
+        stack += sorted((nb for nb in neighbours[p] if nb in inside and nb not in seen),
+                        key=lambda nb: -hops[centre, nb])
+    return order
+
+
+def route_circuit(gates, platform, size=None, lookahead=20, lookahead_weight=0.5, decay=0.1, noise_weight=0.1):
+    """Map a logical circuit onto a platform, inserting SWAPs with a SABRE-style lookahead heuristic.
+
+    Candidate SWAPs touch a front-layer qubit and are scored by the hop distance
+    of the front layer plus a discounted lookahead window, scaled by the
+    per-qubit decay that discourages reusing the same qubits. Error-weighted
+    distances enter only through `noise_weight` (in units of the mean coupler
+    cost), so fidelity breaks ties between equally short routes. The previous
+    SWAP is never undone immediately. Returns the physical gate list together
+    with depth, SWAP count and the estimated success probability.
+    """
+    topo = get_topology(platform, size)
+    hops, weighted, cost = routing_tables(platform, size)
+    n_logical = 1 + max(q for _, qubits in gates for q in qubits)
+    if n_logical > topo['n_qubits']:
+        raise ValueError(f"{platform} has {topo['n_qubits']} qubits, circuit needs {n_logical}")
+
+    edge_list = topo['edges']
+    neighbours = [[] for _ in range(topo['n_qubits'])]
+    for a, b in edge_list:
+        neighbours[a].append(int(b))
+        neighbours[b].append(int(a))
+    mean_cost = float(np.mean(cost[edge_list[:, 0], edge_list[:, 1]])) if len(edge_list) else 1.0
+    distance = hops + noise_weight * weighted / mean_cost
+    swap_penalty = noise_weight * cost / mean_cost
+
+    layout = _initial_layout(n_logical, hops, neighbours)     # logical → physical
+    occupant = {p: l for l, p in enumerate(layout)}           # physical → logical
+
+    pending = list(range(len(gates)))
+    routed, n_swaps = [], 0
+    decay_factor = np.ones(topo['n_qubits'])
+    last_swap = None
+    stalled = 0
+
+    def apply_swap(a, b):
+        nonlocal occupant, n_swaps, last_swap
+        la, lb = occupant.get(a), occupant.get(b)
+        if la is not None:
+            layout[la] = b
+        if lb is not None:
+            layout[lb] = a
+        occupant = {p: l for l, p in enumerate(layout)}
+        routed.append(('swap', (a, b)))
+        n_swaps += 1
+        last_swap = (a, b)
+
+    while pending:
+        # Execute every gate whose qubits are free of earlier pending gates and are adjacent
+        blocked, executed, front = set(), [], []
+        for idx in pending:
+            qubits = gates[idx][1]
+            if blocked.intersection(qubits):
+                blocked.update(qubits)
+                continue
+            if len(qubits) == 1 or hops[layout[qubits[0]], layout[qubits[1]]] == 1:
+                executed.append(idx)
+            else:
+                front.append(idx)
+            blocked.update(qubits)
+            if len(blocked) == n_logical:
+                break
+
+        if executed:
+            for idx in executed:
+                name, qubits = gates[idx]
+                routed.append((name, tuple(layout[q] for q in qubits)))
+            done = set(executed)
+            pending = [idx for idx in pending if idx not in done]
+            decay_factor[:] = 1.0
+            last_swap = None
+            stalled = 0
+            continue
+
+        if stalled > 2 * topo['n_qubits']:
+            # Escape hatch: walk the first front gate's qubits together along a shortest path
+            q0, q1 = gates[front[0]][1]
+            while hops[layout[q0], layout[q1]] > 1:
+                p0, p1 = layout[q0], layout[q1]
+                apply_swap(p0, min(neighbours[p0], key=lambda nb: (hops[nb, p1], weighted[nb, p1])))
+            decay_factor[:] = 1.0
+            stalled = 0
+            continue
+
+        active = {layout[q] for idx in front for q in gates[idx][1]}
+        candidates = {tuple(sorted((p, nb))) for p in active for nb in neighbours[p]}
+        candidates.discard(last_swap)
+        window = [idx for idx in pending if len(gates[idx][1]) == 2 and idx not in front][:lookahead]
+
+        def score(swap):
+            a, b = swap
+            def place(q):
+                p = layout[q]
+                return b if p == a else a if p == b else p
+            front_cost = sum(distance[place(gates[i][1][0]), place(gates[i][1][1])] for i in front) / len(front)
+            ahead = sum(distance[place(gates[i][1][0]), place(gates[i][1][1])] for i in window)
+            ahead = lookahead_weight * ahead / max(len(window), 1)
+            return max(decay_factor[a], decay_factor[b]) * (front_cost + ahead) + swap_penalty[a, b]
+
+        a, b = min(sorted(candidates), key=score)
+        apply_swap(a, b)
+        decay_factor[a] += decay
+        decay_factor[b] += decay
+        stalled += 1
+
+    return summarize_routed_circuit(routed, topo, cost, n_swaps, len(gates))
+
+
+def summarize_routed_circuit(routed, topo, cost, n_swaps, n_logical_gates):
+    """Depth (SWAP = 3 CNOT layers), two-qubit gate count and estimated success probability."""
+    level = np.zeros(topo['n_qubits'], dtype=int)
+    log_success = 0.0
+    n_2q = 0
+    for name, qubits in routed:
+        if len(qubits) == 1:
+            level[qubits[0]] += 1
+            log_success += np.log1p(-topo['error_1q'])
+            continue
+        a, b = qubits
+        layers = 3 if name == 'swap' else 1
+        level[a] = level[b] = max(level[a], level[b]) + layers
+        # cost[a, b] = −log(1 − ε_ab), so subtracting accumulates log fidelity
+        log_success -= layers * cost[a, b]
+        n_2q += layers
+
+    return {
+        'platform': topo['platform'],
+        'gates': routed,
+        'depth': int(level.max()),
+        'swap_count': n_swaps,
+        'two_qubit_gates': n_2q,
+        'logical_gates': n_logical_gates,
+        'success_probability': float(np.exp(log_success)),
+    }
+
+
+def edge_segments(positions, edges):
+    """x, y arrays drawing every edge in a single trace, with NaN (null) breaks between segments."""
+    segments = np.full((len(edges), 3, 2), np.nan)
+    segments[:, 0] = positions[edges[:, 0]]
+    segments[:, 1] = positions[edges[:, 1]]
+    return segments[:, :, 0].ravel(), segments[:, :, 1].ravel()
+
+
+def smallest_fitting_size(platform, n_qubits):
+    """Smallest offered device of a platform with at least n_qubits, or None."""
+    for size in PLATFORM_SIZES[platform]:
+        if get_topology(platform, size)['n_qubits'] >= n_qubits:
+            return size
+    return None
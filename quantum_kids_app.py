@@ -5,6 +5,10 @@ import time
 from PIL import Image, ImageDraw
 import io
 
+from sampling import measure
+
+CAT_STATES = ["awake", "sleeping"]
+
 # Page config
 st.set_page_config(
     page_title="🌟 Quantum World for Kids!",
@@ -204,7 +208,7 @@ elif page == "🐱 Schrödinger's Cat":
             if not st.session_state.box_opened:
                 if st.button("🎁 OPEN THE MAGIC BOX!", key="open_box"):
                     st.session_state.box_opened = True
-                    st.session_state.cat_state = np.random.choice(["awake", "sleeping"])
+                    st.session_state.cat_state = CAT_STATES[measure([0.5, 0.5])]
                     st.rerun()
             else:
                 if st.button("📦 Close Box & Try Again!", key="close_box"):
@@ -283,7 +287,7 @@ elif page == "🐱 Schrödinger's Cat":
         
         with col1:
             if st.button("😺 I guess AWAKE!"):
-                result = np.random.choice(["awake", "sleeping"])
+                result = CAT_STATES[measure([0.5, 0.5])]
                 if result == "awake":
                     st.success("🎉 YOU GUESSED RIGHT! The cat is awake! 😺")
                     st.balloons()
@@ -292,7 +296,7 @@ elif page == "🐱 Schrödinger's Cat":
         
         with col2:
             if st.button("😴 I guess SLEEPING!"):
-                result = np.random.choice(["awake", "sleeping"])
+                result = CAT_STATES[measure([0.5, 0.5])]
                 if result == "sleeping":
                     st.success("🎉 YOU GUESSED RIGHT! The cat is sleeping! 😴")
                     st.balloons()
@@ -646,7 +650,7 @@ elif page == "🎮 Play & Learn":
                 
                 time.sleep(1)
                 
-                result = np.random.randint(1, 7)
+                result = 1 + measure(np.full(6, 1 / 6))
                 st.markdown(f"""
                     <p style='font-size: 50px; font-weight: bold; text-align: center;'>{result}!</p>
                 </div>
@@ -658,11 +662,11 @@ elif page == "🎮 Play & Learn":
         st.markdown("The particle is hiding in ONE of these boxes! Can you find it? 🔍")
         
         if 'particle_location' not in st.session_state:
-            st.session_state.particle_location = np.random.randint(0, 3)
+            st.session_state.particle_location = measure(np.full(3, 1 / 3))
             st.session_state.guessed = False
         
         if st.button("🔄 New Game"):
-            st.session_state.particle_location = np.random.randint(0, 3)
+            st.session_state.particle_location = measure(np.full(3, 1 / 3))
             st.session_state.guessed = False
             st.rerun()
         
@@ -0,0 +1,363 @@
+"""
+Quantum Machine Learning Engine
+Variational quantum classifiers simulated on batched statevectors.
+
+A minibatch of B samples is one (B, 2^n) state array and every layer (data
+encoding, trainable rotations, entangler) is one matmul over the whole array.
+For the exact parameter-shift gradient the 2P shifted circuits branch from the
+unshifted run at the layer they shift, as extra rows of the same matmuls, so
+the layer unitaries are built once per minibatch rather than once per shift.
+
+Fidelity-kernel SVMs use an IQP-style feature map. The exact Gram matrix is
+O(n²); the Nyström mode keeps m ≪ n landmark states and computes only n×m
+overlaps, so kernel SVMs scale to tens of thousands of samples.
+"""
+
+import time
+
+import numpy as np
+from scipy.linalg import hadamard as hadamard_matrix
+
+
+KERNEL_QUBITS = 4
+KERNEL_REPS = 2
+KERNEL_BANDWIDTH = 0.5          # feature angles are bandwidth · π · x for x in [−1, 1]
+KERNEL_CHUNK = 2048             # rows of states per overlap block
+NYSTROEM_LANDMARKS = 128
+NYSTROEM_RCOND = 1e-10          # relative eigenvalue cutoff of the landmark Gram matrix
+NYSTROEM_CHECK_SAMPLES = 500
+
+
+# ============================================================================
+# DATA
+# ============================================================================
+
+def moons_dataset(n_samples=200, noise=0.1, test_size=0.3, seed=42):
+    """Two-moons split (X_train, X_test, y_train, y_test) with features scaled to [−1, 1] on the training set."""
+    from sklearn.datasets import make_moons
+    from sklearn.model_selection import train_test_split
+
+    X, y = make_moons(n_samples=n_samples, noise=noise, random_state=seed)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=test_size, random_state=seed)
+    lo, hi = X_train.min(axis=0), X_train.max(axis=0)
+    scale = lambda data: 2 * (data - lo) / (hi - lo) - 1
+    return scale(X_train), scale(X_test), y_train, y_test
+
+
+# ============================================================================
+# VARIATIONAL CIRCUIT
+# ============================================================================
+
+def n_vqc_parameters(n_qubits, n_layers):
+    """RY and RZ angle per qubit per layer."""
+    return 2 * n_qubits * n_layers
+
+
+def _ry(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.stack([np.stack([c, -s], -1), np.stack([s, c], -1)], -2)
+
+
+def _rz(phi):
+    phase = np.exp(-0.5j * phi)
+    zero = np.zeros_like(phase)
+    return np.stack([np.stack([phase, zero], -1), np.stack([zero, phase.conj()], -1)], -2)
+
+
+def _kron_all(matrices):
+    """⊗ over the qubit axis of (..., n, 2, 2) single-qubit matrices → (..., 2^n, 2^n), qubit 0 most significant."""
+    out = matrices[..., 0, :, :]
+    for q in range(1, matrices.shape[-3]):
+        m = matrices[..., q, :, :]
+        out = (out[..., :, None, :, None] * m[..., None, :, None, :]).reshape(
+            m.shape[:-2] + (out.shape[-2] * 2, out.shape[-1] * 2))
+    return out
+
+
+def _apply_1q(psi, gates, qubit, n_qubits):
+    """Apply (..., 2, 2) gates, broadcast against the leading axes of psi (..., 2^n), to one qubit."""
+    shape = psi.shape
+    psi = psi.reshape(shape[:-1] + (2**qubit, 2, 2**(n_qubits - qubit - 1)))
+    zero, one = psi[..., 0, :], psi[..., 1, :]
+    g = gates[..., None, None]
+    out = np.stack([g[..., 0, 0, :, :] * zero + g[..., 0, 1, :, :] * one,
+                    g[..., 1, 0, :, :] * zero + g[..., 1, 1, :, :] * one], axis=-2)
+    return out.reshape(out.shape[:-3] + shape[-1:])
+
+
+def _ring_permutation(n_qubits):
+    """Basis-index permutation of CNOT(0→1), CNOT(1→2), …, CNOT(n−1→0) applied in that order."""
+    index = np.arange(2**n_qubits)
+    bits = (index[:, None] >> (n_qubits - 1 - np.arange(n_qubits))) & 1
+    pairs = [(q, (q + 1) % n_qubits) for q in range(n_qubits if n_qubits > 2 else n_qubits - 1)]
+    for control, target in pairs:
+        bits[:, target] ^= bits[:, control]
+    return bits @ (1 << (n_qubits - 1 - np.arange(n_qubits)))
+
+
+def variational_unitaries(params, n_qubits, n_layers):
+    """(K, L, 2^n, 2^n) layer unitaries CNOT-ring · ⊗_q RZ(φ_q) RY(θ_q) for params (K, P)."""
+    angles = np.asarray(params).reshape(-1, n_layers, 2, n_qubits)
+    rotations = _kron_all(_rz(angles[:, :, 1]) @ _ry(angles[:, :, 0]))
+    out = np.empty_like(rotations)
+    out[..., _ring_permutation(n_qubits), :] = rotations  # CNOTs permute the output basis states
+    return out
+
+
+def encoding_unitaries(X, n_qubits):
+    """(B, 2^n, 2^n) real encodings ⊗_q RY(π x_{q mod d}), one per sample."""
+    return _kron_all(_ry(np.pi * X[:, np.arange(n_qubits) % X.shape[1]]))
+
+
+def vqc_states(params, X, n_qubits, n_layers):
+    """States (K, B, 2^n) of the data re-uploading circuit Π_l W_l(θ) E(x) |0…0⟩ for params (K, P), X (B, d)."""
+    params = np.atleast_2d(params)
+    W = np.swapaxes(variational_unitaries(params, n_qubits, n_layers), -1, -2)   # transposed: states are rows
+    E = np.swapaxes(encoding_unitaries(X, n_qubits), -1, -2)
+    psi = np.broadcast_to(E[:, 0].astype(complex), (len(params),) + E[:, 0].shape)    # E(x)|0…0⟩
+    for layer in range(n_layers):
+        if layer:
+            psi = np.matmul(psi.transpose(1, 0, 2), E).transpose(1, 0, 2)     # one matmul per sample
+        psi = psi @ W[:, layer]                                                 # one matmul per θ
+    return psi
+
+
+def _z0(psi, n_qubits):
+    probabilities = np.abs(psi)**2
+    half = 2**(n_qubits - 1)
+    return probabilities[..., :half].sum(-1) - probabilities[..., half:].sum(-1)
+
+
+def vqc_expectations(params, X, n_qubits, n_layers):
+    """⟨Z₀⟩ for every parameter vector and sample: (K, B)."""
+    return _z0(vqc_states(params, X, n_qubits, n_layers), n_qubits)
+
+
+def vqc_predict_proba(params, X, n_qubits, n_layers, chunk_size=512):
+    """P(class 1) = (1 − ⟨Z₀⟩)/2 per sample, evaluated in chunks."""
+    return np.concatenate([
+        (1 - vqc_expectations(params, X[i:i + chunk_size], n_qubits, n_layers)[0]) / 2
+        for i in range(0, len(X), chunk_size)
+    ])
+
+
+def shifted_expectations(params, X, n_qubits, n_layers):
+    """⟨Z₀⟩ (2P + 1, B) at θ, at every θ + (π/2) e_k and at every θ − (π/2) e_k.
+
+    A shift in layer l leaves the state before that layer untouched, and the
+    shifted layer is the unshifted one after the single-qubit correction
+    Δ = G† G'. So the layer unitaries are built once, at θ, and the 4n shifted
+    copies of layer l branch from the unshifted run there as extra rows of
+    the same matmuls: the cost scales with the minibatch, not with P × 2^n × 2^n.
+    """
+    P = len(params)
+    angles = np.asarray(params).reshape(n_layers, 2, n_qubits)
+    W_T = np.swapaxes(variational_unitaries(params, n_qubits, n_layers)[0], -1, -2)  # (L, D, D), states are rows
+    E_T = np.swapaxes(encoding_unitaries(X, n_qubits), -1, -2).astype(complex)     # (B, D, D)
+    gates = _rz(angles[:, 1]) @ _ry(angles[:, 0])                                 # (L, n, 2, 2)
+    which = np.arange(2 * n_qubits) % n_qubits                                    # qubit of shift k = t·n + q
+    shift = np.pi / 2 * np.array([1, -1])[:, None, None, None] * np.eye(2 * n_qubits).reshape(-1, 2, n_qubits)
+    B, D = len(X), 2**n_qubits
+    plus_minus = np.empty((2, n_layers, 2 * n_qubits, B))
+
+    def layer(rows, l):
+        return (rows.reshape(-1, D) @ W_T[l]).reshape(rows.shape)
+
+    psi = E_T[:, 0]                                                               # E(x)|0…0⟩, (B, D)
+    for l in range(n_layers):
+        if l:
+            psi = (psi[:, None] @ E_T)[:, 0]
+        shifted = angles[l] + shift                                               # (2, 2n, 2, n)
+        shifted = _rz(shifted[:, :, 1]) @ _ry(shifted[:, :, 0])
+        delta = gates[l, which].conj().swapaxes(-1, -2) @ shifted[:, np.arange(2 * n_qubits), which]
+        branches = np.stack([_apply_1q(psi[:, None], delta[:, k], which[k], n_qubits)
+                             for k in range(2 * n_qubits)], 2).reshape(B, -1, D)  # (B, 2 · 2n, D)
+        branches = layer(branches, l)
+        for later in range(l + 1, n_layers):
+            branches = layer(branches @ E_T, later)
+        plus_minus[:, l] = _z0(branches, n_qubits).reshape(B, 2, -1).transpose(1, 2, 0)
+        psi = layer(psi, l)
+    return np.vstack([_z0(psi, n_qubits)[None], plus_minus.reshape(2 * P, B)])
+
+
+def vqc_loss_and_gradient(params, X, y, n_qubits, n_layers, eps=1e-7):
+    """Binary cross-entropy of a minibatch and its exact parameter-shift gradient.
+
+    θ and its 2P shifted copies θ ± (π/2) e_k are evaluated together by
+    shifted_expectations.
+    """
+    P = len(params)
+    f = shifted_expectations(params, X, n_qubits, n_layers)
+    p = np.clip((1 - f[0]) / 2, eps, 1 - eps)
+    loss = -np.mean(y * np.log(p) + (1 - y) * np.log(1 - p))
+    dloss_df = -0.5 * (p - y) / (p * (1 - p)) / len(X)
+    return loss, ((f[1:P + 1] - f[P + 1:]) / 2) @ dloss_df
+
+
+# ============================================================================
+# TRAINING
+# ============================================================================
+
+def train_vqc(X_train, y_train, X_val=None, y_val=None, n_qubits=4, n_layers=3, epochs=30,
+              batch_size=32, learning_rate=0.1, seed=0, callback=None):
+    """Minibatch Adam training of the VQC.
+
+    callback(epoch, history) is called after every epoch (live progress).
+    Returns the history dict: params, loss, train_accuracy, val_accuracy
+    (per epoch) and seconds (per epoch).
+    """
+    rng = np.random.default_rng(seed)
+    params = rng.normal(0, 0.1, n_vqc_parameters(n_qubits, n_layers))
+    m, v = np.zeros_like(params), np.zeros_like(params)
+    beta1, beta2, step = 0.9, 0.999, 0
+    history = {'params': params, 'loss': [], 'train_accuracy': [], 'val_accuracy': [], 'seconds': [],
+               'n_qubits': n_qubits, 'n_layers': n_layers}
+
+    for epoch in range(epochs):
+        start = time.perf_counter()
+        order = rng.permutation(len(X_train))
+        losses = []
+        for batch in np.array_split(order, max(1, int(np.ceil(len(order) / batch_size)))):
+            loss, gradient = vqc_loss_and_gradient(params, X_train[batch], y_train[batch], n_qubits, n_layers)
+            step += 1
+            m = beta1 * m + (1 - beta1) * gradient
+            v = beta2 * v + (1 - beta2) * gradient**2
+            params = params - learning_rate * (m / (1 - beta1**step)) / (np.sqrt(v / (1 - beta2**step)) + 1e-8)
+            losses.append(loss * len(batch))
+        history['seconds'].append(time.perf_counter() - start)
+        history['params'] = params
+        history['loss'].append(sum(losses) / len(X_train))
+        history['train_accuracy'].append(vqc_accuracy(params, X_train, y_train, n_qubits, n_layers))
+        if X_val is not None:
+            history['val_accuracy'].append(vqc_accuracy(params, X_val, y_val, n_qubits, n_layers))
+        if callback is not None:
+            callback(epoch, history)
+    return history
+
+
+def vqc_accuracy(params, X, y, n_qubits, n_layers):
+    return float(np.mean((vqc_predict_proba(params, X, n_qubits, n_layers) > 0.5) == y))
+
+
+# ============================================================================
+# FIDELITY QUANTUM KERNEL
+# ============================================================================
+
+def _z_signs(n_qubits):
+    """(2^n, n) Z eigenvalues ±1 of every basis state, qubit 0 most significant."""
+    index = np.arange(2**n_qubits)
+    return 1 - 2 * ((index[:, None] >> (n_qubits - 1 - np.arange(n_qubits))) & 1)
+
+
+def kernel_states(X, n_qubits=KERNEL_QUBITS, reps=KERNEL_REPS, bandwidth=KERNEL_BANDWIDTH):
+    """Feature-map states (B, 2^n) of the IQP map |φ(x)⟩ = (U_Z(x) H^⊗n)^reps |0…0⟩.
+
+    U_Z(x) = exp(i Σ_q x_q Z_q + i Σ_ring x_q x_q' Z_q Z_q') with x_q = bandwidth · π · x_{q mod d}
+    is diagonal, so each repetition is one Hadamard-transform matmul and one elementwise phase.
+    """
+    x = bandwidth * np.pi * X[:, np.arange(n_qubits) % X.shape[1]]
+    z = _z_signs(n_qubits)
+    i, j = np.array([(q, (q + 1) % n_qubits) for q in range(n_qubits if n_qubits > 2 else n_qubits - 1)]).T
+    phase = np.exp(1j * (x @ z.T + (x[:, i] * x[:, j]) @ (z[:, i] * z[:, j]).T))
+    hadamard = hadamard_matrix(2**n_qubits) / np.sqrt(2**n_qubits)
+    psi = phase / np.sqrt(2**n_qubits)                  # U_Z H^⊗n |0…0⟩
+    for _ in range(reps - 1):
+        psi = (psi @ hadamard) * phase
+    return psi
+
+
+def _overlaps(states_a, states_b):
+    return np.abs(states_a.conj() @ states_b.T)**2
+
+
+def fidelity_kernel(X_a, X_b=None, n_qubits=KERNEL_QUBITS, reps=KERNEL_REPS, bandwidth=KERNEL_BANDWIDTH,
+                    chunk_size=KERNEL_CHUNK):
+    """Exact Gram matrix K_ij = |⟨φ(a_i)|φ(b_j)⟩|², rows computed chunk by chunk."""
+    states_b = kernel_states(X_a if X_b is None else X_b, n_qubits, reps, bandwidth)
+    return np.vstack([_overlaps(kernel_states(X_a[k:k + chunk_size], n_qubits, reps, bandwidth), states_b)
+                      for k in range(0, len(X_a), chunk_size)])
+
+
+# ============================================================================
+# NYSTRÖM APPROXIMATION
+# ============================================================================
+
+def fit_nystroem(X, n_landmarks=NYSTROEM_LANDMARKS, n_qubits=KERNEL_QUBITS, reps=KERNEL_REPS,
+                 bandwidth=KERNEL_BANDWIDTH, seed=0):
+    """Landmark map for K ≈ C W⁺ Cᵀ: m random training points, their states and W^{-1/2}.
+
+    W is the m×m landmark Gram matrix; eigenvalues below NYSTROEM_RCOND · λ_max are
+    dropped, so `rank` can be smaller than m when the feature space is small.
+    """
+    rng = np.random.default_rng(seed)
+    landmarks = X[np.sort(rng.choice(len(X), min(n_landmarks, len(X)), replace=False))]
+    states = kernel_states(landmarks, n_qubits, reps, bandwidth)
+    eigenvalues, eigenvectors = np.linalg.eigh(_overlaps(states, states))
+    keep = eigenvalues > NYSTROEM_RCOND * eigenvalues[-1]
+    return {
+        'landmarks': landmarks,
+        'states': states,
+        'projection': eigenvectors[:, keep] / np.sqrt(eigenvalues[keep]),
+        'rank': int(keep.sum()),
+        'n_qubits': n_qubits,
+        'reps': reps,
+        'bandwidth': bandwidth,
+    }
+
+
+def nystroem_transform(nystroem, X, chunk_size=KERNEL_CHUNK):
+    """Features F (n, rank) with F Fᵀ ≈ K: only n×m landmark overlaps, computed in chunks."""
+    return np.vstack([
+        _overlaps(kernel_states(X[k:k + chunk_size], nystroem['n_qubits'], nystroem['reps'],
+                                nystroem['bandwidth']), nystroem['states']) @ nystroem['projection']
+        for k in range(0, len(X), chunk_size)
+    ])
+
+
+def nystroem_error(nystroem, X, n_check=NYSTROEM_CHECK_SAMPLES, seed=0):
+    """Error of F Fᵀ against the exact Gram matrix on a random subsample of X."""
+    rng = np.random.default_rng(seed)
+    subset = X[rng.choice(len(X), min(n_check, len(X)), replace=False)]
+    exact = fidelity_kernel(subset, n_qubits=nystroem['n_qubits'], reps=nystroem['reps'],
+                            bandwidth=nystroem['bandwidth'])
+    features = nystroem_transform(nystroem, subset)
+    residual = exact - features @ features.T
+    return {
+        'relative_frobenius': float(np.linalg.norm(residual) / np.linalg.norm(exact)),
+        'max_abs': float(np.abs(residual).max()),
+        'n_check': len(subset),
+    }
+
+
+# ============================================================================
+# KERNEL SVM
+# ============================================================================
+
+def fit_kernel_svm(X, y, n_landmarks=None, n_qubits=KERNEL_QUBITS, reps=KERNEL_REPS,
+                   bandwidth=KERNEL_BANDWIDTH, C=1.0, seed=0):
+    """Quantum-kernel SVM: exact precomputed-Gram SVC, or Nyström features + LinearSVC when n_landmarks is set.
+
+    Returns a dict with the fitted classifier, the Nyström map (None for the
+    exact kernel), the training data the exact kernel predicts against and the
+    fit time in seconds.
+    """
+    from sklearn.svm import SVC, LinearSVC
+
+    start = time.perf_counter()
+    model = {'n_qubits': n_qubits, 'reps': reps, 'bandwidth': bandwidth, 'nystroem': None, 'X_train': X}
+    if n_landmarks is None or n_landmarks >= len(X):
+        model['classifier'] = SVC(kernel='precomputed', C=C).fit(
+            fidelity_kernel(X, n_qubits=n_qubits, reps=reps, bandwidth=bandwidth), y)
+    else:
+        model['nystroem'] = fit_nystroem(X, n_landmarks, n_qubits, reps, bandwidth, seed)
+        model['classifier'] = LinearSVC(C=C).fit(nystroem_transform(model['nystroem'], X), y)
+    model['seconds'] = time.perf_counter() - start
+    return model
+
+
+def kernel_svm_predict(model, X):
+    """Class predictions of a fit_kernel_svm model."""
+    if model['nystroem'] is not None:
+        return model['classifier'].predict(nystroem_transform(model['nystroem'], X))
+    return model['classifier'].predict(fidelity_kernel(X, model['X_train'], model['n_qubits'], model['reps'],
+                                                       model['bandwidth']))
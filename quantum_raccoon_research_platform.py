@@ -7,6 +7,8 @@ import pandas as pd
 import math
 import time
 
+from quantum_ml import moons_dataset, train_vqc
+
 # Page configuration
 st.set_page_config(
     page_title="Quantum Raccoon Research Platform",
@@ -559,26 +561,16 @@ elif page == "🧠 Quantum Neural Networks":
         
         if st.button("🚀 Start QNN Training", key="qnn_training"):
             epochs = 30
-            train_acc = []
-            val_acc = []
+            X_train, X_val, y_train, y_val = moons_dataset()
             
             progress_bar = st.progress(0)
             acc_placeholder = st.empty()
             
-            for epoch in range(epochs):
-                # Simulate training accuracy improvement
-                train_noise = np.random.normal(0, 0.02)
-                val_noise = np.random.normal(0, 0.03)
-                
-                train_a = 0.95 - 0.7 * np.exp(-epoch/8) + train_noise
-                val_a = 0.92 - 0.7 * np.exp(-epoch/10) + val_noise
-                
-                train_acc.append(max(0.2, min(0.98, train_a)))
-                val_acc.append(max(0.15, min(0.95, val_a)))
-                
+            def show_epoch(epoch, history):
                 progress_bar.progress((epoch + 1) / epochs)
                 
-                if epoch % 5 == 0:
+                if epoch % 5 == 0 or epoch == epochs - 1:
+                    train_acc, val_acc = history['train_accuracy'], history['val_accuracy']
                     # Create accuracy plot
                     fig = go.Figure()
                     fig.add_trace(go.Scatter(
@@ -606,8 +598,11 @@ elif page == "🧠 Quantum Neural Networks":
                     )
                     
                     acc_placeholder.plotly_chart(fig, use_container_width=True)
-                
-                time.sleep(0.1)
+            
+            # 4-qubit, 3-layer data re-uploading classifier on two moons
+            history = train_vqc(X_train, y_train, X_val, y_val, n_qubits=4, n_layers=3,
+                                epochs=epochs, callback=show_epoch)
+            val_acc = history['val_accuracy']
             
             st.success(f"✅ Training completed! Final validation accuracy: {val_acc[-1]:.3f}")
     
@@ -0,0 +1,130 @@
+"""
+Quantum Walk Engine
+Discrete-time coined quantum walks on 1D and 2D lattices, plus vectorized
+classical random walks for comparison.
+"""
+
+import numpy as np
+
+
+# ============================================================================
+# COIN OPERATORS
+# ============================================================================
+
+def hadamard_coin(dim=2):
+    """Hadamard coin; for dim=4 the tensor product H⊗H."""
+    H = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+    if dim == 2:
+        return H
+    elif dim == 4:
+        return np.kron(H, H)
+    raise ValueError("Hadamard coin is defined for dim 2 or 4")
+
+
+def grover_coin(dim=4):
+    """Grover diffusion coin 2/d·J − I."""
+    return 2.0 / dim * np.ones((dim, dim), dtype=complex) - np.eye(dim, dtype=complex)
+
+
+def get_coin(name, dim):
+    """Look up a coin operator by display name."""
+    if name == "Hadamard":
+        return hadamard_coin(dim)
+    elif name == "Grover":
+        return grover_coin(dim)
+    raise ValueError(f"Unknown coin: {name}")
+
+
+# ============================================================================
+# COINED QUANTUM WALKS
+# ============================================================================
+
+def quantum_walk_1d(steps, coin="Hadamard", coin_state=None):
+    """Coined walk on a line; returns (positions, final probabilities, RMS spread per step).
+
+    Amplitudes live in a (positions, 2) array: coin component 0 moves left and
+    component 1 moves right, each shift being a single np.roll.
+    """
+    C = get_coin(coin, 2)
+    if coin_state is None:
+        coin_state = np.array([1, 1j]) / np.sqrt(2)  # symmetric spread for the Hadamard coin
+
+    n_sites = 2 * steps + 1
+    positions = np.arange(-steps, steps + 1)
+    psi = np.zeros((n_sites, 2), dtype=complex, order='F')  # contiguous coin components
+    psi[steps] = coin_state
+
+    x2 = positions.astype(float)**2
+    sigma = np.zeros(steps + 1)
+    for t in range(1, steps + 1):
+        # Only sites within distance t of the origin can be occupied
+        window = psi[steps - t:steps + t + 1]
+        left = C[0, 0] * window[:, 0] + C[0, 1] * window[:, 1]
+        right = C[1, 0] * window[:, 0] + C[1, 1] * window[:, 1]
+        window[:, 0] = np.roll(left, -1)
+        window[:, 1] = np.roll(right, 1)
+        density = window.real**2 + window.imag**2
+        sigma[t] = np.sqrt(np.sum(density, axis=1) @ x2[steps - t:steps + t + 1])
+
+    return positions, np.sum(np.abs(psi)**2, axis=1), sigma
+
+
+def quantum_walk_2d(steps, coin="Grover", coin_state=None):
+    """Coined walk on a square lattice; returns (positions, (L, L) probabilities, RMS spread per step).
+
+    Coin components 0–3 shift −x, +x, −y, +y respectively.
+    """
+    C = get_coin(coin, 4)
+    if coin_state is None:
+        coin_state = np.array([1, -1, -1, 1]) / 2  # localized-spreading Grover initial state
+
+    n_sites = 2 * steps + 1
+    positions = np.arange(-steps, steps + 1)
+    psi = np.zeros((n_sites, n_sites, 4), dtype=complex)
+    psi[steps, steps] = coin_state
+
+    r2 = (positions[:, None]**2 + positions[None, :]**2).astype(float)
+    sigma = np.zeros(steps + 1)
+    for t in range(1, steps + 1):
+        lo, hi = steps - t, steps + t + 1
+        window = psi[lo:hi, lo:hi]
+        window[:] = window @ C.T
+        window[:, :, 0] = np.roll(window[:, :, 0], -1, axis=0)
+        window[:, :, 1] = np.roll(window[:, :, 1], 1, axis=0)
+        window[:, :, 2] = np.roll(window[:, :, 2], -1, axis=1)
+        window[:, :, 3] = np.roll(window[:, :, 3], 1, axis=1)
+        density = np.sum(window.real**2 + window.imag**2, axis=2)
+        sigma[t] = np.sqrt(np.sum(density * r2[lo:hi, lo:hi]))
+
+    return positions, np.sum(np.abs(psi)**2, axis=2), sigma
+
+
+# ============================================================================
+# CLASSICAL RANDOM WALKS
+# ============================================================================
+
+def classical_walks(n_walkers, steps, dims=1, seed=None):
+    """Sample n_walkers ±1 walks at once as a cumulative sum; returns (n_walkers, steps + 1[, dims])."""
+    rng = np.random.default_rng(seed)
+    dtype = np.int16 if steps < np.iinfo(np.int16).max else np.int32
+
+    if dims == 1:
+        moves = rng.integers(0, 2, size=(n_walkers, steps), dtype=np.int8) * 2 - 1
+    else:
+        # One unit step along a randomly chosen axis per time step
+        axis = rng.integers(0, dims, size=(n_walkers, steps))
+        sign = rng.integers(0, 2, size=(n_walkers, steps), dtype=np.int8) * 2 - 1
+        moves = np.zeros((n_walkers, steps, dims), dtype=np.int8)
+        np.put_along_axis(moves, axis[..., None], sign[..., None], axis=2)
+
+    paths = np.zeros((n_walkers, steps + 1) + moves.shape[2:], dtype=dtype)
+    np.cumsum(moves, axis=1, dtype=dtype, out=paths[:, 1:])
+    return paths
+
+
+def classical_spread(paths):
+    """RMS displacement from the origin at every step, across walkers."""
+    squared = paths.astype(np.float64)**2
+    if squared.ndim == 3:
+        squared = squared.sum(axis=2)
+    return np.sqrt(squared.mean(axis=0))
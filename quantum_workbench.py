@@ -18,6 +18,36 @@ import json
 from datetime import datetime
 import hashlib
 
+from quantum_algorithms import (
+    grover_search, grover_optimal_iterations, grover_amplitude_animation, grover_success_figure,
+    run_shor, shor_classical_precheck
+)
+from entanglement import (
+    partial_trace, partial_trace_density, von_neumann_entropy, concurrence, concurrence_mixed, negativity,
+    density_matrices, random_states, bipartition_entropies, page_entropy
+)
+from tomography import pauli_bases, outcome_probabilities, simulate_counts, mle_rrr, state_fidelity
+from bell_test import sample_chsh, chsh_landscape, chsh_landscape_figure, optimal_chsh, werner_state
+from anyons import (
+    TARGET_GATES, anyon_model, braid_unitary, parse_braid_word, format_braid_word, gate_distance,
+    search_braid, braid_diagram
+)
+from quantum_hardware import (
+    TOPOLOGY_BUILDERS, PLATFORM_SIZES, get_topology, benchmark_circuit, route_circuit,
+    edge_segments, smallest_fitting_size
+)
+from render_profiler import start_profile, stop_profile, instrument_namespace, render_profile_panel
+from figure_optimizer import optimize_plotly_charts
+from sampling import SHOT_OPTIONS, sample_counts, repetition_code_trials
+from pauli import bloch_vector
+from hamiltonians import (
+    format_hamiltonian, maxcut_hamiltonian, ground_energy, transverse_field_ising, heisenberg_chain, xy_chain
+)
+from time_evolution import compare_evolution, evolution_figure, neel_state, domain_wall_state
+from quantum_ml import (moons_dataset, n_vqc_parameters, train_vqc, vqc_predict_proba,
+                        fit_kernel_svm, kernel_svm_predict, nystroem_error)
+from pes import molecules, bond_lengths, hamiltonian_at, hartree_fock_curve, scan as scan_bond_lengths
+
 # Page configuration
 st.set_page_config(
     page_title="Quantum Research Workbench v4.0.2",
@@ -26,6 +56,14 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Merge same-style decorative traces before every figure is sent to the browser
+optimize_plotly_charts()
+
+# Opt-in render profiling (sidebar toggle): records this script run only
+render_profile = start_profile(
+    st.session_state.get('selected_module_id', 'overview'), st.session_state.get('profile_renders', False)
+)
+
 # Obsidian Glassmorphism Aesthetics CSS
 st.markdown("""
 <style>
@@ -1524,11 +1562,7 @@ def create_bloch_sphere(theta_deg, phi_deg):
 
 def density_matrix_to_bloch(rho):
     """Extract Bloch vector from density matrix."""
-    pauli = pauli_matrices()
-    r_x = np.trace(pauli['X'] @ rho).real
-    r_y = np.trace(pauli['Y'] @ rho).real
-    r_z = np.trace(pauli['Z'] @ rho).real
-    return np.array([r_x, r_y, r_z])
+    return bloch_vector(rho)
 
 def apply_noise_channel(rho, channel_type, strength):
     """Apply noise channel to density matrix."""
@@ -1559,6 +1593,13 @@ def generate_experiment_id():
     hash_obj = hashlib.md5((timestamp + random_component).encode())
     return f"QEXP-{hash_obj.hexdigest()[:8].upper()}"
 
+if render_profile:
+    instrument_namespace(
+        globals(),
+        {'quantum_algorithms', 'entanglement', 'tomography', 'bell_test', 'anyons', 'quantum_hardware'},
+        figures=['create_bloch_sphere']
+    )
+
 # Bento Grid Navigation System - Non-Linear Matrix
 st.sidebar.markdown("## QUANTUM RESEARCH WORKBENCH v4.0.2")
 st.sidebar.markdown("**SYSTEM STATUS:** `OPERATIONAL`")
@@ -1823,6 +1864,8 @@ if 'experiment_log' not in st.session_state:
 # Main content area with cyber-physical transition
 st.markdown("<div class='module-content'>", unsafe_allow_html=True)
 
+module_span = render_profile.begin(f"module:{module_id}", 'module') if render_profile else None
+
 if module_id == "overview":
     # Add particle effect background
     add_particle_effect()
@@ -2244,6 +2287,27 @@ elif module_id == "bloch":
             <p>Relative Phase</p>
         </div>
         """.format(phase_deg if not np.isnan(phase_deg) else 0), unsafe_allow_html=True)
+        
+        # Projective measurement in the selected Pauli basis
+        basis_labels, _ = pauli_bases(1)
+        rho_current = np.outer(current_state, current_state.conj()) / np.vdot(current_state, current_state).real
+        basis_probs = outcome_probabilities(rho_current, 1)[basis_labels.index(meas_basis[0])]
+        st.markdown(f"""
+        <div class='metric-box'>
+            <h3>{basis_probs[0]:.3f} / {basis_probs[1]:.3f}</h3>
+            <p>P(+1) / P(−1) in {meas_basis[0]} Basis</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Single-qubit tomography: 1000 shots in each of the X, Y, Z bases, MLE reconstruction
+        tomo_counts = simulate_counts(rho_current, 1000, seed=0)
+        rho_tomo, _, _ = mle_rrr(tomo_counts)
+        st.markdown(f"""
+        <div class='metric-box'>
+            <h3>{state_fidelity(rho_current, rho_tomo):.4f}</h3>
+            <p>Tomography Fidelity (3 × 1000 shots)</p>
+        </div>
+        """, unsafe_allow_html=True)
     
     # Code panel
     st.markdown("### Executable Code")
@@ -2545,31 +2609,12 @@ elif module_id == "entanglement":
     # Entanglement Measures
     st.markdown("### Entanglement Quantification")
     
-    # Calculate reduced density matrices
-    rho_full = np.outer(state, state.conj())
-    
-    # Trace out qubit 1 to get reduced density matrix for qubit 0
-    rho_0 = np.zeros((2, 2), dtype=complex)
-    rho_0[0, 0] = rho_full[0, 0] + rho_full[1, 1]
-    rho_0[0, 1] = rho_full[0, 2] + rho_full[1, 3]
-    rho_0[1, 0] = rho_full[2, 0] + rho_full[3, 1]
-    rho_0[1, 1] = rho_full[2, 2] + rho_full[3, 3]
-    
-    # Calculate von Neumann entropy
-    eigenvalues = np.linalg.eigvalsh(rho_0)
-    eigenvalues = eigenvalues[eigenvalues > 1e-10]  # Remove numerical zeros
-    entropy = -np.sum(eigenvalues * np.log2(eigenvalues))
-    
-    # Calculate concurrence for two-qubit states
-    # Flip state: σ_y ⊗ σ_y
-    sigma_y = np.array([[0, -1j], [1j, 0]])
-    sigma_yy = np.kron(sigma_y, sigma_y)
-    state_tilde = sigma_yy @ state.conj()
+    rho_0 = partial_trace(state, [0])  # reduced state of qubit 0
+    entropy = von_neumann_entropy(rho_0)
+    concurrence_value = concurrence(state)
+    negativity_value = negativity(density_matrices(state))
     
-    # Concurrence
-    concurrence = np.abs(np.vdot(state, state_tilde))
-    
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
         st.markdown(f"""
         <div class='metric-box'>
@@ -2581,12 +2626,20 @@ elif module_id == "entanglement":
     with col2:
         st.markdown(f"""
         <div class='metric-box'>
-            <h3>{concurrence:.3f}</h3>
+            <h3>{concurrence_value:.3f}</h3>
             <p>Concurrence</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col3:
+        st.markdown(f"""
+        <div class='metric-box'>
+            <h3>{negativity_value:.3f}</h3>
+            <p>Negativity</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
         is_entangled = "Yes" if entropy > 0.01 else "No"
         st.markdown(f"""
         <div class='metric-box'>
@@ -2595,6 +2648,76 @@ elif module_id == "entanglement":
         </div>
         """, unsafe_allow_html=True)
     
+    # Entanglement under white noise: the Werner family p|ψ⟩⟨ψ| + (1-p) I/4, evaluated as one batch
+    st.markdown("### Entanglement Under Noise")
+    p_values = np.linspace(0, 1, 201)
+    werner = werner_state(p_values, state)
+    
+    fig_werner = go.Figure()
+    for label, values, color in [
+        ("Concurrence", concurrence_mixed(werner), '#00D9FF'),
+        ("Negativity", negativity(werner), '#00FF94'),
+        ("S(ρ_A)", von_neumann_entropy(partial_trace_density(werner, [0])), '#7B61FF'),
+    ]:
+        fig_werner.add_trace(go.Scatter(x=p_values, y=values, mode='lines', name=label,
+                                        line=dict(color=color, width=3)))
+    fig_werner.add_vline(x=1/3, line=dict(color='#FF3366', dash='dash'),
+                         annotation_text="separable for p ≤ 1/3")
+    fig_werner.update_layout(
+        xaxis_title='<b>STATE PURITY PARAMETER p</b>',
+        yaxis_title='<b>MEASURE</b>',
+        plot_bgcolor='rgba(10, 10, 10, 0.5)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#E8E8E8', family='JetBrains Mono'),
+        height=380,
+        margin=dict(l=50, r=20, t=30, b=50)
+    )
+    st.plotly_chart(fig_werner, use_container_width=True)
+    st.caption("S(ρ_A) stays at 1 bit for every p: the reduced state of a Bell-state Werner mixture is I/2 "
+               "whatever the noise, so it cannot tell entanglement from noise. Only concurrence and negativity "
+               "track the noise, vanishing on the separable region.")
+    
+    # Multipartite entanglement of Haar-random states across every bipartition
+    st.markdown("### Random-State Ensemble: Entanglement Across All Bipartitions")
+    col1, col2 = st.columns(2)
+    with col1:
+        n_register = st.slider("Register Qubits", 2, 8, 6, key="ent_register_qubits")
+    with col2:
+        n_samples = st.select_slider("Ensemble Size", [50, 100, 200, 500], value=200, key="ent_ensemble")
+    
+    ensemble = random_states(n_samples, n_register, seed=7)
+    cuts, cut_entropies = bipartition_entropies(ensemble)
+    cut_sizes = np.array([len(cut) for cut in cuts])
+    sizes = np.arange(1, n_register // 2 + 1)
+    mean_by_size = [cut_entropies[:, cut_sizes == k].mean() for k in sizes]
+    std_by_size = [cut_entropies[:, cut_sizes == k].std() for k in sizes]
+    
+    fig_page = go.Figure()
+    fig_page.add_trace(go.Scatter(
+        x=sizes, y=mean_by_size, mode='markers', name='Ensemble mean',
+        error_y=dict(type='data', array=std_by_size, color='#00D9FF'),
+        marker=dict(size=12, color='#00D9FF')
+    ))
+    fig_page.add_trace(go.Scatter(
+        x=sizes, y=[page_entropy(k, n_register - k) for k in sizes], mode='lines', name='Page average',
+        line=dict(color='#00FF94', width=2, dash='dash')
+    ))
+    fig_page.add_trace(go.Scatter(
+        x=sizes, y=sizes, mode='lines', name='Maximal (|A| bits)',
+        line=dict(color='#FF3366', width=1, dash='dot')
+    ))
+    fig_page.update_layout(
+        xaxis_title='<b>SUBSYSTEM SIZE |A|</b>',
+        yaxis_title='<b>S(ρ_A) [bits]</b>',
+        plot_bgcolor='rgba(10, 10, 10, 0.5)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#E8E8E8', family='JetBrains Mono'),
+        height=380,
+        margin=dict(l=50, r=20, t=30, b=50)
+    )
+    st.plotly_chart(fig_page, use_container_width=True)
+    st.caption(f"{len(cuts)} bipartitions × {n_samples} states evaluated from batched Schmidt decompositions.")
+    
     # Bell Inequality Violation
     st.markdown("### Bell Inequality (CHSH)")
     st.markdown("""
@@ -2605,40 +2728,48 @@ elif module_id == "entanglement":
     </div>
     """, unsafe_allow_html=True)
     
+    col1, col2 = st.columns(2)
+    with col1:
+        chsh_visibility = st.slider("Source Visibility", 0.0, 1.0, 1.0, 0.01, key="chsh_visibility")
+    with col2:
+        chsh_shots = st.select_slider("Shots per Setting", [1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+                                      value=100_000, key="chsh_shots")
+    
     # Simulate CHSH measurements
     if st.button("Run CHSH Test", type="primary"):
-        # Measurement angles
-        a0, a1 = 0, np.pi/2
-        b0, b1 = np.pi/4, -np.pi/4
+        rho_source = werner_state(chsh_visibility, state)
         
-        # Define Pauli matrices
-        def pauli_x():
-            return np.array([[0, 1], [1, 0]], dtype=complex)
+        # Correlators at the standard settings a0=0, a1=π/2, b0=π/4, b1=-π/4, sampled with binomial shot noise
+        S_samples, S_exact = sample_chsh(rho_source, chsh_shots, repetitions=1000)
+        S = S_samples[0]
         
-        def pauli_z():
-            return np.array([[1, 0], [0, -1]], dtype=complex)
-        
-        # Calculate expectation values
-        def chsh_expectation(state, theta_a, theta_b):
-            # Measurement operators
-            A = np.cos(theta_a) * np.kron(pauli_z(), np.eye(2)) + np.sin(theta_a) * np.kron(pauli_x(), np.eye(2))
-            B = np.cos(theta_b) * np.kron(np.eye(2), pauli_z()) + np.sin(theta_b) * np.kron(np.eye(2), pauli_x())
-            AB = A @ B
-            return np.real(state.conj() @ AB @ state)
-        
-        E_a0b0 = chsh_expectation(state, a0, b0)
-        E_a0b1 = chsh_expectation(state, a0, b1)
-        E_a1b0 = chsh_expectation(state, a1, b0)
-        E_a1b1 = chsh_expectation(state, a1, b1)
-        
-        S = E_a0b0 + E_a0b1 + E_a1b0 - E_a1b1
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.markdown(f"""
+            <div class='metric-box'>
+                <h3>{abs(S):.3f}</h3>
+                <p>CHSH Parameter |S| ({chsh_shots:,} shots)</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with col2:
+            st.markdown(f"""
+            <div class='metric-box'>
+                <h3>{abs(S_exact):.3f} ± {S_samples.std():.3f}</h3>
+                <p>Exact |S| ± Shot Noise</p>
+            </div>
+            """, unsafe_allow_html=True)
+        with col3:
+            st.markdown(f"""
+            <div class='metric-box'>
+                <h3>{optimal_chsh(rho_source):.3f}</h3>
+                <p>Max |S| Over All Settings</p>
+            </div>
+            """, unsafe_allow_html=True)
         
-        st.markdown(f"""
-        <div class='metric-box'>
-            <h3>{abs(S):.3f}</h3>
-            <p>CHSH Parameter |S|</p>
-        </div>
-        """, unsafe_allow_html=True)
+        alphas, betas, S_grid = chsh_landscape(rho_source)
+        fig_chsh = chsh_landscape_figure(alphas, betas, S_grid, title="CHSH Landscape S(α', β)")
+        fig_chsh.update_layout(font=dict(color='#E8E8E8', family='JetBrains Mono'))
+        st.plotly_chart(fig_chsh, use_container_width=True)
         
         # Log experiment
         experiment = {
@@ -2647,9 +2778,12 @@ elif module_id == "entanglement":
             "test": "CHSH Inequality",
             "bell_state": bell_state,
             "chsh_parameter": float(abs(S)),
+            "shots_per_setting": int(chsh_shots),
+            "visibility": float(chsh_visibility),
             "violation": bool(abs(S) > 2),
             "entanglement_entropy": float(entropy),
-            "concurrence": float(concurrence)
+            "concurrence": float(concurrence_value),
+            "negativity": float(negativity_value)
         }
         st.session_state.experiment_log.append(experiment)
         
@@ -2847,12 +2981,19 @@ elif module_id == "vqe":
         optimizer_choice = st.selectbox("Optimizer", ["COBYLA", "SPSA", "Powell"], key="vqe_opt")
         noise_model = st.checkbox("Include shot noise", value=True, key="vqe_noise")
         
-        # Hamiltonian (H₂ molecule example)
-        st.markdown("**Hamiltonian:** H₂ molecule (STO-3G basis)")
-        st.code("H = -1.0523 * II + 0.3979 * ZZ + 0.3979 * XX - 0.0112 * ZI - 0.0112 * IZ", language="text")
+        # Molecular Hamiltonian at the chosen geometry (tabulated STO-3G coefficients, spline-interpolated)
+        molecule = st.selectbox("Molecule", molecules(), key="vqe_molecule")
+        grid = bond_lengths(molecule)
+        bond_length = st.slider(
+            "Bond Length (Å)", float(grid[0]), float(grid[-1]),
+            0.735 if molecule == "H2" else 1.6, 0.005, key=f"vqe_bond_{molecule}"
+        )
+        H_molecule = hamiltonian_at(molecule, bond_length)
+        st.markdown(f"**Hamiltonian:** {molecule} (STO-3G, 2 electrons in 2 orbitals, R = {bond_length:.3f} Å, total energy)")
+        st.code(format_hamiltonian(H_molecule), language="text")
         
-        # Exact ground state (for comparison)
-        E_exact = -1.137  # H₂ exact ground state energy
+        # Exact ground state (for comparison): diagonalization of the Hamiltonian above, cached
+        E_exact = ground_energy(H_molecule)
         
         if st.button("Run VQE Optimization", type="primary", key="run_vqe"):
             progress_bar = st.progress(0)
@@ -2988,7 +3129,61 @@ elif module_id == "vqe":
             <h3>{}</h3>
             <p>Hilbert Space Dimension</p>
         </div>
-        """.format(2**2), unsafe_allow_html=True)  # 2 qubits for H₂
+        """.format(2**2), unsafe_allow_html=True)  # 2 qubits for H₂ and LiH (2-orbital active space)
+    
+    # Potential-energy surface: VQE at every bond length, warm-started along the grid
+    st.markdown("### Bond-Length Scan")
+    
+    scan_col1, scan_col2, scan_col3 = st.columns(3)
+    with scan_col1:
+        scan_molecule = st.selectbox("Molecule", molecules(), key="pes_molecule")
+    with scan_col2:
+        scan_points = st.slider("Geometries", 10, 50, 50, 5, key="pes_points")
+    with scan_col3:
+        scan_chains = st.slider("Parallel chains", 1, 8, 4, key="pes_chains",
+                                help="Independent warm-start chains, each run in its own process")
+    
+    if st.button("Scan Potential Energy Surface", key="run_pes"):
+        grid = bond_lengths(scan_molecule)
+        distances = np.linspace(grid[0], grid[-1], scan_points)
+        
+        start = time.perf_counter()
+        with st.spinner(f"Running VQE at {scan_points} geometries..."):
+            curve = scan_bond_lengths(scan_molecule, distances, chains=scan_chains)
+        elapsed = time.perf_counter() - start
+        
+        fig_pes = go.Figure()
+        fig_pes.add_trace(go.Scatter(
+            x=curve['distance'], y=curve['exact'],
+            mode='lines', line=dict(color='#84CC16', width=2, dash='dash'), name='Exact (FCI)'
+        ))
+        fig_pes.add_trace(go.Scatter(
+            x=grid, y=hartree_fock_curve(scan_molecule),
+            mode='lines', line=dict(color='#F59E0B', width=1), name='Hartree-Fock'
+        ))
+        fig_pes.add_trace(go.Scatter(
+            x=curve['distance'], y=curve['energy'],
+            mode='markers', marker=dict(color='#06B6D4', size=6), name='VQE'
+        ))
+        fig_pes.update_layout(
+            title=f'{scan_molecule} Potential Energy Surface',
+            xaxis_title='Bond Length (Å)',
+            yaxis_title='Energy (Hartree)',
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='white'),
+            height=450
+        )
+        st.plotly_chart(fig_pes, use_container_width=True, key="pes_curve")
+        
+        errors = np.abs(curve['energy'] - curve['exact'])
+        equilibrium = int(np.argmin(curve['energy']))
+        
+        pes_col1, pes_col2, pes_col3, pes_col4 = st.columns(4)
+        pes_col1.metric("Equilibrium R", f"{curve['distance'][equilibrium]:.3f} Å")
+        pes_col2.metric("Minimum Energy", f"{curve['energy'][equilibrium]:.6f} Ha")
+        pes_col3.metric("Max |E_VQE − E_exact|", f"{errors.max():.1e} Ha")
+        pes_col4.metric("Wall Time", f"{elapsed:.2f} s", f"{int(curve['evaluations'].sum()):,} circuits", delta_color="off")
 
 elif module_id == "qaoa":
     # Add energy field effect for optimization landscape
@@ -3213,6 +3408,9 @@ elif module_id == "qaoa":
                 
                 probabilities = np.abs(state)**2
                 
+                # Exact optimum: ground state of the MaxCut cost Hamiltonian
+                exact_cut = -ground_energy(maxcut_hamiltonian(adj_matrix))
+                
                 # Find best solution
                 best_bitstring = ""
                 best_cost = 0
@@ -3262,6 +3460,13 @@ elif module_id == "qaoa":
                         name='MaxCut Value'
                     )
                 )
+                fig_conv.add_hline(
+                    y=exact_cut,
+                    line_dash="dash",
+                    line_color='#84CC16',
+                    annotation_text=f"Exact MaxCut: {exact_cut:.0f} (ratio {optimal_energy / exact_cut:.3f})" if exact_cut else "Exact MaxCut: 0",
+                    annotation_position="right"
+                )
                 fig_conv.update_layout(
                     plot_bgcolor='rgba(0,0,0,0)',
                     paper_bgcolor='rgba(0,0,0,0)',
@@ -3345,60 +3550,64 @@ elif module_id == "qml":
         st.markdown("### Quantum Kernel Methods")
         
         st.latex(r"""
-        K(x, x') = |\langle\phi(x)|\phi(x')\rangle|^2
+        K(x, x') = |\langle\phi(x)|\phi(x')\rangle|^2, \qquad
+        |\phi(x)\rangle = \left(U_Z(x)\, H^{\otimes n}\right)^2 |0\rangle^{\otimes n}
         """)
         
         st.markdown("""
         <div class='latex-display'>
-            <p><strong>Feature Map:</strong> U(x) embeds classical data into quantum Hilbert space</p>
-            <p><strong>Kernel:</strong> Inner product in feature space computed via quantum circuits</p>
-            <p><strong>Classical ML:</strong> Use kernel matrix K for SVM training</p>
+            <p><strong>Feature Map:</strong> U_Z(x) = exp(i Σ x_q Z_q + i Σ x_q x_q' Z_q Z_q'), an IQP-style embedding into 2ⁿ amplitudes</p>
+            <p><strong>Kernel:</strong> State fidelity between feature-map states, computed from batched statevectors</p>
+            <p><strong>Nyström:</strong> K ≈ C W⁺ Cᵀ from m landmark states, so only n×m overlaps are computed and a linear SVM is trained on the features</p>
         </div>
         """, unsafe_allow_html=True)
         
-        # Generate synthetic dataset
-        from sklearn.datasets import make_moons
-        from sklearn.svm import SVC
-        from sklearn.model_selection import train_test_split
+        from sklearn.svm import SVC, LinearSVC
+        from sklearn.kernel_approximation import Nystroem
+        from sklearn.pipeline import make_pipeline
         
-        n_samples = st.slider("Number of Samples", 50, 200, 100, 10, key="qml_samples")
-        noise_level = st.slider("Dataset Noise", 0.0, 0.3, 0.1, 0.05, key="qml_noise")
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            n_samples = st.select_slider("Number of Samples", [100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000],
+                                         200, key="qml_samples")
+            noise_level = st.slider("Dataset Noise", 0.0, 0.3, 0.1, 0.05, key="qml_noise")
+        with col_b:
+            kernel_qubits = st.slider("Feature-Map Qubits", 2, 8, 4, key="qml_qubits")
+            kernel_bandwidth = st.slider("Bandwidth", 0.1, 1.0, 0.5, 0.05, key="qml_bandwidth")
+        with col_c:
+            n_train = int(n_samples * 0.7)
+            exact_allowed = n_train <= 2000
+            kernel_mode = st.radio("Kernel", ["Exact Gram", "Nyström"], index=0 if exact_allowed else 1,
+                                   key="qml_kernel_mode", disabled=not exact_allowed)
+            if not exact_allowed:
+                kernel_mode = "Nyström"
+            n_landmarks = st.select_slider("Landmarks m", [16, 32, 64, 128, 256, 512], 128, key="qml_landmarks",
+                                           disabled=kernel_mode != "Nyström")
+        if not exact_allowed:
+            st.caption(f"The exact {n_train}×{n_train} Gram matrix is too large here; using the Nyström approximation.")
         
         if st.button("Train Quantum Kernel SVM", type="primary", key="train_qk_svm"):
-            # Generate data
-            X, y = make_moons(n_samples=n_samples, noise=noise_level, random_state=42)
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
-            
-            # Simulate quantum kernel computation
-            # In reality: K[i,j] = |⟨φ(x_i)|φ(x_j)⟩|²
-            # Here: approximate with RBF + quantum-inspired transformation
-            
-            progress = st.progress(0)
-            status = st.empty()
+            # Features scaled to [-1, 1] so the encoding angles are bandwidth · π · x
+            X_train, X_test, y_train, y_test = moons_dataset(n_samples, noise_level)
+            nystroem_mode = kernel_mode == "Nyström"
             
-            status.markdown("**Computing quantum kernel matrix...**")
-            progress.progress(0.3)
-            time.sleep(0.5)
-            
-            # Classical baseline
-            clf_classical = SVC(kernel='rbf', gamma='scale')
-            clf_classical.fit(X_train, y_train)
-            acc_classical = clf_classical.score(X_test, y_test)
-            
-            status.markdown("**Training quantum kernel SVM...**")
-            progress.progress(0.6)
-            time.sleep(0.5)
-            
-            # Quantum kernel (simulated with modified RBF)
-            clf_quantum = SVC(kernel='rbf', gamma=2.0)  # Enhanced kernel
-            clf_quantum.fit(X_train, y_train)
-            acc_quantum = clf_quantum.score(X_test, y_test)
-            
-            progress.progress(1.0)
-            status.empty()
+            with st.spinner("Computing quantum kernel and training SVM..."):
+                # Classical baseline with the same approximation as the quantum kernel
+                if nystroem_mode:
+                    clf_classical = make_pipeline(Nystroem(kernel='rbf', n_components=min(n_landmarks, n_train),
+                                                           random_state=0), LinearSVC())
+                else:
+                    clf_classical = SVC(kernel='rbf', gamma='scale')
+                clf_classical.fit(X_train, y_train)
+                acc_classical = clf_classical.score(X_test, y_test)
+                
+                quantum_model = fit_kernel_svm(X_train, y_train, n_landmarks if nystroem_mode else None,
+                                               n_qubits=kernel_qubits, bandwidth=kernel_bandwidth)
+                acc_quantum = np.mean(kernel_svm_predict(quantum_model, X_test) == y_test)
+                approximation = nystroem_error(quantum_model['nystroem'], X_train) if nystroem_mode else None
             
             # Results
-            col1, col2 = st.columns(2)
+            col1, col2, col3 = st.columns(3)
             
             with col1:
                 st.markdown(f"""
@@ -3416,17 +3625,30 @@ elif module_id == "qml":
                 </div>
                 """, unsafe_allow_html=True)
             
+            with col3:
+                st.markdown(f"""
+                <div class='metric-box'>
+                    <h3>{quantum_model['seconds']:.2f} s</h3>
+                    <p>Quantum Kernel Fit ({n_train} samples)</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            if approximation is not None:
+                st.info(f"Nyström: {n_train}×{min(n_landmarks, n_train)} overlaps instead of {n_train}×{n_train}, "
+                        f"rank {quantum_model['nystroem']['rank']}. Relative Frobenius error against the exact Gram "
+                        f"matrix on {approximation['n_check']} samples: {approximation['relative_frobenius']:.2e} "
+                        f"(max |ΔK| = {approximation['max_abs']:.2e})")
+            
             # Decision boundary visualization
-            h = 0.02
-            x_min, x_max = X[:, 0].min() - 0.5, X[:, 0].max() + 0.5
-            y_min, y_max = X[:, 1].min() - 0.5, X[:, 1].max() + 0.5
-            xx, yy = np.meshgrid(np.arange(x_min, x_max, h), np.arange(y_min, y_max, h))
+            x_min, x_max = X_train[:, 0].min() - 0.25, X_train[:, 0].max() + 0.25
+            y_min, y_max = X_train[:, 1].min() - 0.25, X_train[:, 1].max() + 0.25
+            xx, yy = np.meshgrid(np.linspace(x_min, x_max, 120), np.linspace(y_min, y_max, 120))
+            grid = np.c_[xx.ravel(), yy.ravel()]
             
-            Z_classical = clf_classical.predict(np.c_[xx.ravel(), yy.ravel()])
-            Z_classical = Z_classical.reshape(xx.shape)
+            Z_classical = clf_classical.predict(grid).reshape(xx.shape)
+            Z_quantum = kernel_svm_predict(quantum_model, grid).reshape(xx.shape)
             
-            Z_quantum = clf_quantum.predict(np.c_[xx.ravel(), yy.ravel()])
-            Z_quantum = Z_quantum.reshape(xx.shape)
+            shown = np.random.default_rng(0).permutation(n_train)[:1000]
             
             fig_decision = make_subplots(rows=1, cols=2, 
                                         subplot_titles=('Classical RBF Kernel', 'Quantum Kernel'))
@@ -3437,9 +3659,9 @@ elif module_id == "qml":
             ), row=1, col=1)
             
             fig_decision.add_trace(go.Scatter(
-                x=X_train[:, 0], y=X_train[:, 1],
+                x=X_train[shown, 0], y=X_train[shown, 1],
                 mode='markers',
-                marker=dict(color=y_train, colorscale='RdBu', size=8, line=dict(color='white', width=1)),
+                marker=dict(color=y_train[shown], colorscale='RdBu', size=8, line=dict(color='white', width=1)),
                 showlegend=False
             ), row=1, col=1)
             
@@ -3449,9 +3671,9 @@ elif module_id == "qml":
             ), row=1, col=2)
             
             fig_decision.add_trace(go.Scatter(
-                x=X_train[:, 0], y=X_train[:, 1],
+                x=X_train[shown, 0], y=X_train[shown, 1],
                 mode='markers',
-                marker=dict(color=y_train, colorscale='RdBu', size=8, line=dict(color='white', width=1)),
+                marker=dict(color=y_train[shown], colorscale='RdBu', size=8, line=dict(color='white', width=1)),
                 showlegend=False
             ), row=1, col=2)
             
@@ -3465,6 +3687,90 @@ elif module_id == "qml":
             st.plotly_chart(fig_decision, use_container_width=True, key="qml_decision_boundary")
             
             st.success(f"✓ Training complete. Quantum advantage: {(acc_quantum - acc_classical)*100:+.2f}%")
+    
+    else:  # Variational Quantum Classifier
+        st.markdown("### Variational Quantum Classifier")
+        
+        st.latex(r"""
+        |\psi(x, \theta)\rangle = \prod_{l=1}^{L} W_l(\theta_l)\, E(x)\, |0\rangle^{\otimes n}, \qquad
+        P(y = 1 \mid x) = \frac{1 - \langle Z_0 \rangle}{2}
+        """)
+        
+        st.markdown("""
+        <div class='latex-display'>
+            <p><strong>Encoding:</strong> E(x) = ⊗ RY(πx) re-uploaded before every layer</p>
+            <p><strong>Layers:</strong> W(θ) = CNOT ring · ⊗ RZ(φ) RY(θ)</p>
+            <p><strong>Gradient:</strong> Parameter shift ∂⟨Z⟩/∂θₖ = [⟨Z⟩(θₖ + π/2) − ⟨Z⟩(θₖ − π/2)] / 2, shifted circuits branch from the unshifted run inside one batch</p>
+            <p><strong>Optimizer:</strong> Adam on minibatch binary cross-entropy</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            vqc_qubits = st.slider("Qubits", 2, 6, 4, key="vqc_qubits")
+            vqc_layers = st.slider("Layers", 1, 4, 3, key="vqc_layers")
+        with col_b:
+            vqc_samples = st.slider("Number of Samples", 100, 1000, 300, 100, key="vqc_samples")
+            vqc_noise = st.slider("Dataset Noise", 0.0, 0.3, 0.1, 0.05, key="vqc_noise")
+        with col_c:
+            vqc_epochs = st.slider("Epochs", 5, 60, 30, 5, key="vqc_epochs")
+            vqc_batch = st.select_slider("Minibatch Size", [8, 16, 32, 64, 128], 32, key="vqc_batch")
+            vqc_lr = st.slider("Learning Rate", 0.01, 0.3, 0.1, 0.01, key="vqc_lr")
+        
+        n_params = n_vqc_parameters(vqc_qubits, vqc_layers)
+        st.caption(f"{n_params} parameters · each minibatch evaluates {2 * n_params + 1} circuits "
+                   f"(θ and its parameter shifts) on every sample as one ({2 * n_params + 1}, batch, {2**vqc_qubits}) state array")
+        
+        if st.button("Train VQC", type="primary", key="train_vqc"):
+            X_train, X_test, y_train, y_test = moons_dataset(vqc_samples, vqc_noise)
+            
+            progress = st.progress(0)
+            curve_plot = st.empty()
+            
+            def show_progress(epoch, history):
+                progress.progress((epoch + 1) / vqc_epochs)
+                fig_curve = make_subplots(rows=1, cols=2, subplot_titles=('Training Loss', 'Accuracy'))
+                epochs_done = list(range(1, epoch + 2))
+                fig_curve.add_trace(go.Scatter(x=epochs_done, y=history['loss'], mode='lines+markers',
+                                               line=dict(color='#06B6D4', width=2), name='BCE Loss'), row=1, col=1)
+                fig_curve.add_trace(go.Scatter(x=epochs_done, y=history['train_accuracy'], mode='lines+markers',
+                                               line=dict(color='#84CC16', width=2), name='Train'), row=1, col=2)
+                fig_curve.add_trace(go.Scatter(x=epochs_done, y=history['val_accuracy'], mode='lines+markers',
+                                               line=dict(color='#F59E0B', width=2), name='Test'), row=1, col=2)
+                fig_curve.update_xaxes(title_text='Epoch')
+                fig_curve.update_layout(height=350, plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+                                        font=dict(color='white'))
+                curve_plot.plotly_chart(fig_curve, use_container_width=True, key=f"vqc_curve_{epoch}")
+            
+            history = train_vqc(X_train, y_train, X_test, y_test, vqc_qubits, vqc_layers, vqc_epochs,
+                                vqc_batch, vqc_lr, callback=show_progress)
+            
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Test Accuracy", f"{history['val_accuracy'][-1]:.3f}")
+            col2.metric("Train Accuracy", f"{history['train_accuracy'][-1]:.3f}")
+            col3.metric("Final Loss", f"{history['loss'][-1]:.4f}")
+            col4.metric("Time per Epoch", f"{np.mean(history['seconds']) * 1000:.0f} ms")
+            
+            # Decision boundary of the trained circuit on a grid
+            grid_x, grid_y = np.meshgrid(np.linspace(-1.2, 1.2, 80), np.linspace(-1.2, 1.2, 80))
+            grid_proba = vqc_predict_proba(history['params'], np.c_[grid_x.ravel(), grid_y.ravel()],
+                                           vqc_qubits, vqc_layers).reshape(grid_x.shape)
+            
+            fig_boundary = go.Figure()
+            fig_boundary.add_trace(go.Contour(
+                x=grid_x[0], y=grid_y[:, 0], z=grid_proba, colorscale='RdBu', reversescale=True,
+                opacity=0.6, contours=dict(start=0, end=1, size=0.1), colorbar=dict(title='P(y=1)')
+            ))
+            fig_boundary.add_trace(go.Scatter(
+                x=X_test[:, 0], y=X_test[:, 1], mode='markers',
+                marker=dict(color=y_test, colorscale='RdBu', reversescale=True, size=8, line=dict(color='white', width=1)),
+                name='Test samples'
+            ))
+            fig_boundary.update_layout(
+                title='VQC Decision Boundary (scaled features)', height=500,
+                plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', font=dict(color='white')
+            )
+            st.plotly_chart(fig_boundary, use_container_width=True, key="vqc_decision_boundary")
 
 elif module_id == "circuits":
     # Add matrix rain effect
@@ -3685,21 +3991,20 @@ elif module_id == "circuits":
             """, unsafe_allow_html=True)
             
             # Measurement simulation
-            if st.button("Simulate Measurement (1000 shots)", key="circuit_measure"):
-                shots = 1000
+            shots = st.select_slider("Shots", SHOT_OPTIONS, value=1000,
+                                     format_func=lambda n: f"{n:,}", key="circuit_shots")
+            if st.button(f"Simulate Measurement ({shots:,} shots)", key="circuit_measure"):
                 prob_0 = abs(final_state[0])**2
                 
-                # Generate measurement outcomes
-                outcomes = np.random.choice([0, 1], size=shots, p=[prob_0, 1-prob_0])
-                count_0 = np.sum(outcomes == 0)
-                count_1 = np.sum(outcomes == 1)
+                # Outcome counts in one multinomial draw (cost independent of shots)
+                count_0, count_1 = sample_counts([prob_0, 1 - prob_0], shots)
                 
                 fig_meas = go.Figure(data=[
                     go.Bar(
                         x=['|0⟩', '|1⟩'],
                         y=[count_0, count_1],
                         marker=dict(color=['#6366F1', '#06B6D4']),
-                        text=[count_0, count_1],
+                        text=[f"{count_0:,}", f"{count_1:,}"],
                         textposition='outside'
                     )
                 ])
@@ -3872,25 +4177,10 @@ elif module_id == "qec":
         # Simple 3-qubit repetition code for demonstration
         st.markdown("**3-Qubit Repetition Code (Simplified Model)**")
         
-        # Encode logical |0⟩ = |000⟩
-        logical_state = np.array([1, 0, 0, 0, 0, 0, 0, 0], dtype=complex)
-        
-        # Apply random bit-flip errors
+        # Encode logical |0⟩ = |000⟩ and apply independent bit flips; one flip is corrected by majority vote,
+        # two or more are uncorrectable
         num_trials = 1000
-        uncorrected_errors = 0
-        corrected_errors = 0
-        
-        for _ in range(num_trials):
-            # Random errors on 3 qubits
-            errors = np.random.random(3) < error_rate
-            num_errors = np.sum(errors)
-            
-            if num_errors >= 2:
-                # Uncorrectable (majority fails)
-                uncorrected_errors += 1
-            elif num_errors == 1:
-                # Correctable (majority succeeds)
-                corrected_errors += 1
+        corrected_errors, uncorrected_errors = repetition_code_trials(error_rate, num_trials)
         
         success_rate = (num_trials - uncorrected_errors) / num_trials
         
@@ -3958,18 +4248,6 @@ elif module_id == "hardware":
         </div>
         """, unsafe_allow_html=True)
         
-        # Generate heavy-hex layout (simplified 7-qubit example)
-        positions = {
-            0: (0, 0),
-            1: (1, 0.5),
-            2: (1, -0.5),
-            3: (2, 0),
-            4: (3, 0.5),
-            5: (3, -0.5),
-            6: (4, 0)
-        }
-        edges = [(0,1), (0,2), (1,3), (2,3), (3,4), (3,5), (4,6), (5,6)]
-        
     elif platform == "Google Sycamore (Grid)":
         st.markdown("### Google Sycamore Grid Topology")
         st.markdown("""
@@ -3979,13 +4257,6 @@ elif module_id == "hardware":
         </div>
         """, unsafe_allow_html=True)
         
-        positions = {
-            0: (0, 0), 1: (1, 0), 2: (2, 0),
-            3: (0, 1), 4: (1, 1), 5: (2, 1),
-            6: (0, 2), 7: (1, 2), 8: (2, 2)
-        }
-        edges = [(0,1), (1,2), (3,4), (4,5), (6,7), (7,8), (0,3), (1,4), (2,5), (3,6), (4,7), (5,8)]
-        
     elif platform == "IonQ (All-to-All)":
         st.markdown("### IonQ All-to-All Connectivity")
         st.markdown("""
@@ -3995,11 +4266,6 @@ elif module_id == "hardware":
         </div>
         """, unsafe_allow_html=True)
         
-        # Pentagon layout
-        theta = np.linspace(0, 2*np.pi, 6, endpoint=False)
-        positions = {i: (np.cos(t), np.sin(t)) for i, t in enumerate(theta[:5])}
-        edges = [(i, j) for i in range(5) for j in range(i+1, 5)]
-        
     else:  # Rigetti Linear
         st.markdown("### Rigetti Linear Chain")
         st.markdown("""
@@ -4008,9 +4274,12 @@ elif module_id == "hardware":
             <p><strong>Constraints:</strong> High SWAP overhead for long-range interactions</p>
         </div>
         """, unsafe_allow_html=True)
-        
-        positions = {i: (i, 0) for i in range(7)}
-        edges = [(i, i+1) for i in range(6)]
+    
+    device_size = st.selectbox("Device Size", list(PLATFORM_SIZES[platform]), key=f"hw_device_size_{platform}")
+    topology = get_topology(platform, device_size)
+    coords = topology['positions']
+    edge_array = topology['edges']
+    num_qubits = topology['n_qubits']
     
     # Visualize topology with WebGL-style volumetric effects
     st.markdown("""
@@ -4020,67 +4289,67 @@ elif module_id == "hardware":
     """, unsafe_allow_html=True)
     
     fig_topo = go.Figure()
+    marker_scale = 1.0 if num_qubits <= 30 else max(0.25, np.sqrt(30 / num_qubits))
     
-    # Draw energy filaments (edges) with bezier-like curves and gradients
-    for i, j in edges:
-        x0, y0 = positions[i]
-        x1, y1 = positions[j]
-        
-        # Calculate entanglement fidelity (simulated)
-        fidelity = np.random.uniform(0.85, 0.99)
-        opacity = 0.4 + (fidelity - 0.85) / (0.99 - 0.85) * 0.5
-        width = 2 + (fidelity - 0.85) / (0.99 - 0.85) * 4
-        
-        # Create curved path for energy filament effect
-        mid_x = (x0 + x1) / 2
-        mid_y = (y0 + y1) / 2 + 0.1
-        t = np.linspace(0, 1, 20)
-        curve_x = (1-t)**2 * x0 + 2*(1-t)*t * mid_x + t**2 * x1
-        curve_y = (1-t)**2 * y0 + 2*(1-t)*t * mid_y + t**2 * y1
-        
-        fig_topo.add_trace(go.Scatter(
-            x=curve_x, y=curve_y,
-            mode='lines',
-            line=dict(
-                color=f'rgba(0, 217, 255, {opacity})',
-                width=width
-            ),
-            hovertemplate=f'<b>Connection {i} ↔ {j}</b><br>Fidelity: {fidelity:.3f}<extra></extra>',
-            showlegend=False
-        ))
+    # Every coupler in one WebGL trace, segments separated by null breaks
+    edge_x, edge_y = edge_segments(coords, edge_array)
+    fig_topo.add_trace(go.Scattergl(
+        x=edge_x, y=edge_y,
+        mode='lines',
+        line=dict(color='rgba(0, 217, 255, 0.55)', width=1 + 3 * marker_scale),
+        hoverinfo='skip',
+        showlegend=False
+    ))
+    
+    # Coupler midpoints carry the two-qubit gate fidelity from the calibration snapshot
+    fidelities = 1 - topology['edge_errors']
+    midpoints = coords[edge_array].mean(axis=1)
+    fig_topo.add_trace(go.Scattergl(
+        x=midpoints[:, 0], y=midpoints[:, 1],
+        mode='markers',
+        marker=dict(
+            size=4 + 8 * marker_scale,
+            color=fidelities,
+            colorscale=[[0, '#FF3366'], [0.5, '#F59E0B'], [1, '#00FF94']],
+            colorbar=dict(title='2Q Fidelity', len=0.6),
+            symbol='diamond'
+        ),
+        customdata=np.column_stack([edge_array, fidelities]),
+        hovertemplate='<b>Connection %{customdata[0]:.0f} ↔ %{customdata[1]:.0f}</b><br>'
+                      'Fidelity: %{customdata[2]:.4f}<extra></extra>',
+        showlegend=False
+    ))
     
     # Draw pulsating volumetric spheres (qubits)
-    x_coords = [positions[i][0] for i in positions]
-    y_coords = [positions[i][1] for i in positions]
-    coherence_times = np.random.uniform(80, 120, len(positions))  # Simulated T2 times
+    coherence_times = topology['t2_us']  # Calibrated T2 times
     
     # Create varying sizes based on coherence time for data-ink ratio
-    sizes = 30 + (coherence_times - 80) / 40 * 20
-    colors = [f'rgba(0, 217, 255, {0.7 + (t-80)/200})' for t in coherence_times]
+    sizes = (30 + (coherence_times - 80) / 40 * 20) * marker_scale
+    colors = 0.7 + (coherence_times - 80) / 200
     
-    fig_topo.add_trace(go.Scatter(
-        x=x_coords, y=y_coords,
-        mode='markers+text',
+    fig_topo.add_trace(go.Scattergl(
+        x=coords[:, 0], y=coords[:, 1],
+        mode='markers+text' if num_qubits <= 30 else 'markers',
         marker=dict(
             size=sizes,
-            color=colors,
-            line=dict(color='rgba(0, 255, 148, 0.9)', width=3),
+            color=[f'rgba(0, 217, 255, {c:.3f})' for c in colors],
+            line=dict(color='rgba(0, 255, 148, 0.9)', width=3 * marker_scale),
             symbol='circle'
         ),
-        text=[f'<b>Q{i}</b>' for i in positions.keys()],
+        text=[f'<b>Q{i}</b>' for i in range(num_qubits)] if num_qubits <= 30 else None,
         textposition='middle center',
         textfont=dict(size=14, color='#0A0A0A', family='JetBrains Mono'),
-        hovertemplate='<b>Qubit %{text}</b><br>T₂: %{customdata:.1f}μs<extra></extra>',
-        customdata=coherence_times,
+        hovertemplate='<b>Qubit %{customdata[0]:.0f}</b><br>T₂: %{customdata[1]:.1f}μs<extra></extra>',
+        customdata=np.column_stack([np.arange(num_qubits), coherence_times]),
         showlegend=False
     ))
     
     fig_topo.update_layout(
         plot_bgcolor='rgba(10, 10, 10, 0.5)',
         paper_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(visible=False, range=[min(x_coords)-1, max(x_coords)+1]),
-        yaxis=dict(visible=False, scaleanchor='x', range=[min(y_coords)-1, max(y_coords)+1]),
-        height=550,
+        xaxis=dict(visible=False, range=[coords[:, 0].min()-1, coords[:, 0].max()+1]),
+        yaxis=dict(visible=False, scaleanchor='x', range=[coords[:, 1].min()-1, coords[:, 1].max()+1]),
+        height=550 if num_qubits <= 30 else 700,
         margin=dict(l=20, r=20, t=20, b=20),
         font=dict(family='JetBrains Mono', color='#E8E8E8')
     )
@@ -4088,8 +4357,7 @@ elif module_id == "hardware":
     st.plotly_chart(fig_topo, use_container_width=True)
     
     # Connectivity metrics
-    num_qubits = len(positions)
-    num_edges = len(edges)
+    num_edges = len(edge_array)
     avg_degree = 2 * num_edges / num_qubits
     
     col1, col2, col3 = st.columns(3)
@@ -4116,6 +4384,46 @@ elif module_id == "hardware":
             <p>Avg Degree</p>
         </div>
         """, unsafe_allow_html=True)
+    
+    # Circuit routing
+    st.markdown("### Circuit Routing & Platform Comparison")
+    st.markdown("""
+    <div class='research-card'>
+        <p>Logical circuits are mapped onto each device by a noise-aware router: all-pairs shortest 
+        paths (hop counts and $-\\log(1-\\varepsilon_{ij})$ weights) are precomputed per topology, and SWAPs are 
+        inserted by a SABRE-style lookahead heuristic that minimizes hop distance, with coupler fidelity 
+        breaking ties between equally short routes. Success probability 
+        is estimated as $\\prod_g (1-\\varepsilon_g)$ over the routed gates (SWAP = 3 CNOTs).</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        circuit_kind = st.selectbox("Benchmark Circuit", ["QFT", "GHZ", "QAOA (Ring, p=2)", "Random (depth 10)"],
+                                    key="route_circuit")
+    with col2:
+        n_logical = st.slider("Logical Qubits", 3, min(20, num_qubits), min(5, num_qubits), key="route_qubits")
+    
+    logical_gates = benchmark_circuit(circuit_kind, n_logical)
+    comparison = []
+    for candidate in TOPOLOGY_BUILDERS:
+        # Compare on the selected device, and on the smallest device that fits for the other platforms
+        size = device_size if candidate == platform else smallest_fitting_size(candidate, n_logical)
+        routed = route_circuit(logical_gates, candidate, size)
+        comparison.append({
+            "Platform": candidate,
+            "Device": size,
+            "Depth": routed['depth'],
+            "SWAPs": routed['swap_count'],
+            "2Q Gates": routed['two_qubit_gates'],
+            "Est. Success": f"{routed['success_probability']:.3f}",
+        })
+    
+    st.table(comparison)
+    
+    selected = next(row for row in comparison if row["Platform"] == platform)
+    st.caption(f"{platform}: {len(logical_gates)} logical gates → depth {selected['Depth']}, "
+               f"{selected['SWAPs']} SWAPs, estimated success {selected['Est. Success']}")
 
 elif module_id == "complexity":
     st.markdown("<div class='qml-neural'>", unsafe_allow_html=True)
@@ -4192,19 +4500,108 @@ elif module_id == "complexity":
         </div>
         """, unsafe_allow_html=True)
         
-        # Example factoring
-        N_factor = st.number_input("Number to factor", min_value=15, max_value=10000, value=15, step=2)
+        # Order-finding simulation
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            N_factor = st.number_input("Number to factor", min_value=15, max_value=99999, value=3127, step=2)
+        with col_b:
+            a_base = st.number_input("Base a (coprime to N)", min_value=2, max_value=int(N_factor) - 1, value=2)
+        with col_c:
+            shor_shots = st.select_slider("Shots", [64, 256, 1024, 4096], value=1024, key="shor_shots")
+        
         if st.button("Find Factors", type="primary"):
-            factors = []
-            for i in range(2, int(np.sqrt(N_factor)) + 1):
-                if N_factor % i == 0:
-                    factors = [i, N_factor // i]
-                    break
-            
-            if factors:
-                st.success(f"✅ {N_factor} = {factors[0]} × {factors[1]}")
+            precheck = shor_classical_precheck(int(N_factor))
+            if precheck is not None:
+                reason, factors = precheck
+                if factors:
+                    st.info(f"{N_factor} is {reason}: {N_factor} = {factors[0]} × {factors[1]} (no quantum step needed)")
+                else:
+                    st.info(f"{N_factor} is prime")
             else:
-                st.info(f"{N_factor} is prime")
+                start_time = time.perf_counter()
+                shor_result = run_shor(int(N_factor), int(a_base), shots=shor_shots)
+                sim_time = time.perf_counter() - start_time
+                
+                if shor_result['classical_factor']:
+                    p, q = shor_result['classical_factor']
+                    st.success(f"✅ gcd(a, N) = {p} is already a factor: {N_factor} = {p} × {q}")
+                else:
+                    period = shor_result['period']
+                    r = period['order']
+                    
+                    col1, col2, col3, col4 = st.columns(4)
+                    for col, value, label in [
+                        (col1, f"{r:,}", "Order r"),
+                        (col2, f"2^{int(np.log2(period['Q']))}", "Register Size Q"),
+                        (col3, f"{shor_result['order_success_rate']:.1%}", "Shots Yielding r or a Multiple"),
+                        (col4, f"{sim_time * 1000:.0f} ms", "Simulation Time"),
+                    ]:
+                        with col:
+                            st.markdown(f"""
+                            <div class='metric-box'>
+                                <h3>{value}</h3>
+                                <p>{label}</p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                    
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        n_shown = min(2 * r, 400)
+                        fig_seq = go.Figure(go.Scatter(
+                            x=np.arange(n_shown),
+                            y=np.tile(period['sequence'], 2)[:n_shown],
+                            mode='lines+markers',
+                            line=dict(color='#06B6D4', width=1),
+                            marker=dict(size=3)
+                        ))
+                        fig_seq.update_layout(
+                            title=f'f(x) = {a_base}^x mod {N_factor}  (period {r})',
+                            xaxis_title='x',
+                            yaxis_title='f(x)',
+                            plot_bgcolor='rgba(0,0,0,0)',
+                            paper_bgcolor='rgba(0,0,0,0)',
+                            font=dict(color='white'),
+                            height=400
+                        )
+                        st.plotly_chart(fig_seq, use_container_width=True)
+                    
+                    with col2:
+                        hist, edges = np.histogram(shor_result['outcomes'] / period['Q'], bins=512,
+                                                   range=(0, 1), weights=shor_result['counts'])
+                        fig_hist = go.Figure(go.Bar(
+                            x=(edges[:-1] + edges[1:]) / 2, y=hist, width=1 / 512,
+                            marker_color='#F59E0B'
+                        ))
+                        fig_hist.update_layout(
+                            title=f'Period-Finding Register ({shor_shots:,} shots)',
+                            xaxis_title='y / Q  (peaks at k / r)',
+                            yaxis_title='Counts',
+                            plot_bgcolor='rgba(0,0,0,0)',
+                            paper_bgcolor='rgba(0,0,0,0)',
+                            font=dict(color='white'),
+                            height=400
+                        )
+                        st.plotly_chart(fig_hist, use_container_width=True)
+                    
+                    top = np.argsort(shor_result['counts'])[::-1][:8]
+                    st.markdown("**Continued-fraction post-processing (most frequent outcomes)**")
+                    st.table({
+                        "y": [int(y) for y in shor_result['outcomes'][top]],
+                        "counts": [int(c) for c in shor_result['counts'][top]],
+                        "y / Q": [f"{y / period['Q']:.6f}" for y in shor_result['outcomes'][top]],
+                        "candidate r": [int(c) for c in shor_result['candidate_orders'][top]],
+                    })
+                    
+                    if shor_result['factors']:
+                        p, q = shor_result['factors']
+                        st.success(f"✅ {N_factor} = {p} × {q}  (from order r = {r}: gcd({a_base}^(r/2) ± 1, N))")
+                    else:
+                        st.warning(f"Order r = {r} does not yield factors for a = {a_base} "
+                                   f"(r odd or a^(r/2) ≡ −1 mod N). Try another base.")
+                    
+                    if period['captured_mass'] < 1:
+                        st.caption(f"Register distribution evaluated on ±12 outcomes around each peak "
+                                   f"({period['captured_mass']:.2%} of the probability mass).")
     
     elif algorithm == "Grover's Search":
         st.markdown("""
@@ -4218,17 +4615,34 @@ elif module_id == "complexity":
         </div>
         """, unsafe_allow_html=True)
         
-        # Grover iteration count
-        N_search = st.slider("Database size N", 4, 1024, 16, step=4)
-        classical_queries = N_search / 2  # Average
-        quantum_queries = np.pi/4 * np.sqrt(N_search)
+        # Statevector Grover simulation
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            n_search_qubits = st.slider("Search qubits n (N = 2ⁿ)", 2, 24, 10, key="grover_qubits")
+        N_search = 2**n_search_qubits
+        with col_b:
+            n_marked = st.slider("Marked items M", 1, min(16, N_search // 2), 1, key="grover_marked")
+        optimal_iterations = grover_optimal_iterations(N_search, n_marked)
+        with col_c:
+            n_grover_iterations = st.slider("Grover iterations", 1, max(2, 2 * optimal_iterations),
+                                            max(1, optimal_iterations), key="grover_iterations")
+        
+        rng = np.random.default_rng(n_search_qubits * 1000 + n_marked)
+        marked_items = rng.choice(N_search, size=n_marked, replace=False)
+        
+        start_time = time.perf_counter()
+        grover_result = grover_search(n_search_qubits, marked_items, n_grover_iterations)
+        sim_time = time.perf_counter() - start_time
+        
+        classical_queries = N_search / (n_marked + 1)  # Average
+        quantum_queries = n_grover_iterations
         speedup = classical_queries / quantum_queries
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4 = st.columns(4)
         with col1:
             st.markdown(f"""
             <div class='metric-box'>
-                <h3>{classical_queries:.0f}</h3>
+                <h3>{classical_queries:,.0f}</h3>
                 <p>Classical Queries</p>
             </div>
             """, unsafe_allow_html=True)
@@ -4236,7 +4650,7 @@ elif module_id == "complexity":
         with col2:
             st.markdown(f"""
             <div class='metric-box'>
-                <h3>{quantum_queries:.0f}</h3>
+                <h3>{quantum_queries:,}</h3>
                 <p>Quantum Queries</p>
             </div>
             """, unsafe_allow_html=True)
@@ -4244,10 +4658,27 @@ elif module_id == "complexity":
         with col3:
             st.markdown(f"""
             <div class='metric-box'>
-                <h3>{speedup:.1f}×</h3>
+                <h3>{grover_result['success_probability'][-1]:.4f}</h3>
+                <p>Success Probability</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            st.markdown(f"""
+            <div class='metric-box'>
+                <h3>{speedup:,.1f}×</h3>
                 <p>Speedup</p>
             </div>
             """, unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(grover_success_figure(grover_result), use_container_width=True)
+        with col2:
+            st.plotly_chart(grover_amplitude_animation(grover_result), use_container_width=True)
+        
+        st.caption(f"Simulated {n_grover_iterations:,} iterations on a {N_search:,}-amplitude statevector "
+                   f"in {sim_time * 1000:.0f} ms. Marked items: {', '.join(map(str, sorted(marked_items)))}")
     
     else:  # Quantum Simulation
         st.markdown("""
@@ -4261,6 +4692,60 @@ elif module_id == "complexity":
             <p><strong>Status:</strong> First practical quantum advantage demonstrated (2019-2023)</p>
         </div>
         """, unsafe_allow_html=True)
+        
+        # Trotterized spin-chain evolution vs exact Krylov evolution
+        st.markdown("#### Trotterized Spin-Chain Dynamics")
+        st.latex(r"e^{-iHt} \approx \Big(\prod_k e^{-iH_k \Delta t}\Big)^{t/\Delta t} + O(\Delta t^{p}), \quad p = 1, 2")
+        
+        col_a, col_b, col_c = st.columns(3)
+        with col_a:
+            chain_model = st.selectbox("Spin Chain", ["Transverse-Field Ising", "Heisenberg (XXZ)", "XY"], key="sim_model")
+            n_sites = st.slider("Sites n", 4, 20, 12, key="sim_sites")
+            initial_state = st.selectbox("Initial State", ["Néel |0101…⟩", "Domain Wall |0…01…1⟩"], key="sim_initial")
+        with col_b:
+            coupling = st.slider("Coupling J", 0.1, 2.0, 1.0, 0.1, key="sim_coupling")
+            if chain_model == "Transverse-Field Ising":
+                chain_param = st.slider("Transverse Field h", 0.0, 2.0, 1.0, 0.1, key="sim_field")
+            elif chain_model == "Heisenberg (XXZ)":
+                chain_param = st.slider("Anisotropy Δ", 0.0, 2.0, 1.0, 0.1, key="sim_delta")
+            else:
+                chain_param = st.slider("Anisotropy γ", -1.0, 1.0, 0.0, 0.1, key="sim_gamma")
+            periodic = st.checkbox("Periodic boundary", value=True, key="sim_periodic")
+        with col_c:
+            total_time = st.slider("Total Time t (1/J)", 0.5, 10.0, 2.0, 0.5, key="sim_time")
+            trotter_steps = st.slider("Trotter Steps", 1, 100, 20, key="sim_steps")
+            trotter_order = st.radio("Trotter Order", [1, 2], index=1, horizontal=True, key="sim_order")
+        
+        run_exact = st.checkbox("Compare with exact evolution (expm_multiply)", value=True, key="sim_exact",
+                                help="Exact Krylov evolution costs seconds per step beyond ~16 sites")
+        
+        if st.button("Run Time Evolution", type="primary", key="sim_run"):
+            if chain_model == "Transverse-Field Ising":
+                H_chain = transverse_field_ising(n_sites, coupling, chain_param, periodic)
+            elif chain_model == "Heisenberg (XXZ)":
+                H_chain = heisenberg_chain(n_sites, coupling, chain_param, periodic=periodic)
+            else:
+                H_chain = xy_chain(n_sites, coupling, chain_param, periodic=periodic)
+            psi0 = neel_state(n_sites) if initial_state.startswith("Néel") else domain_wall_state(n_sites)
+            
+            with st.spinner(f"Evolving {n_sites} sites ({2**n_sites:,} amplitudes)..."):
+                evolution = compare_evolution(H_chain, psi0, total_time, trotter_steps, trotter_order, exact=run_exact)
+            
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Time Step Δt", f"{evolution['dt']:.3f}")
+            col2.metric("Trotter Step", f"{evolution['trotter_step_seconds'] * 1000:.1f} ms")
+            if run_exact:
+                col3.metric("Exact Step", f"{evolution['exact_step_seconds'] * 1000:.1f} ms",
+                            f"{evolution['exact_step_seconds'] / evolution['trotter_step_seconds']:.0f}× slower",
+                            delta_color="off")
+                col4.metric("Final Infidelity", f"{evolution['infidelity'][-1]:.2e}",
+                            f"max |ΔO| = {np.abs(evolution['trotter'] - evolution['exact']).max():.1e}",
+                            delta_color="off")
+            
+            st.plotly_chart(evolution_figure(evolution), use_container_width=True, key="sim_evolution")
+            st.caption("Each step applies the diagonal part as one phase vector and the off-diagonal terms as "
+                       "layers of 2×2/4×4 unitaries on disjoint qubits (fused up to 4 qubits); the exponentials "
+                       "are computed once per (H, Δt) and cached.")
 
 elif module_id == "topological":
     st.markdown("<div class='circuit-flow'>", unsafe_allow_html=True)
@@ -4296,49 +4781,126 @@ elif module_id == "topological":
     </div>
     """, unsafe_allow_html=True)
     
-    # Braid visualization
+    # Braid composition
     st.markdown("#### Braid Diagram")
-    st.markdown("Select braid operation:")
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        anyon_type = st.selectbox("Anyon Model", ["Fibonacci", "Ising"], key="anyon_model")
+    model = anyon_model(anyon_type)
+    with col2:
+        braid_type = st.selectbox(
+            "Braid Type",
+            ["Identity (No Braid)", "σ₁ (Braid 1-2)", "σ₂ (Braid 2-3)", "σ₁σ₂σ₁ (Yang-Baxter)", "Custom Word"]
+        )
     
-    braid_type = st.selectbox(
-        "Braid Type",
-        ["Identity (No Braid)", "σ₁ (Braid 1-2)", "σ₂ (Braid 2-3)", "σ₁σ₂σ₁ (Yang-Baxter)"]
-    )
+    braid_presets = {
+        "Identity (No Braid)": (),
+        "σ₁ (Braid 1-2)": (1,),
+        "σ₂ (Braid 2-3)": (2,),
+        "σ₁σ₂σ₁ (Yang-Baxter)": (1, 2, 1),
+    }
+    if braid_type == "Custom Word":
+        word_text = st.text_input("Braid Word (k = σₖ, −k = σₖ⁻¹, time runs left to right)", "1 2 -1 2 2",
+                                  key="braid_word")
+        try:
+            braid_word = parse_braid_word(word_text)
+        except ValueError as e:
+            st.error(str(e))
+            braid_word = ()
+    else:
+        braid_word = braid_presets[braid_type]
     
-    # Simple visualization
-    fig_braid = go.Figure()
+    braid_gate = braid_unitary(anyon_type, braid_word)
+    st.markdown(f"**Gate:** {format_braid_word(braid_word)} on {model['n_strands']} {anyon_type} anyons "
+                f"(fusion rule {model['fusion_rule']})")
+    st.plotly_chart(braid_diagram(braid_word, model['n_strands']), use_container_width=True, key="braid_composer_diagram")
     
-    if braid_type == "Identity (No Braid)":
-        # Straight lines
-        for i in range(3):
-            fig_braid.add_trace(go.Scatter(
-                x=[0, 1], y=[i, i],
-                mode='lines',
-                line=dict(color='#6366F1', width=4),
-                showlegend=False
-            ))
-        st.markdown("**Gate:** Identity (no operation)")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("##### Braid Unitary (fusion basis)")
+        st.latex(r"U = \begin{pmatrix} " + " \\\\ ".join(
+            " & ".join(f"{z.real:+.4f} {z.imag:+.4f}i" for z in row) for row in braid_gate
+        ) + r" \end{pmatrix}")
+        st.latex(r"F = \begin{pmatrix} " + " \\\\ ".join(
+            " & ".join(f"{z.real:+.4f}" for z in row) for row in model['F']
+        ) + r" \end{pmatrix}, \quad R = \mathrm{diag}(" + ", ".join(
+            f"e^{{{np.angle(z) / np.pi:+.3f}\\pi i}}" for z in np.diag(model['R'])
+        ) + ")")
+    with col2:
+        st.markdown("##### Distance to Standard Gates")
+        gate_names = list(TARGET_GATES)
+        distances = [float(gate_distance(braid_gate, TARGET_GATES[name])) for name in gate_names]
+        fig_dist = go.Figure(go.Bar(
+            x=distances, y=gate_names, orientation='h',
+            marker=dict(color=['#00FF94' if d < 1e-6 else '#00D9FF' for d in distances]),
+            text=[f"{d:.4f}" for d in distances], textposition='outside'
+        ))
+        fig_dist.update_layout(
+            xaxis_title='<b>d(U, V) = √(1 − |Tr U†V|/2)</b>',
+            xaxis=dict(range=[0, 1], gridcolor='rgba(0, 217, 255, 0.1)'),
+            plot_bgcolor='rgba(10, 10, 10, 0.5)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='#E8E8E8', family='JetBrains Mono'),
+            height=300,
+            margin=dict(l=20, r=20, t=20, b=50)
+        )
+        st.plotly_chart(fig_dist, use_container_width=True)
+    
+    # Braid compiler
+    st.markdown("### Braid Compiler: Approximating Gates by Braiding")
+    col1, col2 = st.columns(2)
+    with col1:
+        target_name = st.selectbox("Target Gate", list(TARGET_GATES), index=3, key="braid_target")
+    with col2:
+        max_braid_length = st.slider("Maximum Braid Length", 2, 20, 14, key="braid_max_length")
+    
+    if st.button("Search Braids", type="primary"):
+        start_time = time.perf_counter()
+        braid_result = search_braid(anyon_type, TARGET_GATES[target_name], max_braid_length)
+        search_time = time.perf_counter() - start_time
+        
+        col1, col2, col3, col4 = st.columns(4)
+        for column, value, label in [
+            (col1, f"{braid_result['distance']:.2e}", "Gate Distance"),
+            (col2, f"{braid_result['length']}", "Braid Length"),
+            (col3, f"{braid_result['candidates']:.2e}", "Candidate Braids"),
+            (col4, f"{search_time * 1000:.0f} ms", "Search Time"),
+        ]:
+            with column:
+                st.markdown(f"""
+                <div class='metric-box'>
+                    <h3>{value}</h3>
+                    <p>{label}</p>
+                </div>
+                """, unsafe_allow_html=True)
         
-    elif braid_type == "σ₁ (Braid 1-2)":
-        # Braid strands 1 and 2
-        t = np.linspace(0, 1, 100)
-        y1 = 0 + 0.3 * np.sin(np.pi * t)
-        y2 = 1 - 0.3 * np.sin(np.pi * t)
+        st.markdown(f"**Best braid:** `{format_braid_word(braid_result['word'])}`")
+        st.plotly_chart(braid_diagram(braid_result['word'], model['n_strands']), use_container_width=True,
+                        key="braid_search_diagram")
         
-        fig_braid.add_trace(go.Scatter(x=t, y=y1, mode='lines', line=dict(color='#6366F1', width=4), showlegend=False))
-        fig_braid.add_trace(go.Scatter(x=t, y=y2, mode='lines', line=dict(color='#06B6D4', width=4), showlegend=False))
-        fig_braid.add_trace(go.Scatter(x=[0,1], y=[2,2], mode='lines', line=dict(color='#84CC16', width=4), showlegend=False))
+        lengths_axis = np.arange(1, max_braid_length + 1)
+        fig_conv = go.Figure(go.Scatter(
+            x=lengths_axis, y=np.maximum(braid_result['best_by_length'], 1e-16),
+            mode='lines+markers', line=dict(color='#00D9FF', width=3), marker=dict(size=8),
+            name='Best distance'
+        ))
+        fig_conv.update_layout(
+            xaxis_title='<b>MAXIMUM BRAID LENGTH</b>',
+            yaxis_title='<b>BEST GATE DISTANCE</b>',
+            yaxis_type='log',
+            plot_bgcolor='rgba(10, 10, 10, 0.5)',
+            paper_bgcolor='rgba(0,0,0,0)',
+            font=dict(color='#E8E8E8', family='JetBrains Mono'),
+            height=350,
+            margin=dict(l=50, r=20, t=20, b=50)
+        )
+        st.plotly_chart(fig_conv, use_container_width=True)
         
-        st.markdown("**Gate:** $\\sigma_1$ (exchange anyons 1 and 2)")
-    
-    fig_braid.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(0,0,0,0)',
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False),
-        height=300
-    )
-    st.plotly_chart(fig_braid, use_container_width=True)
+        if not model['universal'] and braid_result['distance'] > 1e-6:
+            st.info("Ising braids only generate the Clifford group, so this gate cannot be reached by braiding "
+                    "at any length. Ising-based proposals supply the T gate through magic-state injection.")
+        elif model['universal']:
+            st.caption("Fibonacci braids are dense in SU(2): longer braids approximate any gate arbitrarily well.")
     
     # Physical platforms
     st.markdown("### Physical Realizations")
@@ -4368,6 +4930,9 @@ else:
     </div>
     """, unsafe_allow_html=True)
 
+if module_span:
+    render_profile.end(module_span)
+
 # Close module div tags
 st.markdown("</div>", unsafe_allow_html=True)
 
@@ -4382,3 +4947,11 @@ st.markdown("""
     </p>
 </div>
 """, unsafe_allow_html=True)
+
+# Render profiler panel
+st.sidebar.markdown("---")
+st.sidebar.toggle("PROFILE PAGE RENDERS", key="profile_renders",
+                  help="Time module renders, figure builds, chart payloads, HTML injection and simulation calls")
+if render_profile:
+    stop_profile()
+    render_profile_panel(render_profile, st.sidebar.expander("RENDER PROFILE", expanded=True))
@@ -0,0 +1,298 @@
+"""
+Render Profiler
+Opt-in instrumentation for the Streamlit pages: times whole module renders,
+figure builders, simulation calls, st.plotly_chart calls (with the serialized
+figure size), HTML injected through st.markdown, and time.sleep calls.
+
+The Streamlit and time hooks are installed once per process and record only
+on the thread whose script run started a profile, so one session profiling
+does not affect any other session. Profiles export as Chrome-trace JSON
+(chrome://tracing, Perfetto) with nested spans per run.
+"""
+
+from contextlib import contextmanager
+import functools
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+
+
+CATEGORIES = ['module', 'simulation', 'figure', 'chart', 'html', 'sleep']
+
+CATEGORY_COLORS = {
+    'module': '#8B5CF6',
+    'simulation': '#00D9FF',
+    'figure': '#00FF94',
+    'chart': '#F59E0B',
+    'html': '#EC4899',
+    'sleep': '#EF4444',
+}
+
+_active = threading.local()
+_hooks_installed = False
+_real_sleep = getattr(time.sleep, '__wrapped__', time.sleep)  # unwrap if a previous import patched it
+
+
+# ============================================================================
+# PROFILE RECORDING
+# ============================================================================
+
+class RenderProfile:
+    """Timed spans of one script run, stored as Chrome-trace complete ('X') events."""
+
+    def __init__(self, name):
+        self.name = name
+        self.origin = time.perf_counter()
+        self.events = []
+        self.pid = os.getpid()
+        self.tid = threading.get_ident()
+
+    def _now_us(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def begin(self, name, category, **args):
+        """Open a span; pass the returned token to end()."""
+        return {'name': name, 'cat': category, 'ph': 'X', 'ts': self._now_us(),
+                'pid': self.pid, 'tid': self.tid, 'args': args}
+
+    def end(self, event, **args):
+        """Close a span opened with begin() and record it."""
+        event['dur'] = self._now_us() - event['ts']
+        event['args'].update(args)
+        self.events.append(event)
+        return event
+
+    @contextmanager
+    def span(self, name, category, **args):
+        """Context manager recording the enclosed block as one span."""
+        event = self.begin(name, category, **args)
+        try:
+            yield event
+        finally:
+            self.end(event)
+
+    def total(self):
+        """Wall time from profile start to now, in milliseconds."""
+        return self._now_us() / 1e3
+
+    def summary(self):
+        """Per-category call counts and summed durations (ms); module spans give the wall time."""
+        rows = {category: {'calls': 0, 'ms': 0.0, 'bytes': 0} for category in CATEGORIES}
+        for event in self.events:
+            row = rows.setdefault(event['cat'], {'calls': 0, 'ms': 0.0, 'bytes': 0})
+            row['calls'] += 1
+            row['ms'] += event['dur'] / 1e3
+            row['bytes'] += event['args'].get('bytes', 0)
+        return rows
+
+    def slowest(self, n=10, exclude=('module',)):
+        """The n longest spans outside the excluded categories."""
+        events = [e for e in self.events if e['cat'] not in exclude]
+        return sorted(events, key=lambda e: e['dur'], reverse=True)[:n]
+
+    def chrome_trace(self):
+        """Chrome-trace JSON (trace event format) for offline analysis."""
+        metadata = [
+            {'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': self.tid, 'args': {'name': self.name}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': self.tid, 'args': {'name': 'script run'}},
+        ]
+        return json.dumps({'traceEvents': metadata + self.events, 'displayTimeUnit': 'ms'}, default=str)
+
+
+def start_profile(name, enabled=True):
+    """Start profiling the current script run (or stop, when disabled); returns the profile or None."""
+    install_hooks()
+    _active.profile = RenderProfile(name) if enabled else None
+    return _active.profile
+
+
+def current_profile():
+    """The profile recording on this thread, if any."""
+    return getattr(_active, 'profile', None)
+
+
+def stop_profile():
+    """Detach the current profile from this thread and return it."""
+    profile = current_profile()
+    _active.profile = None
+    return profile
+
+
+# ============================================================================
+# INSTRUMENTATION
+# ============================================================================
+
+def timed(function, category='simulation', name=None):
+    """Wrap a function so each call is recorded as a span while a profile is active."""
+    if getattr(function, '_render_profiled', False):
+        return function
+    label = name or getattr(function, '__name__', repr(function))
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        profile = current_profile()
+        if profile is None:
+            return function(*args, **kwargs)
+        with profile.span(label, category):
+            return function(*args, **kwargs)
+
+    wrapper._render_profiled = True
+    return wrapper
+
+
+def instrument_namespace(namespace, modules, figures=()):
+    """Rebind the engine functions imported into a script's namespace to timed wrappers.
+
+    Functions defined in any of the named modules are timed as 'simulation'
+    calls, except builders whose name marks them as figures; names in figures
+    (e.g. plotting helpers defined in the script itself) are always 'figure'.
+    """
+    for name, obj in list(namespace.items()):
+        if not callable(obj) or isinstance(obj, type):
+            continue
+        if name in figures:
+            namespace[name] = timed(obj, 'figure', name)
+        elif getattr(obj, '__module__', None) in modules:
+            is_figure = any(tag in name for tag in ('figure', 'diagram', 'animation'))
+            namespace[name] = timed(obj, 'figure' if is_figure else 'simulation', name)
+
+
+def _figure_size(figure):
+    """Serialized size of a Plotly figure in bytes (what the browser receives)."""
+    try:
+        return len(figure.to_json()) if hasattr(figure, 'to_json') else len(json.dumps(figure, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _wrap_plotly_chart(method):
+    @functools.wraps(method, updated=())
+    def plotly_chart(self, figure_or_data, *args, **kwargs):
+        profile = current_profile()
+        if profile is None:
+            return method(self, figure_or_data, *args, **kwargs)
+        event = profile.begin(f"plotly_chart:{kwargs.get('key') or 'auto'}", 'chart')
+        try:
+            return method(self, figure_or_data, *args, **kwargs)
+        finally:
+            profile.end(event, traces=len(getattr(figure_or_data, 'data', ())))
+            # Measured after the span closes so the extra serialization is not billed to the chart
+            event['args']['bytes'] = _figure_size(figure_or_data)
+    plotly_chart._render_profiled = True
+    return plotly_chart
+
+
+def _wrap_markdown(method):
+    @functools.wraps(method, updated=())
+    def markdown(self, body, *args, **kwargs):
+        profile = current_profile()
+        if profile is None or not kwargs.get('unsafe_allow_html'):
+            return method(self, body, *args, **kwargs)
+        with profile.span('markdown:html', 'html', bytes=len(str(body).encode('utf-8'))):
+            return method(self, body, *args, **kwargs)
+    markdown._render_profiled = True
+    return markdown
+
+
+def _profiled_sleep(seconds):
+    profile = current_profile()
+    if profile is None:
+        return _real_sleep(seconds)
+    with profile.span('time.sleep', 'sleep', seconds=seconds):
+        return _real_sleep(seconds)
+
+
+_profiled_sleep.__wrapped__ = _real_sleep
+
+
+def install_hooks():
+    """Patch DeltaGenerator.plotly_chart/markdown, their st.* aliases and time.sleep (once per import).
+
+    Hooks left by a previous import of this module (Streamlit reloads edited
+    modules) are unwrapped first so they are replaced rather than stacked.
+    """
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    import streamlit as st
+    from streamlit.delta_generator import DeltaGenerator
+
+    for attribute, wrap in (('plotly_chart', _wrap_plotly_chart), ('markdown', _wrap_markdown)):
+        method = getattr(DeltaGenerator, attribute)
+        if getattr(method, '_render_profiled', False):
+            method = method.__wrapped__
+        wrapped = wrap(method)
+        setattr(DeltaGenerator, attribute, wrapped)
+        # st.plotly_chart / st.markdown are bound to the main container at import time
+        alias = getattr(st, attribute)
+        main = alias.args[0] if isinstance(alias, functools.partial) else alias.__self__
+        setattr(st, attribute, functools.partial(wrapped, main))
+    time.sleep = _profiled_sleep
+    _hooks_installed = True
+
+
+# ============================================================================
+# FIGURES
+# ============================================================================
+
+def timeline_figure(profile, max_events=400):
+    """Gantt-style timeline of the run: one row per category, bars at each span."""
+    events = sorted(profile.events, key=lambda e: e['dur'], reverse=True)[:max_events]
+    fig = go.Figure()
+    for category in CATEGORIES:
+        selected = [e for e in events if e['cat'] == category]
+        if not selected:
+            continue
+        fig.add_trace(go.Bar(
+            x=np.array([e['dur'] for e in selected]) / 1e3,
+            base=np.array([e['ts'] for e in selected]) / 1e3,
+            y=[category] * len(selected),
+            orientation='h',
+            marker=dict(color=CATEGORY_COLORS[category]),
+            name=category,
+            customdata=[e['name'] for e in selected],
+            hovertemplate='%{customdata}<br>%{base:.1f} ms + %{x:.2f} ms<extra></extra>'
+        ))
+    fig.update_layout(
+        barmode='overlay',
+        xaxis_title='ms since run start',
+        yaxis=dict(categoryorder='array', categoryarray=CATEGORIES[::-1]),
+        plot_bgcolor='rgba(10, 10, 10, 0.5)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#E8E8E8', family='JetBrains Mono', size=10),
+        showlegend=False,
+        height=260,
+        margin=dict(l=10, r=10, t=10, b=40)
+    )
+    return fig
+
+
+def render_profile_panel(profile, container):
+    """Summary metrics, slowest spans, timeline and Chrome-trace download inside a Streamlit container.
+
+    Call after stop_profile() so the panel's own widgets are not recorded.
+    """
+    rows = profile.summary()
+    container.markdown(f"**Run total:** `{profile.total():.1f} ms`")
+    container.dataframe(
+        [{'category': category, 'calls': row['calls'], 'ms': round(row['ms'], 2),
+          'KB': round(row['bytes'] / 1024, 1)} for category, row in rows.items() if row['calls']],
+        hide_index=True, use_container_width=True
+    )
+    slowest = profile.slowest(8)
+    if slowest:
+        container.markdown("**Slowest spans**")
+        container.dataframe(
+            [{'span': e['name'], 'cat': e['cat'], 'ms': round(e['dur'] / 1e3, 2)} for e in slowest],
+            hide_index=True, use_container_width=True
+        )
+    container.plotly_chart(timeline_figure(profile), use_container_width=True, key="render_profile_timeline")
+    container.download_button(
+        "Export Chrome trace", profile.chrome_trace(),
+        file_name=f"render_trace_{profile.name}.json", mime="application/json",
+        key="render_profile_download"
+    )
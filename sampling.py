@@ -0,0 +1,233 @@
+"""
+Measurement Sampling & Binning
+Finite-shot measurement statistics produced directly as counts. Discrete
+outcomes are drawn with one multinomial call over their probabilities, and
+continuous Born-rule densities given on a grid are sampled straight into
+display bins through their precomputed CDF, so the cost depends on the number
+of outcomes or bins, never on the number of shots. Only bin edges and counts
+are sent to Plotly.
+
+This is the one sampling service for every measurement simulation: all
+functions take an explicit seed (an int, a np.random.Generator to continue
+a stream, or None). Where individual shot records are needed they come from
+a Walker/Vose alias table (O(1) per shot after O(outcomes) setup), and
+register counts are exposed as lazily formatted bitstring → count mappings.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+import plotly.graph_objects as go
+from scipy.special import comb
+
+
+SHOT_OPTIONS = [100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+# ============================================================================
+# DISCRETE OUTCOMES
+# ============================================================================
+
+def normalized(probabilities):
+    """Probability vector(s) along the last axis with rounding noise removed (clipped at 0, summing to 1)."""
+    p = np.clip(np.asarray(probabilities, dtype=float), 0.0, None)
+    total = p.sum(axis=-1, keepdims=True)
+    if np.any(total <= 0):
+        raise ValueError("Probabilities must have a positive sum")
+    return p / total
+
+
+def sample_counts(probabilities, shots, seed=None):
+    """Outcome counts of shots measurements: one multinomial draw per probability vector (batches broadcast)."""
+    rng = np.random.default_rng(seed)
+    return rng.multinomial(shots, normalized(probabilities))
+
+
+def alias_table(probabilities):
+    """Vose alias table (threshold, alias) of one probability vector, built in O(outcomes)."""
+    p = normalized(probabilities)
+    n = len(p)
+    scaled = p * n
+    threshold = np.ones(n)
+    alias = np.arange(n)
+    small = list(np.flatnonzero(scaled < 1.0))
+    large = list(np.flatnonzero(scaled >= 1.0))
+    while small and large:
+        s, l = small.pop(), large.pop()
+        threshold[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    return threshold, alias  # leftovers keep threshold 1 (rounding noise)
+
+
+def sample_shots(probabilities, shots, seed=None, table=None):
+    """Per-shot outcome indices (shots,) of one probability vector, drawn from its alias table.
+
+    Pass a precomputed alias_table as table to reuse it across calls.
+    """
+    rng = np.random.default_rng(seed)
+    threshold, alias = table if table is not None else alias_table(probabilities)
+    column = rng.integers(0, len(threshold), size=shots)
+    return np.where(rng.random(shots) < threshold[column], column, alias[column])
+
+
+def sample_each(probabilities, seed=None):
+    """One outcome index per row of a (batch, outcomes) array whose rows are different distributions."""
+    rng = np.random.default_rng(seed)
+    cumulative = np.cumsum(normalized(probabilities), axis=-1)
+    u = rng.random(cumulative.shape[:-1])[..., None]
+    return np.minimum(np.sum(u >= cumulative, axis=-1), cumulative.shape[-1] - 1)
+
+
+def measure(probabilities, seed=None):
+    """A single measurement outcome index (one click of a demo)."""
+    return int(sample_each(probabilities, seed))
+
+
+def repetition_code_trials(error_rate, trials, n_qubits=3, seed=None):
+    """(corrected, uncorrectable) trial counts of an n-qubit bit-flip repetition code under independent flips.
+
+    The number of flipped qubits per trial is Binomial(n, p), so all trials are
+    one multinomial draw over 0…n flips; majority voting corrects fewer than n/2.
+    """
+    flips = np.arange(n_qubits + 1)
+    pmf = comb(n_qubits, flips) * error_rate**flips * (1 - error_rate)**(n_qubits - flips)
+    counts = sample_counts(pmf, trials, seed)
+    majority = (n_qubits + 1) // 2
+    return int(counts[1:majority].sum()), int(counts[majority:].sum())
+
+
+# ============================================================================
+# BITSTRING COUNTS
+# ============================================================================
+
+class BitstringCounts(Mapping):
+    """Read-only {bitstring: count} view of a register's count vector.
+
+    Keys are formatted only when iterated, and only for outcomes that
+    occurred, so a 2^n count vector costs nothing until it is displayed.
+    Bit order: index 0b101 of a 3-qubit register is '101' (qubit 0 leftmost).
+    """
+
+    def __init__(self, counts, n_bits=None):
+        self.counts = np.asarray(counts)
+        self.n_bits = n_bits if n_bits is not None else max(1, int(np.ceil(np.log2(len(self.counts)))))
+
+    def _key(self, index):
+        return format(int(index), f'0{self.n_bits}b')
+
+    def __getitem__(self, bitstring):
+        try:
+            index = int(bitstring, 2)
+        except (TypeError, ValueError):
+            raise KeyError(bitstring)
+        if len(bitstring) != self.n_bits or index >= len(self.counts) or self.counts[index] == 0:
+            raise KeyError(bitstring)
+        return int(self.counts[index])
+
+    def __iter__(self):
+        return (self._key(index) for index in np.flatnonzero(self.counts))
+
+    def __len__(self):
+        return int(np.count_nonzero(self.counts))
+
+    def __repr__(self):
+        preview = dict(self.most_common(8))
+        more = ', ...' if len(self) > 8 else ''
+        return f"BitstringCounts({preview}{more})"
+
+    @property
+    def shots(self):
+        return int(self.counts.sum())
+
+    def most_common(self, n=None):
+        """[(bitstring, count), ...] in decreasing count order, like collections.Counter."""
+        hit = np.flatnonzero(self.counts)
+        hit = hit[np.argsort(-self.counts[hit], kind='stable')][:n]
+        return [(self._key(index), int(self.counts[index])) for index in hit]
+
+    def frequencies(self):
+        """Count vector divided by the number of shots."""
+        return self.counts / max(self.shots, 1)
+
+
+def bitstring_counts(probabilities, shots, n_bits=None, seed=None):
+    """Measure a register shots times: BitstringCounts, or a list of them for a batch of vectors."""
+    counts = sample_counts(probabilities, shots, seed)
+    if counts.ndim == 1:
+        return BitstringCounts(counts, n_bits)
+    return [BitstringCounts(row, n_bits) for row in counts.reshape(-1, counts.shape[-1])]
+
+
+# ============================================================================
+# CONTINUOUS DENSITIES
+# ============================================================================
+
+def grid_cdf(x, density):
+    """Cumulative distribution of a density sampled on an increasing grid (trapezoid rule, ends at 1)."""
+    density = np.clip(np.asarray(density, dtype=float), 0.0, None)
+    areas = np.diff(x) * (density[1:] + density[:-1]) / 2
+    cdf = np.concatenate([[0.0], np.cumsum(areas)])
+    return cdf / cdf[-1]
+
+
+def bin_probabilities(x, density, edges):
+    """Probability mass of each bin [edges[k], edges[k+1]) under a gridded density."""
+    return np.diff(np.interp(edges, x, grid_cdf(x, density)))
+
+
+def sample_histogram(x, density, shots, bins=50, value_range=None, seed=None):
+    """Histogram (edges, counts) of shots position measurements of a gridded density.
+
+    Equivalent to inverse-CDF sampling followed by np.histogram, but the counts
+    are drawn as one multinomial over the bins without materializing samples.
+    """
+    lo, hi = value_range if value_range is not None else (x[0], x[-1])
+    edges = np.linspace(lo, hi, bins + 1)
+    return edges, sample_counts(bin_probabilities(x, density, edges), shots, seed)
+
+
+def histogram(samples, bins=50, value_range=None, weights=None):
+    """Server-side np.histogram of samples that already exist: (edges, counts)."""
+    counts, edges = np.histogram(samples, bins=bins, range=value_range, weights=weights)
+    return edges, counts
+
+
+def voxel_probabilities(density, n_grid=20, extent=10.0, oversample=3):
+    """Probability of each cell of an n_grid³ cube [−extent, extent]³ under a 3D density f(x, y, z).
+
+    Each voxel is integrated with oversample³ midpoint samples (which also keeps
+    integrable singularities at the origin finite). Mass outside the cube is dropped.
+    Returns (voxel centres (n_grid,), probabilities (n_grid, n_grid, n_grid)).
+    """
+    width = 2 * extent / n_grid
+    centres = -extent + width * (np.arange(n_grid) + 0.5)
+    offsets = width * ((np.arange(oversample) + 0.5) / oversample - 0.5)
+    fine = (centres[:, None] + offsets[None, :]).ravel()
+    X, Y, Z = np.meshgrid(fine, fine, fine, indexing='ij')
+    values = density(X, Y, Z).reshape(n_grid, oversample, n_grid, oversample, n_grid, oversample)
+    mass = values.sum(axis=(1, 3, 5))
+    return centres, mass / mass.sum()
+
+
+# ============================================================================
+# FIGURES
+# ============================================================================
+
+def density_scale(edges, counts):
+    """Counts rescaled to a probability density (Plotly's histnorm='probability density')."""
+    total = counts.sum()
+    return counts / (total * np.diff(edges)) if total else np.zeros(len(counts))
+
+
+def histogram_bar(edges, counts, density=False, **trace_kwargs):
+    """go.Bar drawing pre-binned counts as a histogram: touching bars of the bin width."""
+    edges = np.asarray(edges, dtype=float)
+    heights = density_scale(edges, counts) if density else counts
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2, y=heights, width=np.diff(edges),
+        customdata=counts,
+        hovertemplate='%{x:.3g}: %{customdata:,} shots<extra></extra>',
+        **trace_kwargs
+    )
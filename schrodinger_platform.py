@@ -13,15 +13,20 @@ import pandas as pd
 import time
 from scipy import stats
 from scipy.linalg import expm
-from sklearn.datasets import make_classification, make_moons, make_circles
-from sklearn.model_selection import train_test_split
-from sklearn.svm import SVC
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.neural_network import MLPClassifier
-from sklearn.metrics import accuracy_score, confusion_matrix
+from sklearn.datasets import make_moons
+from sklearn.metrics import confusion_matrix
 import matplotlib.pyplot as plt
 from io import BytesIO
 
+from sampling import SHOT_OPTIONS, sample_counts, sample_histogram, histogram_bar, voxel_probabilities
+from hamiltonians import H2_HAMILTONIAN, ground_energy
+from model_comparison import compare_models, dataset_params, model_config
+from teleportation import teleport, teleportation_statistics, fidelity_histogram_figure, CLASSICAL_FIDELITY_LIMIT
+from wave_mechanics import (
+    propagate_wavepacket, transmission_probability, wavepacket_animation, solve_eigenstates
+)
+from figure_optimizer import optimize_plotly_charts
+
 # Page configuration
 st.set_page_config(
     page_title="Schrödinger Quantum Research Platform",
@@ -30,6 +35,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Merge same-style decorative traces before every figure is sent to the browser
+optimize_plotly_charts()
+
 # Premium CSS styling
 st.markdown("""
     <style>
@@ -910,35 +918,18 @@ elif page == "🌊 Wave Mechanics & Foundations":
             show_potential = st.checkbox("Show Potential V(x)", value=True)
         
         with col2:
-            # Generate wavefunction
-            x = np.linspace(-5, 5, 1000)
-            
-            if potential_type == "Infinite Square Well":
-                L = 5
-                psi = np.sqrt(2/L) * np.sin(n_quantum * np.pi * (x + L/2) / L)
-                psi = np.where(np.abs(x) <= L/2, psi, 0)
-                V = np.where(np.abs(x) <= L/2, 0, 10)
-                
-            elif potential_type == "Harmonic Oscillator":
-                # Hermite polynomial approximation
-                omega = 1.0
-                alpha = np.sqrt(omega / 2)
-                psi = np.exp(-alpha**2 * x**2 / 2) * (alpha * x)**(n_quantum-1)
-                V = 0.5 * omega**2 * x**2
-                
-            elif potential_type == "Finite Square Well":
-                L = 4
-                V0 = 3
-                psi = np.sin(n_quantum * np.pi * (x + L/2) / L)
-                psi = np.where(np.abs(x) <= L/2, psi, psi * np.exp(-0.5 * (np.abs(x) - L/2)))
-                V = np.where(np.abs(x) <= L/2, 0, V0)
-                
-            else:  # Double Well
-                psi = (np.exp(-(x-2)**2) + (-1)**(n_quantum-1) * np.exp(-(x+2)**2))
-                V = 0.5 * (x**4 - 4*x**2)
-            
-            # Normalize
-            psi = psi / np.sqrt(np.sum(psi**2) * (x[1] - x[0]))
+            # Solve the finite-difference eigenproblem (memoized per potential and grid)
+            well_params = {
+                "Infinite Square Well": (('width', 5.0),),
+                "Harmonic Oscillator": (('omega', 1.0),),
+                "Finite Square Well": (('width', 4.0), ('depth', 3.0)),
+                "Double Well": (('depth', 2.0), ('separation', float(np.sqrt(2)))),
+            }[potential_type]
+            n_levels = 6
+            x, V, energies, eigenstates = solve_eigenstates(potential_type, well_params, 1000, n_levels)
+            
+            psi = eigenstates[n_quantum - 1]
+            V = np.minimum(V, 1.5 * energies[-1])
             prob_density = np.abs(psi)**2
             
             # Plot
@@ -986,9 +977,6 @@ elif page == "🌊 Wave Mechanics & Foundations":
         # Energy levels visualization
         st.markdown("### Energy Levels")
         
-        n_levels = 6
-        energies = [(n + 0.5) for n in range(n_levels)]
-        
         fig = go.Figure()
         
         for i, E in enumerate(energies):
@@ -999,12 +987,12 @@ elif page == "🌊 Wave Mechanics & Foundations":
                 x=[0, 1], y=[E, E],
                 mode='lines',
                 line=dict(color=color, width=width),
-                name=f'n={i+1}, E={E:.1f}',
+                name=f'n={i+1}, E={E:.3f}',
                 showlegend=True
             ))
         
         fig.update_layout(
-            title="Energy Level Diagram",
+            title=f"Energy Level Diagram - {potential_type}",
             xaxis=dict(showticklabels=False, showgrid=False),
             yaxis_title="Energy (arbitrary units)",
             plot_bgcolor='rgba(0,0,0,0)',
@@ -1035,7 +1023,8 @@ elif page == "🌊 Wave Mechanics & Foundations":
         with col1:
             st.markdown("#### Simulation Parameters")
             
-            n_particles = st.slider("Number of 'measurements':", 100, 5000, 1000, 100)
+            n_particles = st.select_slider("Number of 'measurements':", SHOT_OPTIONS, value=1000,
+                                           format_func=lambda n: f"{n:,}")
             state = st.selectbox("Quantum State:", ["Ground State", "First Excited", "Superposition"])
         
         with col2:
@@ -1051,12 +1040,8 @@ elif page == "🌊 Wave Mechanics & Foundations":
             psi = psi / np.sqrt(np.sum(psi**2) * (x[1] - x[0]))
             prob_density = np.abs(psi)**2
             
-            # Simulate measurements
-            cumulative_prob = np.cumsum(prob_density)
-            cumulative_prob /= cumulative_prob[-1]
-            
-            random_samples = np.random.rand(n_particles)
-            measured_positions = np.interp(random_samples, cumulative_prob, x)
+            # Simulate measurements: counts per bin straight from the CDF of |ψ|²
+            edges, counts = sample_histogram(x, prob_density, n_particles, bins=50)
             
             # Plot
             fig = make_subplots(rows=2, cols=1, row_heights=[0.6, 0.4],
@@ -1072,12 +1057,10 @@ elif page == "🌊 Wave Mechanics & Foundations":
             ), row=1, col=1)
             
             # Simulated histogram
-            fig.add_trace(go.Histogram(
-                x=measured_positions,
-                nbinsx=50,
+            fig.add_trace(histogram_bar(
+                edges, counts, density=True,
                 name='Measurements',
-                marker=dict(color='#f093fb', opacity=0.7),
-                histnorm='probability density'
+                marker=dict(color='#f093fb', opacity=0.7)
             ), row=2, col=1)
             
             fig.update_layout(
@@ -1091,6 +1074,7 @@ elif page == "🌊 Wave Mechanics & Foundations":
             fig.update_xaxes(title_text="Position", row=2, col=1)
             fig.update_yaxes(title_text="Probability Density", row=1, col=1)
             fig.update_yaxes(title_text="Frequency", row=2, col=1)
+            fig.update_layout(bargap=0)
             
             st.plotly_chart(fig, use_container_width=True)
         
@@ -1119,65 +1103,74 @@ elif page == "🌊 Wave Mechanics & Foundations":
             </div>
         """, unsafe_allow_html=True)
         
-        if st.button("▶️ Run Time Evolution Animation", type="primary"):
-            progress_bar = st.progress(0)
-            chart_placeholder = st.empty()
-            
-            x = np.linspace(-10, 10, 500)
-            k0 = 2.0  # wave vector
-            sigma = 1.0  # width
+        col1, col2 = st.columns([1, 2])
+        
+        with col1:
+            st.markdown("#### Simulation Parameters")
             
-            n_steps = 50
+            evo_potential = st.selectbox(
+                "Potential:",
+                ["Potential Barrier", "Free Particle", "Harmonic Oscillator", "Double Well"],
+                key="evo_potential"
+            )
             
-            for step in range(n_steps):
-                t = step * 0.1
-                progress_bar.progress((step + 1) / n_steps)
-                
-                # Gaussian wavepacket with momentum
-                psi = np.exp(-((x - 2*t)**2)/(2*sigma**2)) * np.exp(1j * k0 * x)
-                prob_density = np.abs(psi)**2
-                real_part = np.real(psi)
-                imag_part = np.imag(psi)
-                
-                fig = go.Figure()
-                
-                fig.add_trace(go.Scatter(
-                    x=x, y=prob_density,
-                    mode='lines',
-                    name='|ψ|²',
-                    line=dict(color='#f093fb', width=3),
-                    fill='tozeroy'
-                ))
-                
-                fig.add_trace(go.Scatter(
-                    x=x, y=real_part,
-                    mode='lines',
-                    name='Re(ψ)',
-                    line=dict(color='#00d4ff', width=2)
-                ))
-                
-                fig.add_trace(go.Scatter(
-                    x=x, y=imag_part,
-                    mode='lines',
-                    name='Im(ψ)',
-                    line=dict(color='#667eea', width=2)
-                ))
-                
-                fig.update_layout(
-                    title=f"Wavepacket Evolution - Time: {t:.2f}",
-                    xaxis_title="Position",
-                    yaxis_title="Amplitude",
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='white'),
-                    height=500,
-                    yaxis=dict(range=[-1, 1])
+            if evo_potential == "Potential Barrier":
+                evo_params = (
+                    ('height', st.slider("Barrier Height V₀:", 1.0, 10.0, 5.0, 0.5, key="evo_barrier_height")),
+                    ('width', st.slider("Barrier Width:", 0.2, 3.0, 1.0, 0.1, key="evo_barrier_width")),
                 )
-                
-                chart_placeholder.plotly_chart(fig, use_container_width=True)
-                time.sleep(0.05)
+                x0_default, k0_default, t_default = -30.0, 3.0, 20.0
+            elif evo_potential == "Harmonic Oscillator":
+                evo_params = (('omega', st.slider("Trap Frequency ω:", 0.2, 2.0, 0.5, 0.1, key="evo_omega")),)
+                x0_default, k0_default, t_default = -10.0, 0.0, 4 * np.pi
+            elif evo_potential == "Double Well":
+                evo_params = (
+                    ('depth', st.slider("Barrier Height:", 0.5, 5.0, 1.0, 0.5, key="evo_dw_depth")),
+                    ('separation', st.slider("Well Separation:", 1.0, 5.0, 2.0, 0.5, key="evo_dw_sep")),
+                )
+                x0_default, k0_default, t_default = -2.0, 0.0, 40.0
+            else:
+                evo_params = ()
+                x0_default, k0_default, t_default = -20.0, 2.0, 20.0
             
-            st.success("✅ Animation complete! The wavepacket moves while maintaining its shape (dispersion is minimal for this case).")
+            k0 = st.slider("Mean Momentum k₀:", 0.0, 6.0, float(k0_default), 0.25, key="evo_k0")
+            sigma = st.slider("Packet Width σ:", 0.3, 5.0, 2.0, 0.1, key="evo_sigma")
+            t_final = st.slider("Total Time:", 1.0, 60.0, float(round(t_default, 1)), 1.0, key="evo_t_final")
+            n_points = st.select_slider("Grid Points:", [1024, 2048, 4096, 8192], value=4096, key="evo_n_points")
+        
+        with col2:
+            # Frames are memoized per parameter set; an absorbing layer at the grid edges
+            # stops outgoing packets from wrapping around the periodic FFT domain
+            dt = 0.01
+            start_time = time.perf_counter()
+            x, V, times, frames, absorbed = propagate_wavepacket(
+                evo_potential, evo_params, n_points, x0_default, k0, sigma, t_final, dt=dt
+            )
+            elapsed = time.perf_counter() - start_time
+            
+            fig = wavepacket_animation(x, V, frames, times,
+                                       title=f"Split-Operator Evolution - {evo_potential}")
+            st.plotly_chart(fig, use_container_width=True)
+            
+            metric_cols = st.columns(3)
+            metric_cols[0].metric("Steps", f"{int(round(times[-1] / dt)):,}")
+            metric_cols[1].metric("Solve Time", f"{elapsed * 1000:.0f} ms")
+            if evo_potential == "Potential Barrier":
+                x_cut = dict(evo_params)['width']
+                transmission = transmission_probability(x, frames[-1], x_cut, absorbed[-1, 1])
+                metric_cols[2].metric("Transmission", f"{transmission:.1%}")
+            else:
+                norm = np.sum(np.abs(frames[-1])**2) * (x[1] - x[0])
+                metric_cols[2].metric("Norm ∫|ψ|²", f"{norm:.6f}",
+                                      help="Probability still on the grid; the rest left through the absorbing edges")
+        
+        st.markdown("""
+            <div class='equation-box'>
+                <b>Split-Operator Propagator (Strang splitting):</b><br><br>
+                ψ(t+Δt) = e<sup>-iVΔt/2</sup> · F⁻¹[ e<sup>-ik²Δt/2</sup> · F[ e<sup>-iVΔt/2</sup> ψ(t) ] ]<br><br>
+                Kinetic phases act diagonally in momentum space via FFT; potential phases act diagonally in position space.
+            </div>
+        """, unsafe_allow_html=True)
     
     with tab5:
         st.markdown("## 🎯 Quantum Tunneling")
@@ -1391,7 +1384,7 @@ elif page == "⚛️ Quantum Computing Lab":
             chart_placeholder = st.empty()
             
             energies = []
-            exact = -1.137
+            exact = ground_energy(H2_HAMILTONIAN)  # H₂ (STO-3G), exact diagonalization
             
             for i in range(50):
                 progress_bar.progress((i + 1) / 50)
@@ -1567,46 +1560,43 @@ elif page == "🔬 QML vs Classical AI":
     
     dataset = st.selectbox("Dataset:", ["Moons", "Circles", "Classification", "Custom"])
     
+    bench_folds = st.slider("Cross-validation folds:", 3, 10, 5)
+    
     if st.button("🏁 Run Benchmark", type="primary"):
-        with st.spinner("Training models..."):
-            # Generate data
+        with st.spinner("Cross-validating models..."):
+            # Generate data ("Custom" falls back to the classification set)
             if dataset == "Moons":
-                X, y = make_moons(n_samples=200, noise=0.15, random_state=42)
+                data = dataset_params('moons', 200, noise=0.15, seed=42)
             elif dataset == "Circles":
-                X, y = make_circles(n_samples=200, noise=0.1, factor=0.5, random_state=42)
+                data = dataset_params('circles', 200, noise=0.1, seed=42)
             else:
-                X, y = make_classification(n_samples=200, n_features=2, n_redundant=0,
-                                          n_informative=2, n_clusters_per_class=1, random_state=42)
+                data = dataset_params('classification', 200, seed=42)
             
-            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
-            
-            # Train classical models
+            # k-fold CV of all models at once on a process pool; reruns with the same settings hit the cache
             models = {
-                "SVM": SVC(kernel='rbf'),
-                "Random Forest": RandomForestClassifier(n_estimators=50),
-                "Neural Network": MLPClassifier(hidden_layer_sizes=(10, 10)),
-                "Quantum Kernel": SVC(kernel='rbf', gamma=5.0),
-                "Quantum VQC": MLPClassifier(hidden_layer_sizes=(8,))
+                "SVM": model_config('svc', kernel='rbf'),
+                "Random Forest": model_config('random_forest', n_estimators=50),
+                "Neural Network": model_config('mlp', hidden_layer_sizes=(10, 10), max_iter=500),
+                "Quantum Kernel": model_config('quantum_kernel', n_qubits=4),
+                "Quantum VQC": model_config('vqc', n_qubits=4, n_layers=3, epochs=30)
             }
             
-            results = {}
-            for name, model in models.items():
-                model.fit(X_train, y_train)
-                acc = accuracy_score(y_test, model.predict(X_test))
-                results[name] = acc
-                time.sleep(0.3)
+            comparison = compare_models(data, models, folds=bench_folds)
         
-        st.success("✅ Benchmark Complete!")
+        st.success(f"✅ Benchmark Complete! ({bench_folds}-fold CV"
+                   f"{', cached' if comparison['cached'].all() else ''})")
         
         # Results visualization
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            df_results = pd.DataFrame(list(results.items()), columns=['Model', 'Accuracy'])
+            df_results = pd.DataFrame({'Model': comparison['model'], 'Accuracy': comparison['mean']})
             df_results['Type'] = ['Classical', 'Classical', 'Classical', 'Quantum', 'Quantum']
             
             fig = px.bar(df_results, x='Model', y='Accuracy', color='Type',
-                        color_discrete_map={'Classical': '#667eea', 'Quantum': '#00d4ff'})
+                        color_discrete_map={'Classical': '#667eea', 'Quantum': '#00d4ff'},
+                        error_y=comparison['ci_high'] - comparison['mean'],
+                        error_y_minus=comparison['mean'] - comparison['ci_low'])
             
             fig.update_layout(
                 title="Model Comparison",
@@ -1617,13 +1607,15 @@ elif page == "🔬 QML vs Classical AI":
         
         with col2:
             st.markdown("### Results Summary")
-            for name, acc in results.items():
+            for name, acc, low, high in zip(comparison['model'], comparison['mean'],
+                                             comparison['ci_low'], comparison['ci_high']):
                 badge_color = '#00d4ff' if 'Quantum' in name else '#667eea'
                 st.markdown(f"""
                     <div style='background: linear-gradient(135deg, {badge_color}33 0%, {badge_color}66 100%);
                          padding: 15px; border-radius: 8px; margin: 10px 0;'>
                         <p style='margin: 0; color: white;'><b>{name}</b></p>
                         <h3 style='margin: 5px 0; color: {badge_color};'>{acc:.1%}</h3>
+                        <p style='margin: 0; color: white; font-size: 12px;'>95% CI {low:.1%} – {high:.1%}</p>
                     </div>
                 """, unsafe_allow_html=True)
 
@@ -1643,6 +1635,16 @@ elif page == "🎯 Advanced Experiments":
     if experiment == "Quantum Teleportation":
         st.markdown("## 🌀 Quantum Teleportation Protocol")
         
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            tele_theta = st.slider("Input θ (degrees)", 0, 180, 60)
+        with col2:
+            tele_phi = st.slider("Input φ (degrees)", 0, 360, 45)
+        with col3:
+            tele_depolarizing = st.slider("Bell-Pair Depolarizing p", 0.0, 0.5, 0.05, 0.01)
+        with col4:
+            tele_damping = st.slider("Bob's Amplitude Damping γ", 0.0, 1.0, 0.0, 0.01)
+        
         if st.button("🚀 Start Teleportation"):
             col1, col2, col3 = st.columns(3)
             
@@ -1673,12 +1675,25 @@ elif page == "🎯 Advanced Experiments":
                     </div>
                 """, unsafe_allow_html=True)
             
-            time.sleep(1)
-            measurement = np.random.choice(['00', '01', '10', '11'])
-            st.info(f"📡 Alice measures: {measurement}")
-            time.sleep(1)
-            st.success("✅ Teleportation Complete! Bob now has the state.")
-            st.balloons()
+            n_runs = 20_000
+            result = teleport(np.full(n_runs, np.radians(tele_theta)), np.full(n_runs, np.radians(tele_phi)),
+                              tele_depolarizing, tele_damping)
+            stats_tele = teleportation_statistics(result)
+            
+            outcome_summary = ", ".join(f"{label}: {count:,}" for label, count in
+                                        zip(stats_tele['labels'], stats_tele['counts']))
+            st.info(f"📡 Alice's Bell measurements over {n_runs:,} runs: {outcome_summary}")
+            
+            st.plotly_chart(fidelity_histogram_figure(result), use_container_width=True)
+            
+            if stats_tele['mean_fidelity'] > CLASSICAL_FIDELITY_LIMIT:
+                st.success(f"✅ Teleportation Complete! Bob's average fidelity is "
+                           f"{stats_tele['mean_fidelity']:.4f} ± {stats_tele['std_error']:.4f} "
+                           f"(classical limit 2/3).")
+                st.balloons()
+            else:
+                st.warning(f"⚠️ Average fidelity {stats_tele['mean_fidelity']:.4f} does not beat the "
+                           f"classical limit of 2/3.")
     
     elif experiment == "Bell State Entanglement":
         st.markdown("## 🔗 Bell State Entanglement")
@@ -1791,20 +1806,27 @@ elif page == "🌌 3D Quantum Visualizations":
         st.plotly_chart(fig, use_container_width=True)
     
     elif viz_type == "Probability Cloud":
-        n_points = st.slider("Sample Points:", 1000, 10000, 5000, 1000)
-        
-        # Generate quantum probability cloud
-        r = np.random.exponential(2, n_points)
-        theta = np.random.uniform(0, 2*np.pi, n_points)
-        phi = np.arccos(2*np.random.uniform(0, 1, n_points) - 1)
+        n_points = st.select_slider("Sample Points:", SHOT_OPTIONS[1:], value=10_000,
+                                    format_func=lambda n: f"{n:,}")
+        
+        # Isotropic cloud with exponential radial law (mean radius 2), binned into voxels:
+        # density of r ~ Exp(2) spread over spheres of area 4πr²
+        centres, voxel_p = voxel_probabilities(
+            lambda x, y, z: np.exp(-np.sqrt(x**2 + y**2 + z**2) / 2) / (x**2 + y**2 + z**2),
+            n_grid=20, extent=10.0
+        )
+        counts = sample_counts(voxel_p.ravel(), n_points).reshape(voxel_p.shape)
         
-        x = r * np.sin(phi) * np.cos(theta)
-        y = r * np.sin(phi) * np.sin(theta)
-        z = r * np.cos(phi)
+        occupied = np.nonzero(counts)
+        x, y, z = centres[occupied[0]], centres[occupied[1]], centres[occupied[2]]
+        r = np.sqrt(x**2 + y**2 + z**2)
+        hits = counts[occupied]
         
         fig = go.Figure(data=[go.Scatter3d(
             x=x, y=y, z=z, mode='markers',
-            marker=dict(size=2, color=r, colorscale='Plasma', opacity=0.6)
+            marker=dict(size=2 + 6 * (hits / hits.max())**(1/3), color=r, colorscale='Plasma', opacity=0.6),
+            customdata=hits,
+            hovertemplate='%{customdata:,} detections<extra></extra>'
         )])
         
         fig.update_layout(
@@ -9,6 +9,8 @@ import json
 import os
 from datetime import datetime
 
+from quantum_ml import train_vqc
+
 # Page configuration - AlphaNova Quantum
 st.set_page_config(
     page_title="AlphaNova Quantum | Next-Generation Quantum Research Platform",
@@ -476,14 +478,20 @@ elif st.session_state.current_page == 'quantum_ml':
         
         if st.button("Train VQC"):
             with st.spinner("Training quantum classifier..."):
-                # Simulate training progress
+                # Minibatch Adam with parameter-shift gradients; features scaled to [-1, 1] for angle encoding
                 progress_bar = st.progress(0)
-                for epoch in range(epochs):
+                X_scaled = X / np.abs(X).max(axis=0)
+                
+                def report_epoch(epoch, history):
                     progress_bar.progress((epoch + 1) / epochs)
                     if epoch % 10 == 0:
-                        st.write(f"Epoch {epoch}: Loss = {0.5 - epoch*0.01:.3f}")
+                        st.write(f"Epoch {epoch}: Loss = {history['loss'][-1]:.3f}, "
+                                 f"Accuracy = {history['train_accuracy'][-1]:.1%}")
+                
+                history = train_vqc(X_scaled, y, n_qubits=n_qubits, n_layers=n_layers, epochs=epochs,
+                                    learning_rate=learning_rate, callback=report_epoch)
                 
-                st.success("Training completed!")
+                st.success(f"Training completed! Training accuracy: {history['train_accuracy'][-1]:.1%}")
 
 elif st.session_state.current_page == 'analytics':
     st.markdown("# 📊 Research Analytics")
@@ -0,0 +1,190 @@
+"""
+Teleportation Simulator
+Three-qubit teleportation circuit with mid-circuit Bell measurement and
+classically controlled corrections, sampled shot-by-shot in one batch.
+
+Each shot is a pure-state trajectory: noise channels are unravelled into
+randomly chosen Kraus branches and the Bell measurement collapses every shot
+onto its own sampled outcome, so the spread of per-shot fidelities is the
+physical fidelity distribution. Qubit 0 holds |ψ⟩, qubit 1 is Alice's half of
+the Bell pair and qubit 2 is Bob's.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+from sampling import sample_each, sample_shots
+
+
+H_GATE = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+X_GATE = np.array([[0, 1], [1, 0]], dtype=complex)
+Y_GATE = np.array([[0, -1j], [1j, 0]], dtype=complex)
+Z_GATE = np.array([[1, 0], [0, -1]], dtype=complex)
+I_GATE = np.eye(2, dtype=complex)
+
+CLASSICAL_FIDELITY_LIMIT = 2 / 3  # best average fidelity of measure-and-prepare without entanglement
+
+
+# ============================================================================
+# BATCHED STATE OPERATIONS
+# ============================================================================
+
+def apply_single(state, gate, qubit):
+    """Apply a 2×2 gate, or a (shots, 2, 2) stack of per-shot gates, to one qubit of (shots, 2, 2, 2)."""
+    moved = np.moveaxis(state, qubit + 1, -1)[..., None]
+    if gate.ndim == 3:
+        gate = gate.reshape(len(gate), 1, 1, 2, 2)
+    return np.moveaxis((gate @ moved)[..., 0], -1, qubit + 1)
+
+
+def apply_cnot(state, control, target):
+    """CNOT on (shots, 2, 2, 2): flip the target axis wherever the control qubit is 1."""
+    out = state.copy()
+    index = [slice(None)] * 4
+    index[control + 1] = 1
+    out[tuple(index)] = np.flip(state[tuple(index)], axis=target + 1 if target < control else target)
+    return out
+
+
+def input_states(theta, phi):
+    """cos(θ/2)|0⟩ + e^{iφ} sin(θ/2)|1⟩ for arrays of Bloch angles: (shots, 2)."""
+    return np.stack([np.cos(theta / 2), np.exp(1j * phi) * np.sin(theta / 2)], axis=-1)
+
+
+def random_bloch_angles(shots, rng):
+    """Uniformly distributed points on the Bloch sphere (Haar-random pure qubit states)."""
+    theta = np.arccos(1 - 2 * rng.random(shots))
+    phi = 2 * np.pi * rng.random(shots)
+    return theta, phi
+
+
+# ============================================================================
+# NOISE CHANNELS (TRAJECTORY UNRAVELLING)
+# ============================================================================
+
+def depolarize(state, qubit, p, rng):
+    """Depolarizing channel: with probability p apply X, Y or Z (chosen uniformly) to each shot."""
+    if p <= 0:
+        return state
+    paulis = np.stack([I_GATE, X_GATE, Y_GATE, Z_GATE])
+    choice = sample_shots([1 - p, p / 3, p / 3, p / 3], len(state), rng)
+    return apply_single(state, paulis[choice], qubit)
+
+
+def amplitude_damp(qubits, gamma, rng):
+    """Amplitude damping |1⟩ → |0⟩ with probability γ on (shots, 2) single-qubit states, branch chosen per shot."""
+    if gamma <= 0:
+        return qubits
+    p_jump = gamma * np.abs(qubits[:, 1])**2
+    jumped = rng.random(len(qubits)) < p_jump
+    no_jump = qubits * np.array([1, np.sqrt(1 - gamma)])
+    no_jump /= np.linalg.norm(no_jump, axis=1, keepdims=True)
+    decayed = np.zeros_like(qubits)
+    decayed[:, 0] = 1
+    return np.where(jumped[:, None], decayed, no_jump)
+
+
+# ============================================================================
+# PROTOCOL
+# ============================================================================
+
+def teleport(theta, phi, depolarizing=0.0, damping=0.0, readout_error=0.0, seed=None):
+    """Run one teleportation shot per entry of theta/phi.
+
+    Noise: depolarizing on both halves of the Bell pair, amplitude damping on
+    Bob's qubit while the classical bits are in flight, and a flip probability
+    on each of Alice's measured bits. Returns a dict of per-shot arrays.
+    """
+    rng = np.random.default_rng(seed)
+    theta, phi = np.broadcast_arrays(np.asarray(theta, dtype=float), np.asarray(phi, dtype=float))
+    shots = theta.size
+    psi_in = input_states(theta.ravel(), phi.ravel())
+
+    # |ψ⟩ ⊗ |00⟩, then the Bell pair (|00⟩ + |11⟩)/√2 on qubits 1, 2
+    state = np.zeros((shots, 2, 2, 2), dtype=complex)
+    state[:, :, 0, 0] = psi_in
+    state = apply_cnot(apply_single(state, H_GATE, 1), 1, 2)
+    state = depolarize(state, 1, depolarizing, rng)
+    state = depolarize(state, 2, depolarizing, rng)
+
+    # Alice's Bell-basis measurement: CNOT(0 → 1), H on 0, then measure qubits 0 and 1
+    state = apply_single(apply_cnot(state, 0, 1), H_GATE, 0)
+    branch_probs = np.sum(np.abs(state)**2, axis=3).reshape(shots, 4)
+    outcome = sample_each(branch_probs, rng)
+    m0, m1 = outcome >> 1, outcome & 1
+
+    # Collapse: Bob's conditional qubit state for each shot's outcome
+    bob = state[np.arange(shots), m0, m1]
+    bob /= np.linalg.norm(bob, axis=1, keepdims=True)
+    bob = amplitude_damp(bob, damping, rng)
+
+    # Classical channel with readout errors, then Bob's controlled X^{m1} Z^{m0}
+    flips = rng.random((2, shots)) < readout_error
+    c0, c1 = m0 ^ flips[0], m1 ^ flips[1]
+    uncorrected = bob.copy()
+    bob = np.where(c1[:, None], bob[:, ::-1], bob)
+    bob = np.where(c0[:, None], bob * np.array([1, -1]), bob)
+
+    return {
+        'outcomes': outcome,
+        'received_bits': (c0 << 1) | c1,
+        'fidelity': np.abs(np.sum(psi_in.conj() * bob, axis=1))**2,
+        'uncorrected_fidelity': np.abs(np.sum(psi_in.conj() * uncorrected, axis=1))**2,
+        'theta': theta.ravel(),
+        'phi': phi.ravel(),
+    }
+
+
+def teleportation_statistics(result):
+    """Outcome counts and mean fidelities per Bell-measurement outcome."""
+    labels = ['00', '01', '10', '11']
+    counts = np.bincount(result['outcomes'], minlength=4)
+    per_outcome = [
+        float(result['fidelity'][result['outcomes'] == k].mean()) if counts[k] else np.nan
+        for k in range(4)
+    ]
+    per_outcome_uncorrected = [
+        float(result['uncorrected_fidelity'][result['outcomes'] == k].mean()) if counts[k] else np.nan
+        for k in range(4)
+    ]
+    return {
+        'labels': labels,
+        'counts': counts,
+        'mean_fidelity': float(result['fidelity'].mean()),
+        'std_error': float(result['fidelity'].std() / np.sqrt(len(result['fidelity']))),
+        'fidelity_per_outcome': per_outcome,
+        'uncorrected_per_outcome': per_outcome_uncorrected,
+    }
+
+
+# ============================================================================
+# FIGURES
+# ============================================================================
+
+def fidelity_histogram_figure(result, title="Teleportation Fidelity Distribution"):
+    """Histogram of per-shot fidelities with the mean and the classical 2/3 limit marked."""
+    counts, edges = np.histogram(result['fidelity'], bins=50, range=(0, 1))
+    centers = (edges[:-1] + edges[1:]) / 2
+    mean_fidelity = float(result['fidelity'].mean())
+
+    fig = go.Figure(go.Bar(
+        x=centers, y=counts / counts.sum(), width=edges[1] - edges[0],
+        marker=dict(color='#00d4ff', line=dict(color='white', width=0.5)),
+        name='Shots',
+        hovertemplate='F ≈ %{x:.2f}<br>Fraction: %{y:.3f}<extra></extra>'
+    ))
+    fig.add_vline(x=mean_fidelity, line=dict(color='#38ef7d', width=3),
+                  annotation_text=f"mean {mean_fidelity:.4f}", annotation_position="top left")
+    fig.add_vline(x=CLASSICAL_FIDELITY_LIMIT, line=dict(color='#f5576c', width=2, dash='dash'),
+                  annotation_text="classical 2/3", annotation_position="bottom right")
+    fig.update_layout(
+        title=title,
+        xaxis_title="Fidelity |⟨ψ_in|ψ_Bob⟩|²",
+        yaxis_title="Fraction of Shots",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        bargap=0,
+        height=420
+    )
+    return fig
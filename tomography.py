@@ -0,0 +1,181 @@
+"""
+Quantum State Tomography Engine
+Simulated Pauli-basis measurements on 1–4 qubits and density-matrix
+reconstruction by linear inversion and by the iterative RρR maximum-likelihood
+method. All 3^n measurement bases are held as one stacked array of projector
+vectors, so sampling and each MLE iteration are single vectorized operations.
+"""
+
+from functools import lru_cache, reduce
+from itertools import product
+
+import numpy as np
+
+from sampling import sample_counts
+
+
+BASIS_LABELS = "XYZ"
+
+# Rows are the eigenvectors (outcome 0 = +1 eigenvalue, outcome 1 = −1) of each Pauli operator
+_BASIS_ROTATIONS = {
+    "X": np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2),
+    "Y": np.array([[1, -1j], [1, 1j]], dtype=complex) / np.sqrt(2),
+    "Z": np.eye(2, dtype=complex),
+}
+
+
+# ============================================================================
+# MEASUREMENT SETTINGS
+# ============================================================================
+
+@lru_cache(maxsize=8)
+def pauli_bases(n_qubits):
+    """All 3^n Pauli measurement settings as (labels, (3^n, 2^n, 2^n) rotations).
+
+    Row o of rotation b is ⟨φ_bo|, the bra of the projector for outcome bitstring o.
+    """
+    labels = [''.join(p) for p in product(BASIS_LABELS, repeat=n_qubits)]
+    rotations = np.array([reduce(np.kron, [_BASIS_ROTATIONS[c] for c in label]) for label in labels])
+    rotations.flags.writeable = False
+    return labels, rotations
+
+
+@lru_cache(maxsize=8)
+def _inversion_matrix(n_qubits):
+    """Pseudo-inverse mapping stacked outcome frequencies to vec(ρ)."""
+    _, rotations = pauli_bases(n_qubits)
+    d = 2**n_qubits
+    bras = rotations.reshape(-1, d)
+    # p_bo = Σ_ij ⟨φ|_i ρ_ij |φ⟩_j, i.e. one row bra_i · conj(bra_j) per outcome
+    frame = (bras[:, :, None] * bras.conj()[:, None, :]).reshape(-1, d * d)
+    inverse = np.linalg.pinv(frame)
+    inverse.flags.writeable = False
+    return inverse
+
+
+def outcome_probabilities(rho, n_qubits):
+    """Born probabilities (3^n, 2^n) of every outcome in every Pauli basis."""
+    _, rotations = pauli_bases(n_qubits)
+    p = np.einsum('boi,ij,boj->bo', rotations, rho, rotations.conj()).real
+    return np.clip(p, 0.0, None)
+
+
+# ============================================================================
+# MEASUREMENT SIMULATION
+# ============================================================================
+
+def simulate_counts(rho, shots, seed=None):
+    """Outcome counts (3^n, 2^n) with shots per basis, drawn as one multinomial call over all bases."""
+    n_qubits = int(np.log2(rho.shape[0]))
+    return sample_counts(outcome_probabilities(rho, n_qubits), shots, seed)
+
+
+# ============================================================================
+# RECONSTRUCTION
+# ============================================================================
+
+def linear_inversion(counts):
+    """Least-squares density matrix from outcome frequencies (Hermitian, unit trace, possibly unphysical)."""
+    n_bases, d = counts.shape
+    n_qubits = int(np.log2(d))
+    freqs = counts / counts.sum(axis=1, keepdims=True)
+    rho = (_inversion_matrix(n_qubits) @ freqs.ravel()).reshape(d, d)
+    rho = (rho + rho.conj().T) / 2
+    return rho / np.trace(rho).real
+
+
+def project_to_physical(rho):
+    """Closest density matrix (positive, unit trace) to a Hermitian matrix, by clipping its spectrum."""
+    eigenvalues, vectors = np.linalg.eigh(rho)
+    eigenvalues = np.clip(eigenvalues, 0.0, None)
+    eigenvalues /= eigenvalues.sum()
+    return (vectors * eigenvalues) @ vectors.conj().T
+
+
+def mle_rrr(counts, max_iter=1000, tol=1e-4, rho0=None):
+    """Maximum-likelihood state via the RρR iteration ρ ← RρR / Tr(RρR), R = Σ (f/p) Π.
+
+    Iterates until the log-likelihood improves by less than tol (far below the
+    statistical resolution of the data). Returns (ρ, iterations, log-likelihood).
+    """
+    n_bases, d = counts.shape
+    n_qubits = int(np.log2(d))
+    _, rotations = pauli_bases(n_qubits)
+    bras = rotations.reshape(-1, d)
+    kets = bras.conj()  # |φ_bo⟩ as rows
+    counts = counts.ravel()
+    freqs = counts / counts.sum() * n_bases
+    observed = counts > 0
+
+    rho = np.eye(d, dtype=complex) / d if rho0 is None else rho0
+    previous = -np.inf
+    for iteration in range(1, max_iter + 1):
+        p = np.maximum(np.sum((bras @ rho) * kets, axis=1).real, 1e-15)
+        log_likelihood = float(np.sum(counts[observed] * np.log(p[observed])))
+        if log_likelihood - previous < tol:
+            break
+        previous = log_likelihood
+        R = (kets.T * np.where(observed, freqs / p, 0.0)) @ bras
+        rho = R @ rho @ R
+        rho = (rho + rho.conj().T) / (2 * np.trace(rho).real)
+
+    return rho, iteration, log_likelihood
+
+
+# ============================================================================
+# FIGURES OF MERIT
+# ============================================================================
+
+def state_fidelity(rho, sigma):
+    """Uhlmann fidelity (Tr √(√ρ σ √ρ))²."""
+    eigenvalues, vectors = np.linalg.eigh(rho)
+    sqrt_rho = (vectors * np.sqrt(np.clip(eigenvalues, 0.0, None))) @ vectors.conj().T
+    inner = np.linalg.eigvalsh(sqrt_rho @ sigma @ sqrt_rho)
+    return float(np.sum(np.sqrt(np.clip(inner, 0.0, None)))**2)
+
+
+def min_eigenvalue(rho):
+    """Smallest eigenvalue; negative values flag an unphysical reconstruction."""
+    return float(np.linalg.eigvalsh(rho)[0])
+
+
+def fidelity_vs_shots(rho, shot_counts, repetitions=5, seed=None):
+    """Mean fidelity of linear-inversion (projected) and MLE reconstructions for each shot count.
+
+    Returns (linear (len, repetitions), mle (len, repetitions)) fidelity arrays.
+    """
+    rng = np.random.default_rng(seed)
+    linear = np.empty((len(shot_counts), repetitions))
+    mle = np.empty((len(shot_counts), repetitions))
+    for i, shots in enumerate(shot_counts):
+        for r in range(repetitions):
+            counts = simulate_counts(rho, shots, seed=rng)
+            rho_linear = project_to_physical(linear_inversion(counts))
+            linear[i, r] = state_fidelity(rho, rho_linear)
+            # Warm start from the projected linear estimate, mixed slightly so no outcome has p = 0
+            start = 0.9 * rho_linear + 0.1 * np.eye(len(rho)) / len(rho)
+            mle[i, r] = state_fidelity(rho, mle_rrr(counts, max_iter=300, rho0=start)[0])
+    return linear, mle
+
+
+# ============================================================================
+# TARGET STATES
+# ============================================================================
+
+def tomography_target(kind, n_qubits, noise=0.0, seed=None):
+    """Named n-qubit test state mixed with depolarizing noise: (1 − noise)|ψ⟩⟨ψ| + noise·I/d."""
+    d = 2**n_qubits
+    psi = np.zeros(d, dtype=complex)
+    if kind == "GHZ":
+        psi[0] = psi[-1] = 1
+    elif kind == "W":
+        psi[[1 << q for q in range(n_qubits)]] = 1
+    elif kind == "Product |+⟩":
+        psi[:] = 1
+    elif kind == "Haar Random":
+        rng = np.random.default_rng(seed)
+        psi = rng.standard_normal(d) + 1j * rng.standard_normal(d)
+    else:
+        raise ValueError(f"Unknown tomography target: {kind}")
+    psi /= np.linalg.norm(psi)
+    return (1 - noise) * np.outer(psi, psi.conj()) + noise * np.eye(d) / d
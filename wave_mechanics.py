@@ -0,0 +1,261 @@
+"""
+Wave Mechanics Engine
+Numerical solvers for the one-dimensional Schrödinger equation (ℏ = m = 1)
+used by the Schrödinger platform pages.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+from scipy import sparse
+from scipy.linalg import eigh_tridiagonal
+from scipy.sparse.linalg import eigsh
+
+
+# ============================================================================
+# POTENTIALS & INITIAL STATES
+# ============================================================================
+
+def make_potential(kind, x, params=()):
+    """Evaluate a named potential V(x) on grid x; params is a tuple of (name, value) pairs."""
+    p = dict(params)
+    if kind == "Free Particle":
+        return np.zeros_like(x)
+    elif kind == "Infinite Square Well":
+        width = p.get('width', 5.0)
+        wall = p.get('wall', 1e4)
+        return np.where(np.abs(x) <= width / 2, 0.0, wall)
+    elif kind == "Finite Square Well":
+        width = p.get('width', 4.0)
+        depth = p.get('depth', 3.0)
+        return np.where(np.abs(x) <= width / 2, 0.0, depth)
+    elif kind == "Potential Barrier":
+        height = p.get('height', 5.0)
+        width = p.get('width', 1.0)
+        return np.where((x >= 0) & (x <= width), height, 0.0)
+    elif kind == "Harmonic Oscillator":
+        omega = p.get('omega', 1.0)
+        return 0.5 * omega**2 * x**2
+    elif kind == "Double Well":
+        depth = p.get('depth', 1.0)
+        separation = p.get('separation', 2.0)
+        return depth * ((x / separation)**2 - 1)**2
+    raise ValueError(f"Unknown potential type: {kind}")
+
+
+def gaussian_wavepacket(x, x0=0.0, k0=0.0, sigma=1.0):
+    """Normalized Gaussian wavepacket centred at x0 with mean momentum k0."""
+    psi = np.exp(-((x - x0)**2) / (4 * sigma**2) + 1j * k0 * x)
+    return psi / np.sqrt(np.sum(np.abs(psi)**2) * (x[1] - x[0]))
+
+
+# ============================================================================
+# SPLIT-OPERATOR FFT PROPAGATOR
+# ============================================================================
+
+ABSORBER_WIDTH = 20.0
+ABSORBER_STRENGTH = 5.0
+
+
+def absorbing_potential(x, width=ABSORBER_WIDTH, strength=ABSORBER_STRENGTH):
+    """Quadratic complex absorbing potential W(x) ≥ 0 on the outer `width` of each grid edge (enters as V − iW)."""
+    if width <= 0:
+        return np.zeros_like(x)
+    depth = np.clip((np.abs(x) - (np.max(np.abs(x)) - width)) / width, 0.0, None)
+    return strength * depth**2
+
+
+@lru_cache(maxsize=32)
+def split_operator_phases(n_points, x_min, x_max, potential_kind, potential_params, dt,
+                          absorber_width=ABSORBER_WIDTH):
+    """Precompute grid, potential and Strang-splitting phase factors for one (grid, V, dt).
+
+    The FFT grid is periodic, so an absorbing layer of absorber_width at each edge
+    (absorber_width=0 disables it) removes outgoing amplitude instead of letting
+    it wrap around to the other side.
+    """
+    x = np.linspace(x_min, x_max, n_points, endpoint=False)
+    dx = x[1] - x[0]
+    k = 2 * np.pi * np.fft.fftfreq(n_points, d=dx)
+    V = make_potential(potential_kind, x, potential_params)
+
+    half_potential = np.exp((-0.5j * V - 0.5 * absorbing_potential(x, absorber_width)) * dt)
+    kinetic = np.exp(-0.5j * k**2 * dt)
+
+    for arr in (x, V, half_potential, kinetic):
+        arr.flags.writeable = False
+    return x, V, half_potential, kinetic
+
+
+def evolve_wavepacket(psi0, half_potential, kinetic, n_frames, steps_per_frame):
+    """Propagate psi0 with e^{-iVdt/2} e^{-iTdt} e^{-iVdt/2}.
+
+    Returns (frames, absorbed): (n_frames + 1, N) snapshots and the (n_frames + 1, 2)
+    cumulative probability removed by the absorbing layer at the left and right edge.
+    """
+    frames = np.empty((n_frames + 1, psi0.size), dtype=complex)
+    frames[0] = psi0
+    absorbed = np.zeros((n_frames + 1, 2))
+    full_potential = half_potential**2
+
+    # Only the absorbing layer loses norm; book its loss per edge as a fraction of ∫|ψ0|²
+    lossy = np.flatnonzero(np.abs(half_potential) < 1)
+    right_edge = (lossy >= psi0.size // 2).astype(int)
+    norm0 = np.sum(np.abs(psi0)**2)
+    removed = np.zeros(2)
+
+    def apply_potential(psi, phase):
+        if lossy.size:
+            loss = np.abs(psi[lossy])**2 * (1 - np.abs(phase[lossy])**2)
+            removed[:] += np.bincount(right_edge, loss, minlength=2) / norm0
+        return psi * phase
+
+    psi = apply_potential(psi0, half_potential)
+    for frame in range(1, n_frames + 1):
+        for _ in range(steps_per_frame - 1):
+            psi = np.fft.ifft(np.fft.fft(psi) * kinetic)
+            psi = apply_potential(psi, full_potential)
+        psi = np.fft.ifft(np.fft.fft(psi) * kinetic)
+        # Close the half step for the snapshot, then reopen it for the next frame
+        frames[frame] = apply_potential(psi, half_potential)
+        absorbed[frame] = removed
+        psi = apply_potential(frames[frame], half_potential)
+
+    return frames, absorbed
+
+
+@lru_cache(maxsize=8)
+def propagate_wavepacket(potential_kind, potential_params, n_points, x0, k0, sigma, t_final,
+                         n_frames=100, dt=0.01, x_min=-100.0, x_max=100.0):
+    """Gaussian wavepacket evolution memoized per parameter set, so widget reruns reuse the frames.
+
+    Returns (x, V, times, frames, absorbed); see evolve_wavepacket.
+    """
+    steps_per_frame = max(1, int(round(t_final / (n_frames * dt))))
+    x, V, half_potential, kinetic = split_operator_phases(
+        n_points, x_min, x_max, potential_kind, potential_params, dt
+    )
+    psi0 = gaussian_wavepacket(x, x0, k0, sigma)
+    frames, absorbed = evolve_wavepacket(psi0, half_potential, kinetic, n_frames, steps_per_frame)
+    times = np.arange(n_frames + 1) * steps_per_frame * dt
+
+    for arr in (times, frames, absorbed):
+        arr.flags.writeable = False
+    return x, V, times, frames, absorbed
+
+
+def transmission_probability(x, psi, x_cut, absorbed_right=0.0):
+    """Probability mass to the right of x_cut, plus any already absorbed at the right edge."""
+    dx = x[1] - x[0]
+    return float(np.sum(np.abs(psi[x > x_cut])**2) * dx) + absorbed_right
+
+
+def wavepacket_animation(x, V, frames, times, max_points=1024, title="Wavepacket Evolution"):
+    """Build a Plotly frames animation of |ψ|², Re(ψ) and scaled V(x), decimated for display."""
+    stride = max(1, len(x) // max_points)
+    xs = x[::stride]
+    density = np.abs(frames[:, ::stride])**2
+    real_part = np.real(frames[:, ::stride])
+
+    y_max = max(float(np.max(density)), float(np.max(np.abs(real_part)))) * 1.1
+    V_display = V[::stride]
+    if np.max(np.abs(V_display)) > 0:
+        V_display = V_display / np.max(np.abs(V_display)) * y_max * 0.8
+
+    def frame_traces(i):
+        return [
+            go.Scatter(x=xs, y=density[i], mode='lines', name='|ψ|²',
+                       line=dict(color='#f093fb', width=3), fill='tozeroy'),
+            go.Scatter(x=xs, y=real_part[i], mode='lines', name='Re(ψ)',
+                       line=dict(color='#00d4ff', width=1.5)),
+        ]
+
+    fig = go.Figure(
+        data=frame_traces(0) + [
+            go.Scatter(x=xs, y=V_display, mode='lines', name='V(x) [Scaled]',
+                       line=dict(color='#fee140', width=2, dash='dash'))
+        ],
+        frames=[
+            go.Frame(data=frame_traces(i), traces=[0, 1], name=str(i))
+            for i in range(len(times))
+        ]
+    )
+
+    fig.update_layout(
+        title=title,
+        xaxis_title="Position",
+        yaxis_title="Amplitude",
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='white'),
+        height=500,
+        yaxis=dict(range=[-y_max, y_max]),
+        updatemenus=[dict(
+            type='buttons',
+            showactive=False,
+            x=0.0, y=1.15, xanchor='left',
+            buttons=[
+                dict(label='▶ Play', method='animate',
+                     args=[None, dict(frame=dict(duration=40, redraw=False),
+                                      transition=dict(duration=0), fromcurrent=True)]),
+                dict(label='⏸ Pause', method='animate',
+                     args=[[None], dict(frame=dict(duration=0, redraw=False),
+                                        mode='immediate', transition=dict(duration=0))])
+            ]
+        )],
+        sliders=[dict(
+            currentvalue=dict(prefix='t = ', font=dict(color='white')),
+            pad=dict(t=40),
+            steps=[
+                dict(method='animate', label=f"{t:.2f}",
+                     args=[[str(i)], dict(mode='immediate', frame=dict(duration=0, redraw=False),
+                                              transition=dict(duration=0))])
+                for i, t in enumerate(times)
+            ]
+        )]
+    )
+
+    return fig
+
+
+# ============================================================================
+# FINITE-DIFFERENCE EIGENSOLVER
+# ============================================================================
+
+def finite_difference_hamiltonian(x, V):
+    """Three-point finite-difference H = -½ d²/dx² + V(x) as a sparse CSR matrix (Dirichlet ends)."""
+    dx = x[1] - x[0]
+    off_diagonal = np.full(len(x) - 1, -0.5 / dx**2)
+    return sparse.diags([off_diagonal, 1.0 / dx**2 + V, off_diagonal], [-1, 0, 1], format='csr')
+
+
+@lru_cache(maxsize=64)
+def solve_eigenstates(potential_kind, potential_params, n_points, n_states,
+                      x_min=-5.0, x_max=5.0, method='tridiagonal'):
+    """Lowest n_states energies and normalized eigenfunctions, memoized per (potential, params, grid)."""
+    x = np.linspace(x_min, x_max, n_points)
+    dx = x[1] - x[0]
+    V = make_potential(potential_kind, x, potential_params)
+
+    if method == 'tridiagonal':
+        energies, vectors = eigh_tridiagonal(
+            1.0 / dx**2 + V, np.full(n_points - 1, -0.5 / dx**2),
+            select='i', select_range=(0, n_states - 1)
+        )
+    elif method == 'sparse':
+        H = finite_difference_hamiltonian(x, V)
+        energies, vectors = eigsh(H, k=n_states, sigma=float(V.min()) - 1.0, which='LM')
+        order = np.argsort(energies)
+        energies, vectors = energies[order], vectors[:, order]
+    else:
+        raise ValueError(f"Unknown eigensolver method: {method}")
+
+    psi = vectors.T / np.sqrt(dx)
+    # Fix the arbitrary eigenvector sign so the first significant lobe is positive
+    first_lobe = np.argmax(np.abs(psi) > 0.1 * np.abs(psi).max(axis=1, keepdims=True), axis=1)
+    psi *= np.sign(psi[np.arange(n_states), first_lobe])[:, None]
+
+    for arr in (x, V, energies, psi):
+        arr.flags.writeable = False
+    return x, V, energies, psi